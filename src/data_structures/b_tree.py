@@ -0,0 +1,376 @@
+import bisect
+
+
+class BTreeLeaf:
+
+    def __init__(self, keys, values):
+        self.keys = keys
+        self.values = values
+        self.prev = None
+        self.next = None
+
+
+class BTreeInternalNode:
+
+    def __init__(self, keys, children):
+        self.keys = keys
+        self.children = children
+
+
+class BTree:
+    """
+        B+ Tree class keeping up to fanout keys per node in contiguous lists, searched with bisect.
+        Values live only in the leaves, which are linked to each other for sorted iteration.
+        Each internal node key is the smallest key reachable through the child on its right.
+    """
+
+    def __init__(self, fanout=64):
+        if fanout < 4:
+            raise ValueError("Invalid fanout!")
+
+        self.__fanout = fanout
+        self.__min_size = fanout // 2
+        self.__root = BTreeLeaf([], [])
+        self.__tree_length = 0
+
+    def is_empty(self):
+        """
+            Verifies if the Tree is empty
+        :return: emptiness status
+        """
+        if self.__tree_length == 0:
+            return True
+
+        return False
+
+    def fanout(self):
+        """
+            Max amount of keys held by a leaf (and of children held by an internal node)
+        :return: node fanout
+        """
+        return self.__fanout
+
+    def get_height(self):
+        """
+            Get the amount of levels from the Tree
+        :return: tree height
+        """
+        if self.is_empty():
+            return 0
+
+        height = 1
+        node = self.__root
+        while isinstance(node, BTreeInternalNode):
+            node = node.children[0]
+            height += 1
+
+        return height
+
+    def __find_leaf(self, key):
+        """
+            Descend from the root to the leaf where the key is (or would be) placed
+        :param key: searched key
+        :return: leaf and the path of (internal node, child position) pairs leading to it
+        """
+        path = []
+        node = self.__root
+        try:
+            while isinstance(node, BTreeInternalNode):
+                child_position = bisect.bisect_right(node.keys, key)
+                path.append((node, child_position))
+                node = node.children[child_position]
+        except TypeError:
+            raise IndexError("Invalid key type! It must be comparable to the Tree keys.")
+
+        return node, path
+
+    def __find_key(self, key):
+        """
+            Search the leaf holding the key
+        :param key: searched key
+        :return: leaf, position of the key inside the leaf (None if missing) and the path to the leaf
+        """
+        leaf, path = self.__find_leaf(key)
+        try:
+            key_position = bisect.bisect_left(leaf.keys, key)
+            if key_position < len(leaf.keys) and leaf.keys[key_position] == key:
+                return leaf, key_position, path
+        except TypeError:
+            raise IndexError("Invalid key type! It must be comparable to the Tree keys.")
+
+        return leaf, None, path
+
+    def __split_leaf(self, leaf):
+        """
+            Move the upper half of a full leaf to a new leaf linked after it
+        :param leaf: leaf to be split
+        :return: separator key, new leaf
+        """
+        half = len(leaf.keys) // 2
+        new_leaf = BTreeLeaf(leaf.keys[half:], leaf.values[half:])
+        del leaf.keys[half:]
+        del leaf.values[half:]
+
+        new_leaf.prev = leaf
+        new_leaf.next = leaf.next
+        if leaf.next is not None:
+            leaf.next.prev = new_leaf
+        leaf.next = new_leaf
+
+        return new_leaf.keys[0], new_leaf
+
+    @staticmethod
+    def __split_internal_node(node):
+        """
+            Move the upper half of a full internal node to a new node, pushing the middle key up
+        :param node: internal node to be split
+        :return: separator key, new internal node
+        """
+        half = len(node.keys) // 2
+        separator = node.keys[half]
+        new_node = BTreeInternalNode(node.keys[half + 1:], node.children[half + 1:])
+        del node.keys[half:]
+        del node.children[half + 1:]
+
+        return separator, new_node
+
+    def insert_node(self, new_key, new_key_data = None):
+        """
+            Inserts a new element to the Tree
+        :param new_key: key from the new element
+        :param new_key_data: value from the new element
+        :return: None
+        """
+        if isinstance(new_key, list):
+            raise IndexError("Key must not be a List!")
+        elif isinstance(new_key, dict):
+            raise IndexError("Key must not be a Dict!")
+
+        leaf, key_position, path = self.__find_key(new_key)
+        if key_position is not None:
+            raise IndexError("Key already exists!")
+
+        key_position = bisect.bisect_left(leaf.keys, new_key)
+        leaf.keys.insert(key_position, new_key)
+        leaf.values.insert(key_position, new_key_data)
+        self.__tree_length += 1
+
+        if len(leaf.keys) <= self.__fanout:
+            return
+
+        separator, new_node = self.__split_leaf(leaf)
+        while path:
+            parent_node, child_position = path.pop()
+            parent_node.keys.insert(child_position, separator)
+            parent_node.children.insert(child_position + 1, new_node)
+            if len(parent_node.children) <= self.__fanout:
+                return
+            separator, new_node = self.__split_internal_node(parent_node)
+
+        self.__root = BTreeInternalNode([separator], [self.__root, new_node])
+
+    @staticmethod
+    def __merge_leaves(parent_node, left_position):
+        """
+            Move all keys from a leaf to its left sibling, removing it from the Tree
+        :param parent_node: internal node holding both leaves
+        :param left_position: position of the left leaf among the parent children
+        :return: None
+        """
+        left_leaf = parent_node.children[left_position]
+        right_leaf = parent_node.children[left_position + 1]
+
+        left_leaf.keys.extend(right_leaf.keys)
+        left_leaf.values.extend(right_leaf.values)
+        left_leaf.next = right_leaf.next
+        if right_leaf.next is not None:
+            right_leaf.next.prev = left_leaf
+
+        del parent_node.keys[left_position]
+        del parent_node.children[left_position + 1]
+
+    @staticmethod
+    def __merge_internal_nodes(parent_node, left_position):
+        """
+            Move all children from an internal node to its left sibling, pulling the separator down
+        :param parent_node: internal node holding both nodes
+        :param left_position: position of the left node among the parent children
+        :return: None
+        """
+        left_node = parent_node.children[left_position]
+        right_node = parent_node.children[left_position + 1]
+
+        left_node.keys.append(parent_node.keys[left_position])
+        left_node.keys.extend(right_node.keys)
+        left_node.children.extend(right_node.children)
+
+        del parent_node.keys[left_position]
+        del parent_node.children[left_position + 1]
+
+    def __borrow_from_sibling(self, node, parent_node, child_position):
+        """
+            Move one entry from a sibling with spare entries to the underflowing node
+        :param node: node with less entries than the minimum
+        :param parent_node: internal node holding the node and its siblings
+        :param child_position: position of the node among the parent children
+        :return: True if there was a sibling with spare entries
+        """
+        is_leaf = isinstance(node, BTreeLeaf)
+
+        if child_position > 0:
+            sibling = parent_node.children[child_position - 1]
+            if (len(sibling.keys) if is_leaf else len(sibling.children)) > self.__min_size:
+                if is_leaf:
+                    node.keys.insert(0, sibling.keys.pop())
+                    node.values.insert(0, sibling.values.pop())
+                    parent_node.keys[child_position - 1] = node.keys[0]
+                else:
+                    node.keys.insert(0, parent_node.keys[child_position - 1])
+                    node.children.insert(0, sibling.children.pop())
+                    parent_node.keys[child_position - 1] = sibling.keys.pop()
+                return True
+
+        if child_position < len(parent_node.children) - 1:
+            sibling = parent_node.children[child_position + 1]
+            if (len(sibling.keys) if is_leaf else len(sibling.children)) > self.__min_size:
+                if is_leaf:
+                    node.keys.append(sibling.keys.pop(0))
+                    node.values.append(sibling.values.pop(0))
+                    parent_node.keys[child_position] = sibling.keys[0]
+                else:
+                    node.keys.append(parent_node.keys[child_position])
+                    node.children.append(sibling.children.pop(0))
+                    parent_node.keys[child_position] = sibling.keys.pop(0)
+                return True
+
+        return False
+
+    def delete_node(self, key_to_delete):
+        """
+            Delete node with specified key from the Tree
+        :param key_to_delete: key from the element to be deleted
+        :return: None
+        """
+        leaf, key_position, path = self.__find_key(key_to_delete)
+        if key_position is None:
+            raise IndexError("Invalid key!")
+
+        del leaf.keys[key_position]
+        del leaf.values[key_position]
+        self.__tree_length -= 1
+
+        node = leaf
+        while path:
+            node_size = len(node.keys) if node is leaf else len(node.children)
+            if node_size >= self.__min_size:
+                return
+
+            parent_node, child_position = path.pop()
+            if self.__borrow_from_sibling(node, parent_node, child_position):
+                return
+
+            left_position = child_position - 1 if child_position > 0 else child_position
+            if node is leaf:
+                self.__merge_leaves(parent_node, left_position)
+            else:
+                self.__merge_internal_nodes(parent_node, left_position)
+            node = parent_node
+
+        if isinstance(self.__root, BTreeInternalNode) and len(self.__root.children) == 1:
+            self.__root = self.__root.children[0]
+
+    def set_value(self, key, element_data):
+        """
+            Update the value from an existing element
+        :param key: key from the node to receive a new value
+        :param element_data: value to be assigned to the node
+        :return: None
+        """
+        leaf, key_position, _ = self.__find_key(key)
+        if key_position is None:
+            raise IndexError("Invalid key!")
+        leaf.values[key_position] = element_data
+
+    def get_value(self, key):
+        """
+            Get the value from the node matching the desired key
+        :param key: key from the node be returned
+        :return: value from the requested node
+        """
+        leaf, key_position, _ = self.__find_key(key)
+        if key_position is None:
+            raise IndexError("Invalid key!")
+        return leaf.values[key_position]
+
+    def __edge_leaf(self, last):
+        node = self.__root
+        while isinstance(node, BTreeInternalNode):
+            node = node.children[-1] if last else node.children[0]
+        return node
+
+    def iter_items(self, reverse=False):
+        """
+            Lazily iterate over the Tree elements in key order, following the leaf links
+        :param reverse: The reverse flag can be set to iterate in descending order
+        :return: generator of (key, value) pairs
+        """
+        leaf = self.__edge_leaf(last=reverse)
+        while leaf is not None:
+            if reverse:
+                yield from zip(reversed(leaf.keys), reversed(leaf.values))
+                leaf = leaf.prev
+            else:
+                yield from zip(leaf.keys, leaf.values)
+                leaf = leaf.next
+
+    def iter_range(self, lower_key=None, upper_key=None):
+        """
+            Lazily iterate over the elements with keys between the bounds (both inclusive)
+        :param lower_key: smallest key to be returned (no lower bound if None)
+        :param upper_key: biggest key to be returned (no upper bound if None)
+        :return: generator of (key, value) pairs in ascending order
+        """
+        if lower_key is None:
+            leaf, key_position = self.__edge_leaf(last=False), 0
+        else:
+            leaf, _ = self.__find_leaf(lower_key)
+            try:
+                key_position = bisect.bisect_left(leaf.keys, lower_key)
+            except TypeError:
+                raise IndexError("Invalid key type! It must be comparable to the Tree keys.")
+
+        while leaf is not None:
+            stop_position = len(leaf.keys)
+            if upper_key is not None:
+                try:
+                    stop_position = bisect.bisect_right(leaf.keys, upper_key, key_position)
+                except TypeError:
+                    raise IndexError("Invalid key type! It must be comparable to the Tree keys.")
+            yield from zip(leaf.keys[key_position:stop_position], leaf.values[key_position:stop_position])
+
+            if stop_position < len(leaf.keys):
+                return
+            leaf, key_position = leaf.next, 0
+
+    def get_sorted_tree_keys(self, reverse=False):
+        """
+            Get the keys from the Tree in sorted order
+        :param reverse: The reverse flag can be set to sort in descending order
+        :return: sorted keys
+        """
+        return [key for key, _ in self.iter_items(reverse=reverse)]
+
+    def get_sorted_tree_values(self, reverse=False):
+        """
+            Get the values from the Tree sorted by their keys
+        :param reverse: The reverse flag can be set to sort in descending order
+        :return: sorted values
+        """
+        return [value for _, value in self.iter_items(reverse=reverse)]
+
+    def __len__(self):
+        return self.__tree_length
+
+    def __str__(self):
+        tree_string = "BTree"
+        return tree_string
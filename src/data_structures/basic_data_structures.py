@@ -1,4 +1,25 @@
 # This file provides examples of implementation of different data structures
+import io
+from array import array
+
+
+def write_indexed_rows(stream, values, chunk_size):
+    """
+        Write the values as an "index/value" table, flushing the rows in chunks
+    :param stream: file-like object receiving the table
+    :param values: iterable with the values to be written
+    :param chunk_size: amount of rows to be joined in a single write call
+    :return: None
+    """
+    stream.write("index\tvalue")
+    rows = []
+    for index, value in enumerate(values):
+        rows.append(f"\n{index:5}\t{value}")
+        if len(rows) == chunk_size:
+            stream.write("".join(rows))
+            rows.clear()
+    stream.write("".join(rows))
+
 
 class Node:
 
@@ -7,14 +28,26 @@ class Node:
         self.next = next_node
 
 
+class DoublyNode(Node):
+
+    def __init__(self, data, next_node, prev_node=None):
+        super().__init__(data, next_node)
+        self.prev = prev_node
+
+
 class LinkedList:
     """
         Linked List class
     """
+    REVERSE_CHUNK_SIZE = 1024
 
-    def __init__(self):
+    def __init__(self, doubly_linked=False):
         self.__head = None
+        self.__tail = None
+        self.__doubly_linked = doubly_linked
         self.__linked_list_length = 0
+        # Last node reached by index (node, parent_node, index), reused by sequential accesses
+        self.__finger = None
 
     def is_empty(self):
         """
@@ -26,6 +59,25 @@ class LinkedList:
 
         return False
 
+    def is_doubly_linked(self):
+        """
+            Verifies if the nodes from the List keep a link to their previous node
+        :return: doubly linked status
+        """
+        return self.__doubly_linked
+
+    def __new_node(self, data, next_node, prev_node):
+        """
+            Create a node according to the List linking mode
+        :param data: value to be held by the node
+        :param next_node: node following the new node
+        :param prev_node: node preceding the new node (only kept by doubly linked lists)
+        :return: new node
+        """
+        if self.__doubly_linked:
+            return DoublyNode(data, next_node, prev_node)
+        return Node(data, next_node)
+
     def __get_last_node_and_parent(self):
         """
             Retrieve the last node from the list and his parent node
@@ -34,10 +86,13 @@ class LinkedList:
         if self.is_empty():
             return self.__head, None
 
+        if self.__doubly_linked:
+            return self.__tail, self.__tail.prev
+
         current_node = self.__head
-        parent_node = current_node
+        parent_node = None
 
-        while current_node.next is not None:
+        while current_node is not self.__tail:
             parent_node = current_node
             current_node = current_node.next
 
@@ -52,9 +107,10 @@ class LinkedList:
         if self.is_empty():
             raise IndexError("Index out of range!")
 
-        count = 0
-        current_node = self.__head
-        parent_node = None
+        if self.__finger is not None and self.__finger[2] <= index:
+            current_node, parent_node, count = self.__finger
+        else:
+            current_node, parent_node, count = self.__head, None, 0
 
         while count != index:
             parent_node = current_node
@@ -63,6 +119,7 @@ class LinkedList:
                 raise IndexError("Index out of range!")
             count += 1
 
+        self.__finger = current_node, parent_node, index
         return current_node, parent_node
 
     def get_index(self, index:int):
@@ -74,6 +131,9 @@ class LinkedList:
         if index < 0:
             index = (self.__linked_list_length + index) % self.__linked_list_length
 
+        if index == self.__linked_list_length - 1:
+            return self.__tail.data
+
         index_node, *_ = self.__get_index_node_and_parent(index)
         return index_node.data
 
@@ -83,9 +143,14 @@ class LinkedList:
         :param new_value: value to be added to the list
         :return:
         """
-        new_node = Node(new_value, self.__head)
+        new_node = self.__new_node(new_value, self.__head, None)
+        if self.is_empty():
+            self.__tail = new_node
+        elif self.__doubly_linked:
+            self.__head.prev = new_node
         self.__head = new_node
         self.__linked_list_length += 1
+        self.__finger = None
 
     def add_at_tail(self, new_value):
         """
@@ -93,11 +158,12 @@ class LinkedList:
         :param new_value: value to be added to the list
         :return:
         """
+        new_node = self.__new_node(new_value, None, self.__tail)
         if self.is_empty():
-            self.__head = Node(new_value, None)
+            self.__head = new_node
         else:
-            last_node, *_ = self.__get_last_node_and_parent()
-            last_node.next = Node(new_value, None)
+            self.__tail.next = new_node
+        self.__tail = new_node
         self.__linked_list_length += 1
 
     def add_at_index(self, index, new_value):
@@ -112,10 +178,15 @@ class LinkedList:
 
         index_node, parent_node = self.__get_index_node_and_parent(index)
         if parent_node is None:
-            self.__head = Node(new_value, index_node)
-        else:
-            parent_node.next = Node(new_value, index_node)
+            self.add_at_head(new_value)
+            return
+
+        new_node = self.__new_node(new_value, index_node, parent_node)
+        parent_node.next = new_node
+        if self.__doubly_linked:
+            index_node.prev = new_node
         self.__linked_list_length += 1
+        self.__finger = None
 
     def delete_from_head(self):
         """
@@ -128,13 +199,18 @@ class LinkedList:
 
         item_to_delete_data = self.__head.data
         self.__head = self.__head.next
+        if self.__head is None:
+            self.__tail = None
+        elif self.__doubly_linked:
+            self.__head.prev = None
         self.__linked_list_length -= 1
+        self.__finger = None
 
         return item_to_delete_data
 
     def delete_from_tail(self):
         """
-            Remove the last item from the list
+            Remove the last item from the list (O(1) when doubly linked, O(n) otherwise)
         :return: value from the removed item
         """
         if self.is_empty():
@@ -143,8 +219,14 @@ class LinkedList:
         last_node, parent_node = self.__get_last_node_and_parent()
         item_to_delete_data = last_node.data
 
+        if parent_node is None:
+            self.__head = None
+        else:
+            parent_node.next = None
+        self.__tail = parent_node
+
         self.__linked_list_length -= 1
-        parent_node.next = None
+        self.__finger = None
         return item_to_delete_data
 
     def delete_from_index(self, index):
@@ -159,35 +241,620 @@ class LinkedList:
             return self.delete_from_head()
 
         index_node, parent_node = self.__get_index_node_and_parent(index)
+        parent_node.next = index_node.next
+        if index_node is self.__tail:
+            self.__tail = parent_node
+        elif self.__doubly_linked:
+            index_node.next.prev = parent_node
+
+        self.__linked_list_length -= 1
+        self.__finger = None
+        return index_node.data
+
+    def cursor(self, index=0):
+        """
+            Create a cursor pointing to the node in defined index position
+        :param index: position of the node pointed by the cursor
+        :return: cursor
+        """
+        if self.is_empty() and index == 0:
+            return LinkedListCursor(self, None, None, 0)
+
+        index_node, parent_node = self.__get_index_node_and_parent(index)
+        return LinkedListCursor(self, index_node, parent_node, index)
+
+    def _insert_after(self, reference_node, new_value):
+        """
+            Add a new item right after a node from the list
+        :param reference_node: node to precede the new item
+        :param new_value: value to be added to the list
+        :return: None
+        """
+        new_node = self.__new_node(new_value, reference_node.next, reference_node)
+        if reference_node is self.__tail:
+            self.__tail = new_node
+        elif self.__doubly_linked:
+            reference_node.next.prev = new_node
+        reference_node.next = new_node
+
+        self.__linked_list_length += 1
+        self.__finger = None
+
+    def _unlink(self, node, parent_node):
+        """
+            Remove a node from the list, given its parent node
+        :param node: node to be removed
+        :param parent_node: node preceding the removed node (None for the head)
+        :return: None
+        """
         if parent_node is None:
-            self.__head = index_node.next
+            self.__head = node.next
         else:
-            parent_node.next = index_node.next
+            parent_node.next = node.next
+
+        if node is self.__tail:
+            self.__tail = parent_node
+        elif self.__doubly_linked:
+            node.next.prev = parent_node
 
         self.__linked_list_length -= 1
-        return index_node.data
+        self.__finger = None
+
+    @classmethod
+    def from_iterable(cls, values, doubly_linked=False):
+        """
+            Create a list holding the values in the iteration order
+        :param values: iterable with the values to be added to the list
+        :param doubly_linked: flag to also link each node to its predecessor
+        :return: new list
+        """
+        new_list = cls(doubly_linked=doubly_linked)
+        new_list.extend(values)
+        return new_list
+
+    def extend(self, values):
+        """
+            Add the values to the end of the list in a single linking sweep
+        :param values: iterable with the values to be added to the list
+        :return: None
+        """
+        if values is self:
+            values = list(values)
+
+        tail_node = self.__tail
+        added_items = 0
+        for value in values:
+            new_node = self.__new_node(value, None, tail_node)
+            if tail_node is None:
+                self.__head = new_node
+            else:
+                tail_node.next = new_node
+            tail_node = new_node
+            added_items += 1
+
+        self.__tail = tail_node
+        self.__linked_list_length += added_items
+
+    def extendleft(self, values):
+        """
+            Add the values to the beginning of the list, one after the other (ending in reversed order)
+        :param values: iterable with the values to be added to the list
+        :return: None
+        """
+        if values is self:
+            values = list(values)
+
+        head_node = self.__head
+        added_items = 0
+        for value in values:
+            new_node = self.__new_node(value, head_node, None)
+            if head_node is None:
+                self.__tail = new_node
+            elif self.__doubly_linked:
+                head_node.prev = new_node
+            head_node = new_node
+            added_items += 1
+
+        self.__head = head_node
+        self.__linked_list_length += added_items
+        self.__finger = None
+
+    def __take_nodes(self, other_list):
+        """
+            Detach all nodes from another list, leaving it empty
+        :param other_list: list to have its nodes taken
+        :return: head, tail and length from the taken chain of nodes
+        """
+        if other_list is self:
+            raise ValueError("Can not splice a list into itself!")
+        if not isinstance(other_list, LinkedList) or other_list.__doubly_linked != self.__doubly_linked:
+            raise ValueError("Lists must share the same linking mode!")
+
+        taken_nodes = other_list.__head, other_list.__tail, other_list.__linked_list_length
+        other_list.__head = None
+        other_list.__tail = None
+        other_list.__linked_list_length = 0
+        other_list.__finger = None
+        return taken_nodes
+
+    def concat(self, other_list):
+        """
+            Move all items from another list to the end of this list in O(1)
+        :param other_list: list to be emptied into this one
+        :return: None
+        """
+        other_head, other_tail, other_length = self.__take_nodes(other_list)
+        if other_head is None:
+            return
+
+        if self.is_empty():
+            self.__head = other_head
+        else:
+            self.__tail.next = other_head
+            if self.__doubly_linked:
+                other_head.prev = self.__tail
+
+        self.__tail = other_tail
+        self.__linked_list_length += other_length
+
+    def splice(self, index, other_list):
+        """
+            Move all items from another list into this list, starting at the index position
+        :param index: position to receive the first item from the other list
+        :param other_list: list to be emptied into this one
+        :return: None
+        """
+        if index == self.__linked_list_length:
+            self.concat(other_list)
+            return
+
+        index_node, parent_node = self.__get_index_node_and_parent(index)
+        other_head, other_tail, other_length = self.__take_nodes(other_list)
+        if other_head is None:
+            return
+
+        if parent_node is None:
+            self.__head = other_head
+        else:
+            parent_node.next = other_head
+        other_tail.next = index_node
+
+        if self.__doubly_linked:
+            other_head.prev = parent_node
+            index_node.prev = other_tail
+
+        self.__linked_list_length += other_length
+        self.__finger = None
+
+    def delete_range(self, start, stop):
+        """
+            Remove the items from start (inclusive) to stop (exclusive) in a single pass
+        :param start: position of the first item to be removed
+        :param stop: position after the last item to be removed
+        :return: list holding the removed items
+        """
+        start, stop, _ = slice(start, stop).indices(self.__linked_list_length)
+        removed_items = LinkedList(doubly_linked=self.__doubly_linked)
+        if start >= stop:
+            return removed_items
+
+        first_node, parent_node = self.__get_index_node_and_parent(start)
+        last_node = first_node
+        for _ in range(stop - start - 1):
+            last_node = last_node.next
+        following_node = last_node.next
+
+        if parent_node is None:
+            self.__head = following_node
+        else:
+            parent_node.next = following_node
+
+        if following_node is None:
+            self.__tail = parent_node
+        elif self.__doubly_linked:
+            following_node.prev = parent_node
+
+        last_node.next = None
+        if self.__doubly_linked:
+            first_node.prev = None
+
+        removed_items.__head = first_node
+        removed_items.__tail = last_node
+        removed_items.__linked_list_length = stop - start
+        self.__linked_list_length -= stop - start
+        self.__finger = None
+
+        return removed_items
 
     def __len__(self):
         return self.__linked_list_length
 
-    def __str__(self):
+    def __iter__(self):
         current_node = self.__head
+        while current_node is not None:
+            yield current_node.data
+            current_node = current_node.next
+
+    def __reversed__(self):
+        if self.__doubly_linked:
+            current_node = self.__tail
+            while current_node is not None:
+                yield current_node.data
+                current_node = current_node.prev
+            return
 
+        # Singly linked: remember a node every chunk and expand the chunks backwards
+        checkpoints = []
+        current_node = self.__head
         index = 0
-        list_string = "index\tvalue"
-        while current_node.next is not None:
-            list_string += f"\n{index:5}\t{current_node.data}"
+        while current_node is not None:
+            if index % self.REVERSE_CHUNK_SIZE == 0:
+                checkpoints.append(current_node)
             current_node = current_node.next
             index += 1
-        list_string += f"\n{index:5}\t{current_node.data}"
 
-        return list_string
+        for checkpoint in reversed(checkpoints):
+            chunk = []
+            current_node = checkpoint
+            while current_node is not None and len(chunk) < self.REVERSE_CHUNK_SIZE:
+                chunk.append(current_node.data)
+                current_node = current_node.next
+            yield from reversed(chunk)
+
+    def __contains__(self, value):
+        for item in self:
+            if item == value:
+                return True
+        return False
+
+    def write_to(self, stream, chunk_size=1024):
+        """
+            Write the list to a file-like object without building the whole string
+        :param stream: file-like object receiving the list rows
+        :param chunk_size: amount of rows to be joined in a single write call
+        :return: None
+        """
+        write_indexed_rows(stream, self, chunk_size)
+
+    def __str__(self):
+        list_string = io.StringIO()
+        self.write_to(list_string)
+        return list_string.getvalue()
+
+
+class LinkedListCursor:
+    """
+        Cursor pointing to a node from a LinkedList, allowing to move forward and to edit
+        the list around the pointed node in O(1). Changes made to the list by other means
+        may invalidate the cursor.
+    """
+
+    def __init__(self, linked_list, node, parent_node, index):
+        self.__linked_list = linked_list
+        self.__node = node
+        self.__parent_node = parent_node
+        self.__index = index
+
+    def is_valid(self):
+        """
+            Verifies if the cursor points to a node
+        :return: validity status
+        """
+        return self.__node is not None
+
+    def __check_valid(self):
+        if self.__node is None:
+            raise IndexError("Cursor out of range!")
+
+    def index(self):
+        """
+            Position of the node pointed by the cursor
+        :return: index
+        """
+        return self.__index
+
+    def get(self):
+        """
+            Retrieve the value from the pointed node
+        :return: data
+        """
+        self.__check_valid()
+        return self.__node.data
+
+    def set(self, new_value):
+        """
+            Update the value from the pointed node
+        :param new_value: value to be assigned to the node
+        :return: None
+        """
+        self.__check_valid()
+        self.__node.data = new_value
+
+    def next(self):
+        """
+            Move the cursor to the following node
+        :return: None
+        """
+        self.__check_valid()
+        self.__parent_node = self.__node
+        self.__node = self.__node.next
+        self.__index += 1
+
+    def insert_after(self, new_value):
+        """
+            Add a new item right after the pointed node (the cursor does not move)
+        :param new_value: value to be added to the list
+        :return: None
+        """
+        self.__check_valid()
+        self.__linked_list._insert_after(self.__node, new_value)
+
+    def delete(self):
+        """
+            Remove the pointed node, moving the cursor to the following node
+        :return: value from the removed item
+        """
+        self.__check_valid()
+        removed_node = self.__node
+        self.__node = removed_node.next
+        self.__linked_list._unlink(removed_node, self.__parent_node)
+        return removed_node.data
+
+
+class PooledLinkedList:
+    """
+        Linked List class that keeps its nodes in preallocated parallel arrays
+        (values and next-indices) instead of one Node object per item
+    """
+    NULL_INDEX = -1
+    REVERSE_CHUNK_SIZE = 1024
+
+    def __init__(self, capacity=16):
+        capacity = max(capacity, 1)
+        self.__data = [None] * capacity
+        self.__next = array('q', range(1, capacity + 1))
+        self.__next[-1] = self.NULL_INDEX
+        self.__free = 0
+        self.__head = self.NULL_INDEX
+        self.__tail = self.NULL_INDEX
+        self.__linked_list_length = 0
+
+    def is_empty(self):
+        """
+            Verifies if the List is empty
+        :return: emptiness status
+        """
+        if self.__head == self.NULL_INDEX:
+            return True
+
+        return False
+
+    def capacity(self):
+        """
+            Amount of slots currently allocated in the pool
+        :return: pool capacity
+        """
+        return len(self.__data)
+
+    def __grow(self):
+        """
+            Double the pool capacity, chaining the new slots into the free list
+        :return: None
+        """
+        old_capacity = len(self.__data)
+        new_capacity = 2 * old_capacity
+
+        self.__data.extend([None] * old_capacity)
+        self.__next.extend(range(old_capacity + 1, new_capacity + 1))
+        self.__next[-1] = self.__free
+        self.__free = old_capacity
+
+    def __allocate(self, data, next_idx):
+        """
+            Take a slot from the free list and fill it with a new node
+        :param data: value to be held by the node
+        :param next_idx: slot of the node following the new node
+        :return: slot of the new node
+        """
+        if self.__free == self.NULL_INDEX:
+            self.__grow()
+
+        new_idx = self.__free
+        self.__free = self.__next[new_idx]
+        self.__data[new_idx] = data
+        self.__next[new_idx] = next_idx
+        return new_idx
+
+    def __release(self, node_idx):
+        """
+            Give a slot back to the free list
+        :param node_idx: slot to be released
+        :return: value held by the released node
+        """
+        node_data = self.__data[node_idx]
+        self.__data[node_idx] = None
+        self.__next[node_idx] = self.__free
+        self.__free = node_idx
+        return node_data
+
+    def __get_index_node_and_parent(self, index:int):
+        """
+            Retrieve the slot from the node in defined index position
+        :param index: position to retrieve the node
+        :return: node slot, parent node slot
+        """
+        if self.is_empty() or index < 0:
+            raise IndexError("Index out of range!")
+
+        count = 0
+        current_idx = self.__head
+        parent_idx = self.NULL_INDEX
+
+        while count != index:
+            parent_idx = current_idx
+            current_idx = self.__next[current_idx]
+            if current_idx == self.NULL_INDEX:
+                raise IndexError("Index out of range!")
+            count += 1
+
+        return current_idx, parent_idx
+
+    def get_index(self, index:int):
+        """
+            Retrieve the item in defined index position
+        :param index: position to retrieve the data
+        :return: data
+        """
+        if index < 0:
+            index = (self.__linked_list_length + index) % self.__linked_list_length
+
+        if index == self.__linked_list_length - 1:
+            return self.__data[self.__tail]
+
+        index_idx, _ = self.__get_index_node_and_parent(index)
+        return self.__data[index_idx]
+
+    def add_at_head(self, new_value):
+        """
+            Add a new item to the beginning of th list
+        :param new_value: value to be added to the list
+        :return:
+        """
+        self.__head = self.__allocate(new_value, self.__head)
+        if self.__tail == self.NULL_INDEX:
+            self.__tail = self.__head
+        self.__linked_list_length += 1
+
+    def add_at_tail(self, new_value):
+        """
+            Add a new item to the end of the list
+        :param new_value: value to be added to the list
+        :return:
+        """
+        new_idx = self.__allocate(new_value, self.NULL_INDEX)
+        if self.is_empty():
+            self.__head = new_idx
+        else:
+            self.__next[self.__tail] = new_idx
+        self.__tail = new_idx
+        self.__linked_list_length += 1
+
+    def add_at_index(self, index, new_value):
+        """
+            Add a new item to the specified index position
+        :param index: position to add the new item
+        :param new_value: value to be added to the list
+        :return:
+        """
+        if self.is_empty():
+            raise IndexError
+
+        index_idx, parent_idx = self.__get_index_node_and_parent(index)
+        if parent_idx == self.NULL_INDEX:
+            self.add_at_head(new_value)
+            return
+
+        self.__next[parent_idx] = self.__allocate(new_value, index_idx)
+        self.__linked_list_length += 1
+
+    def delete_from_head(self):
+        """
+            Remove the first item from the list
+        :return: value from the removed item
+        """
+        if self.is_empty():
+            raise IndexError("Delete from empty list!")
+
+        head_idx = self.__head
+        self.__head = self.__next[head_idx]
+        if self.__head == self.NULL_INDEX:
+            self.__tail = self.NULL_INDEX
+        self.__linked_list_length -= 1
+
+        return self.__release(head_idx)
+
+    def delete_from_tail(self):
+        """
+            Remove the last item from the list
+        :return: value from the removed item
+        """
+        if self.is_empty():
+            raise IndexError("Delete from empty list!")
+
+        return self.delete_from_index(self.__linked_list_length - 1)
+
+    def delete_from_index(self, index):
+        """
+            Remove the item from the list at index position
+        :param index: position to remove the new item
+        :return: value from the removed item
+        """
+        if self.is_empty():
+            raise IndexError("Delete from empty list!")
+        elif index == 0:
+            return self.delete_from_head()
+
+        index_idx, parent_idx = self.__get_index_node_and_parent(index)
+        self.__next[parent_idx] = self.__next[index_idx]
+        if index_idx == self.__tail:
+            self.__tail = parent_idx
+
+        self.__linked_list_length -= 1
+        return self.__release(index_idx)
+
+    def __len__(self):
+        return self.__linked_list_length
+
+    def __iter__(self):
+        current_idx = self.__head
+        while current_idx != self.NULL_INDEX:
+            yield self.__data[current_idx]
+            current_idx = self.__next[current_idx]
+
+    def __reversed__(self):
+        # Remember a slot every chunk and expand the chunks backwards
+        checkpoints = []
+        current_idx = self.__head
+        index = 0
+        while current_idx != self.NULL_INDEX:
+            if index % self.REVERSE_CHUNK_SIZE == 0:
+                checkpoints.append(current_idx)
+            current_idx = self.__next[current_idx]
+            index += 1
+
+        for checkpoint in reversed(checkpoints):
+            chunk = []
+            current_idx = checkpoint
+            while current_idx != self.NULL_INDEX and len(chunk) < self.REVERSE_CHUNK_SIZE:
+                chunk.append(self.__data[current_idx])
+                current_idx = self.__next[current_idx]
+            yield from reversed(chunk)
+
+    def __contains__(self, value):
+        for item in self:
+            if item == value:
+                return True
+        return False
+
+    def write_to(self, stream, chunk_size=1024):
+        """
+            Write the list to a file-like object without building the whole string
+        :param stream: file-like object receiving the list rows
+        :param chunk_size: amount of rows to be joined in a single write call
+        :return: None
+        """
+        write_indexed_rows(stream, self, chunk_size)
+
+    def __str__(self):
+        list_string = io.StringIO()
+        self.write_to(list_string)
+        return list_string.getvalue()
 
 
 class Queue:
 
-    def __init__(self):
-        self.__queue_data = LinkedList()
+    def __init__(self, storage=LinkedList):
+        self.__queue_data = storage()
 
     def is_empty(self):
         return self.__queue_data.is_empty()
@@ -204,14 +871,180 @@ class Queue:
     def __len__(self):
         return self.__queue_data.__len__()
 
+    def __iter__(self):
+        return iter(self.__queue_data)
+
+    def __reversed__(self):
+        return reversed(self.__queue_data)
+
+    def __contains__(self, value):
+        return value in self.__queue_data
+
+    def write_to(self, stream, chunk_size=1024):
+        self.__queue_data.write_to(stream, chunk_size)
+
     def __str__(self):
         return self.__queue_data.__str__()
 
 
+class RingBufferQueue:
+    """
+        Queue class holding the items in a preallocated circular array, which grows
+        geometrically and can optionally be bounded
+    """
+    REJECT = "reject"
+    OVERWRITE = "overwrite"
+
+    def __init__(self, capacity=16, max_size=None, overflow_policy=REJECT):
+        if overflow_policy not in (self.REJECT, self.OVERWRITE):
+            raise ValueError("Invalid overflow policy!")
+        if max_size is not None and max_size < 1:
+            raise ValueError("Invalid queue max size!")
+
+        if max_size is not None:
+            capacity = min(capacity, max_size)
+        self.__buffer = [None] * max(capacity, 1)
+        self.__head = 0
+        self.__queue_length = 0
+        self.__max_size = max_size
+        self.__overflow_policy = overflow_policy
+
+    def is_empty(self):
+        return self.__queue_length == 0
+
+    def is_full(self):
+        """
+            Verifies if a bounded queue reached its max size
+        :return: fullness status
+        """
+        return self.__max_size is not None and self.__queue_length >= self.__max_size
+
+    def capacity(self):
+        """
+            Amount of slots currently allocated in the buffer
+        :return: buffer capacity
+        """
+        return len(self.__buffer)
+
+    def __reserve(self, required_slots):
+        """
+            Grow the buffer geometrically (up to the max size) until it fits the required slots
+        :param required_slots: amount of items the buffer must be able to hold
+        :return: None
+        """
+        capacity = len(self.__buffer)
+        if required_slots <= capacity:
+            return
+
+        while capacity < required_slots:
+            capacity *= 2
+        if self.__max_size is not None:
+            capacity = min(capacity, self.__max_size)
+
+        ordered_items = self.__buffer[self.__head:] + self.__buffer[:self.__head]
+        self.__buffer = ordered_items + [None] * (capacity - len(ordered_items))
+        self.__head = 0
+
+    def add(self, new_queue_value):
+        if self.is_full():
+            if self.__overflow_policy == self.REJECT:
+                raise OverflowError("Add to full queue!")
+            self.remove()
+
+        self.__reserve(self.__queue_length + 1)
+        tail = (self.__head + self.__queue_length) % len(self.__buffer)
+        self.__buffer[tail] = new_queue_value
+        self.__queue_length += 1
+
+    def add_many(self, new_queue_values):
+        """
+            Add a batch of items to the end of the queue
+        :param new_queue_values: iterable with the values to be added
+        :return: None
+        """
+        new_queue_values = list(new_queue_values)
+
+        if self.__max_size is not None and self.__queue_length + len(new_queue_values) > self.__max_size:
+            if self.__overflow_policy == self.REJECT:
+                raise OverflowError("Add to full queue!")
+            new_queue_values = new_queue_values[-self.__max_size:]
+            self.remove_many(max(self.__queue_length + len(new_queue_values) - self.__max_size, 0))
+
+        self.__reserve(self.__queue_length + len(new_queue_values))
+        capacity = len(self.__buffer)
+        tail = (self.__head + self.__queue_length) % capacity
+        first_part = min(len(new_queue_values), capacity - tail)
+
+        self.__buffer[tail:tail + first_part] = new_queue_values[:first_part]
+        self.__buffer[:len(new_queue_values) - first_part] = new_queue_values[first_part:]
+        self.__queue_length += len(new_queue_values)
+
+    def remove(self):
+        if self.is_empty():
+            raise IndexError("Delete from empty queue!")
+
+        removed_value = self.__buffer[self.__head]
+        self.__buffer[self.__head] = None
+        self.__head = (self.__head + 1) % len(self.__buffer)
+        self.__queue_length -= 1
+
+        return removed_value
+
+    def remove_many(self, max_items=None):
+        """
+            Remove a batch of items from the beginning of the queue
+        :param max_items: max amount of items to be removed (all items if None)
+        :return: list with the removed values in FIFO order
+        """
+        if max_items is not None and max_items < 0:
+            raise ValueError("Invalid max items!")
+
+        amount = self.__queue_length if max_items is None else min(max_items, self.__queue_length)
+        capacity = len(self.__buffer)
+        first_part = min(amount, capacity - self.__head)
+        second_part = amount - first_part
+
+        removed_values = self.__buffer[self.__head:self.__head + first_part] + self.__buffer[:second_part]
+        self.__buffer[self.__head:self.__head + first_part] = [None] * first_part
+        self.__buffer[:second_part] = [None] * second_part
+
+        self.__head = (self.__head + amount) % capacity
+        self.__queue_length -= amount
+
+        return removed_values
+
+    def __len__(self):
+        return self.__queue_length
+
+    def __iter__(self):
+        capacity = len(self.__buffer)
+        for offset in range(self.__queue_length):
+            yield self.__buffer[(self.__head + offset) % capacity]
+
+    def __reversed__(self):
+        capacity = len(self.__buffer)
+        for offset in range(self.__queue_length - 1, -1, -1):
+            yield self.__buffer[(self.__head + offset) % capacity]
+
+    def __contains__(self, value):
+        for item in self:
+            if item == value:
+                return True
+        return False
+
+    def write_to(self, stream, chunk_size=1024):
+        write_indexed_rows(stream, self, chunk_size)
+
+    def __str__(self):
+        queue_string = io.StringIO()
+        self.write_to(queue_string)
+        return queue_string.getvalue()
+
+
 class Stack:
 
-    def __init__(self):
-        self.__stack_data = LinkedList()
+    def __init__(self, storage=LinkedList):
+        self.__stack_data = storage()
 
     def is_empty(self):
         return self.__stack_data.is_empty()
@@ -228,5 +1061,17 @@ class Stack:
     def __len__(self):
         return self.__stack_data.__len__()
 
+    def __iter__(self):
+        return iter(self.__stack_data)
+
+    def __reversed__(self):
+        return reversed(self.__stack_data)
+
+    def __contains__(self, value):
+        return value in self.__stack_data
+
+    def write_to(self, stream, chunk_size=1024):
+        self.__stack_data.write_to(stream, chunk_size)
+
     def __str__(self):
         return self.__stack_data.__str__()
@@ -1,18 +1,30 @@
+import heapq
+
+from src.data_structures.mapped_binary_tree import dump_sorted_items
+from src.sorting_algorithms.sorting import Sorting
+
 
 class TreeNode:
 
-    def __init__(self, key, data = None, parent = None):
+    def __init__(self, key, data = None, parent = None, sort_key = None):
         self.key = key
+        self.sort_key = key if sort_key is None else sort_key
         self.data = data
         self.parent = parent
         self.left = None
         self.right = None
+        self.height = 1
+        self.size = 1
 
 
 class BinaryTree:
+    REBUILD_FACTOR = 8
+    __MISSING = object()
 
-    def __init__(self):
+    def __init__(self, balanced=False, key=None):
         self.__root = None
+        self.__balanced = balanced
+        self.__key_function = key
 
     def is_empty(self):
         """
@@ -24,34 +36,113 @@ class BinaryTree:
 
         return False
 
-    @staticmethod
-    def __hash_key(input_key):
+    def is_balanced(self):
+        """
+            Verifies if the Tree rebalances itself (AVL) on insert and delete
+        :return: balancing mode
+        """
+        return self.__balanced
+
+    def get_height(self):
         """
-            Convert the key to a unique type to be processed as same for all request
+            Get the amount of levels from the Tree
+        :return: tree height
+        """
+        height = 0
+        level_nodes = [self.__root] if self.__root else []
+        while level_nodes:
+            height += 1
+            level_nodes = [child for node in level_nodes for child in (node.left, node.right) if child]
+
+        return height
+
+    def __get_sort_key(self, input_key):
+        """
+            Get the value used to order the key in the Tree (the key itself when no key function is set)
         :param input_key: key provided by the user
-        :return: hashed key
+        :return: sort key
         """
-        try:
-            return str(input_key)
-        except TypeError:
-            raise IndexError("Invalid key type! It must be hashable.")
+        if self.__key_function is None:
+            return input_key
+        return self.__key_function(input_key)
 
-    def __search_element(self, searched_key, start_node: TreeNode):
+    def __search_element(self, searched_sort_key):
         """
-            Search a node in the key according to the desired key
-        :param searched_key: pattern to be found
-        :param start_node: position to start the search
-        :return: node with the searched key
+            Descend the Tree a single time looking for the node with the desired key
+        :param searched_sort_key: sort key from the pattern to be found
+        :return: node with the searched key (or None) and the last node visited before it
         """
-        hashed_searched_key = self.__hash_key(searched_key)
+        parent_node = None
+        current_node = self.__root
+
+        while current_node is not None:
+            if searched_sort_key == current_node.sort_key:
+                return current_node, parent_node
+            parent_node = current_node
+            if searched_sort_key < current_node.sort_key:
+                current_node = current_node.left
+            else:
+                current_node = current_node.right
 
-        if (start_node is None) or (hashed_searched_key == self.__hash_key(start_node.key)):
-            return start_node
+        return None, parent_node
 
-        if hashed_searched_key <= self.__hash_key(start_node.key):
-            return self.__search_element(searched_key, start_node.left)
-        else:
-            return self.__search_element(searched_key, start_node.right)
+    def __descend_from_path(self, path, searched_sort_key):
+        """
+            Search a sort key not smaller than the ones previously searched with the same path, starting
+            the descent from the deepest node in the path whose subtree can still hold the key instead of from the root
+        :param path: (node, upper bound) pairs from the root to the last visited node, updated in place
+        :param searched_sort_key: sort key from the pattern to be found
+        :return: node with the searched key (or None) and the last node visited before it
+        """
+        while path and path[-1][1] is not None and not searched_sort_key < path[-1][1]:
+            path.pop()
+        if not path:
+            if self.__root is None:
+                return None, None
+            path.append((self.__root, None))
+
+        current_node, upper_bound = path[-1]
+        while searched_sort_key != current_node.sort_key:
+            if searched_sort_key < current_node.sort_key:
+                current_node, upper_bound = current_node.left, current_node.sort_key
+            else:
+                current_node = current_node.right
+            if current_node is None:
+                return None, path[-1][0]
+            path.append((current_node, upper_bound))
+
+        return current_node, path[-2][0] if len(path) > 1 else None
+
+    def __search_sorted_batch(self, sorted_sort_keys):
+        """
+            Search a batch of ascending sort keys, sharing the descent path between consecutive keys
+        :param sorted_sort_keys: iterable with ascending sort keys
+        :return: generator with the node matching each sort key (or None)
+        """
+        path = []
+        for searched_sort_key in sorted_sort_keys:
+            yield self.__descend_from_path(path, searched_sort_key)[0]
+
+    def __locate_key(self, searched_key):
+        """
+            Search the position from the key in the Tree
+        :param searched_key: key provided by the user
+        :return: sort key, node with the searched key (or None) and the node to be its parent
+        """
+        try:
+            searched_sort_key = self.__get_sort_key(searched_key)
+            return (searched_sort_key, *self.__search_element(searched_sort_key))
+        except TypeError:
+            raise IndexError("Invalid key type! It must be comparable to the Tree keys.")
+
+    def __find_node(self, searched_key):
+        """
+            Search the node matching the key from the root of the Tree
+        :param searched_key: key provided by the user
+        :return: node with the searched key or None
+        """
+        _, key_node, _ = self.__locate_key(searched_key)
+        return key_node
 
     @staticmethod
     def __get_subtree_minimum(start_node: TreeNode):
@@ -105,32 +196,36 @@ class BinaryTree:
 
         return reference_node.parent
 
-    def __add_node(self, new_key, new_key_data, parent_node: TreeNode):
+    def __link_node(self, new_node: TreeNode, parent_node: TreeNode):
         """
-            Recurrent method for adding node to the right tree position
-        :param new_key: new key to be added
-        :param new_key_data: value associated to the key
-        :param parent_node: node parent to the new node
+            Link a new node as child of the node found at the end of the key search, without updating its ancestors
+        :param new_node: node to be added
+        :param parent_node: node parent to the new node (None for an empty Tree)
         :return: None
         """
-        hashed_new_key = self.__hash_key(new_key)
-
-        if hashed_new_key < self.__hash_key(parent_node.key):
-            if parent_node.left is None:
-                parent_node.left = TreeNode(new_key, data=new_key_data, parent=parent_node)
-            else:
-                self.__add_node(new_key, new_key_data, parent_node.left)
+        new_node.parent = parent_node
+        if parent_node is None:
+            self.__root = new_node
+        elif new_node.sort_key < parent_node.sort_key:
+            parent_node.left = new_node
         else:
-            if parent_node.right is None:
-                parent_node.right = TreeNode(new_key, data=new_key_data, parent=parent_node)
-            else:
-                self.__add_node(new_key, new_key_data, parent_node.right)
+            parent_node.right = new_node
 
-    def insert_node(self, new_key, new_key_data = None):
+    def __add_node(self, new_node: TreeNode, parent_node: TreeNode):
         """
-            Inserts a new element to the Tree
-        :param new_key: key from the new element
-        :param new_key_data: value from the new element
+            Attach a new node as child of the node found at the end of the key search
+        :param new_node: node to be added
+        :param parent_node: node parent to the new node (None for an empty Tree)
+        :return: None
+        """
+        self.__link_node(new_node, parent_node)
+        self.__update_path_from(parent_node)
+
+    @staticmethod
+    def __validate_key(new_key):
+        """
+            Verify if the key type can be used in the Tree
+        :param new_key: key provided by the user
         :return: None
         """
         if isinstance(new_key, list):
@@ -138,14 +233,200 @@ class BinaryTree:
         elif isinstance(new_key, dict):
             raise IndexError("Key must not be a Dict!")
 
-        if self.is_empty():
-            self.__root = TreeNode(new_key, data=new_key_data)
+    def insert_node(self, new_key, new_key_data = None):
+        """
+            Inserts a new element to the Tree
+        :param new_key: key from the new element
+        :param new_key_data: value from the new element
+        :return: None
+        """
+        self.__validate_key(new_key)
+
+        sort_key, node_exist, parent_node = self.__locate_key(new_key)
+        if node_exist:
+            raise IndexError("Key already exists!")
+
+        self.__add_node(TreeNode(new_key, data=new_key_data, sort_key=sort_key), parent_node)
+
+    def upsert(self, key, element_data = None):
+        """
+            Update the value from the element with the key, inserting it when the key is not in the Tree
+        :param key: key from the element
+        :param element_data: value to be assigned to the element
+        :return: None
+        """
+        self.__validate_key(key)
+
+        sort_key, key_node, parent_node = self.__locate_key(key)
+        if key_node is not None:
+            key_node.data = element_data
         else:
-            node_exist = self.__search_element(new_key, self.__root)
-            if node_exist:
+            self.__add_node(TreeNode(key, data=element_data, sort_key=sort_key), parent_node)
+
+    def get_or_insert(self, key, default_data = None):
+        """
+            Get the value from the element with the key, inserting it with a default value when missing
+        :param key: key from the element
+        :param default_data: value assigned to the element when it is inserted
+        :return: value from the element
+        """
+        self.__validate_key(key)
+
+        sort_key, key_node, parent_node = self.__locate_key(key)
+        if key_node is not None:
+            return key_node.data
+
+        self.__add_node(TreeNode(key, data=default_data, sort_key=sort_key), parent_node)
+        return default_data
+
+    @classmethod
+    def from_sorted(cls, items, balanced=False, key=None):
+        """
+            Build a perfectly balanced Tree in O(n) from (key, value) pairs sorted by ascending key
+        :param items: iterable with (key, value) pairs sorted by key, without repeated keys
+        :param balanced: keep the Tree balanced (AVL) on later insertions and deletions
+        :param key: function defining the keys order
+        :return: new Tree
+        """
+        new_tree = cls(balanced=balanced, key=key)
+
+        nodes = []
+        for node_key, node_data in items:
+            cls.__validate_key(node_key)
+            new_node = TreeNode(node_key, data=node_data, sort_key=new_tree.__get_sort_key(node_key))
+            if nodes:
+                try:
+                    if new_node.sort_key == nodes[-1].sort_key:
+                        raise IndexError("Key already exists!")
+                    if new_node.sort_key < nodes[-1].sort_key:
+                        raise ValueError("Items must be sorted by key!")
+                except TypeError:
+                    raise IndexError("Invalid key type! It must be comparable to the Tree keys.")
+            nodes.append(new_node)
+
+        new_tree.__root = cls.__link_sorted_nodes(nodes, 0, len(nodes), None)
+        return new_tree
+
+    @classmethod
+    def __link_sorted_nodes(cls, nodes, start, stop, parent_node):
+        """
+            Link the middle node from a sorted slice as subtree root, recursing on both halves (depth O(log n))
+        :param nodes: nodes sorted by key
+        :param start: first position of the slice
+        :param stop: position after the last one of the slice
+        :param parent_node: parent from the subtree root
+        :return: subtree root
+        """
+        if start >= stop:
+            return None
+
+        middle = (start + stop) // 2
+        subtree_root = nodes[middle]
+        subtree_root.parent = parent_node
+        subtree_root.left = cls.__link_sorted_nodes(nodes, start, middle, subtree_root)
+        subtree_root.right = cls.__link_sorted_nodes(nodes, middle + 1, stop, subtree_root)
+        subtree_root.height = 1 + max(cls.__node_height(subtree_root.left), cls.__node_height(subtree_root.right))
+        subtree_root.size = 1 + cls.__node_size(subtree_root.left) + cls.__node_size(subtree_root.right)
+        return subtree_root
+
+    @classmethod
+    def from_unsorted(cls, items, balanced=False, key=None):
+        """
+            Sort (key, value) pairs and bulk-load them into a balanced Tree
+        :param items: iterable with (key, value) pairs, without repeated keys
+        :param balanced: keep the Tree balanced (AVL) on later insertions and deletions
+        :param key: function defining the keys order
+        :return: new Tree
+        """
+        items = list(items)
+        if key is None and all(isinstance(item_key, (int, float)) for item_key, _ in items):
+            items_by_key = dict(items)
+            if len(items_by_key) != len(items):
                 raise IndexError("Key already exists!")
+            sorted_items = [(item_key, items_by_key[item_key]) for item_key in Sorting.merge_sort(list(items_by_key))]
+        else:
+            sort_key = (lambda item: item[0]) if key is None else (lambda item: key(item[0]))
+            try:
+                sorted_items = sorted(items, key=sort_key)
+            except TypeError:
+                raise IndexError("Invalid key type! It must be comparable to the Tree keys.")
+
+        return cls.from_sorted(sorted_items, balanced=balanced, key=key)
+
+    def get_values(self, keys, default=__MISSING):
+        """
+            Get the values from a batch of keys, sorting the batch once and searching all keys in a single ordered walk
+        :param keys: iterable with the searched keys
+        :param default: value returned for missing keys (missing keys raise a single error if not provided)
+        :return: list with the values in the same order as the keys
+        """
+        keys = list(keys)
+        try:
+            sort_keys = [self.__get_sort_key(key) for key in keys]
+            sorted_positions = sorted(range(len(keys)), key=sort_keys.__getitem__)
+
+            values = [default] * len(keys)
+            missing_keys = []
+            found_nodes = self.__search_sorted_batch(sort_keys[position] for position in sorted_positions)
+            for position, key_node in zip(sorted_positions, found_nodes):
+                if key_node is None:
+                    missing_keys.append(keys[position])
+                else:
+                    values[position] = key_node.data
+        except TypeError:
+            raise IndexError("Invalid key type! It must be comparable to the Tree keys.")
+
+        if missing_keys and default is self.__MISSING:
+            raise IndexError(f"Invalid keys: {missing_keys}!")
+        return values
+
+    def insert_many(self, items):
+        """
+            Insert a batch of elements, sorting the batch once. All keys are verified before changing the Tree,
+            and a batch bigger than 1/REBUILD_FACTOR of the Tree is merged with its sorted nodes and rebuilt in O(n).
+            Smaller batches are inserted in key order, each descent starting from the path shared with the previous
+            key (only the part of the path changed by rotations is dropped). The sizes (and the heights without
+            balancing) are updated once per changed node after the whole batch is linked
+        :param items: iterable with (key, value) pairs
+        :return: None
+        """
+        items = list(items)
+        for new_key, _ in items:
+            self.__validate_key(new_key)
+
+        try:
+            new_nodes = [TreeNode(new_key, data=new_key_data, sort_key=self.__get_sort_key(new_key))
+                         for new_key, new_key_data in items]
+            new_nodes.sort(key=lambda node: node.sort_key)
+
+            repeated_keys = [node.key for previous_node, node in zip(new_nodes, new_nodes[1:])
+                             if previous_node.sort_key == node.sort_key]
+            found_nodes = self.__search_sorted_batch(node.sort_key for node in new_nodes)
+            repeated_keys += [node.key for node, found_node in zip(new_nodes, found_nodes) if found_node is not None]
+        except TypeError:
+            raise IndexError("Invalid key type! It must be comparable to the Tree keys.")
+
+        if repeated_keys:
+            raise IndexError(f"Keys already exist: {repeated_keys}!")
+
+        if len(new_nodes) * self.REBUILD_FACTOR >= len(self):
+            all_nodes = list(heapq.merge(self.__iter_nodes(), new_nodes, key=lambda node: node.sort_key))
+            self.__root = self.__link_sorted_nodes(all_nodes, 0, len(all_nodes), None)
+            return
+
+        path = []
+        for new_node in new_nodes:
+            _, parent_node = self.__descend_from_path(path, new_node.sort_key)
+            self.__link_node(new_node, parent_node)
+            if not self.__balanced:
+                continue
 
-            self.__add_node(new_key, new_key_data, self.__root)
+            rotated_subtree = self.__rebalance_heights_from(parent_node)
+            if rotated_subtree is not None:
+                while path and path[-1][0] is not rotated_subtree.parent:
+                    path.pop()
+
+        self.__update_paths_from(new_nodes)
 
     def __transplant_node(self, replaced_node:TreeNode, moved_node:TreeNode):
         """
@@ -164,23 +445,165 @@ class BinaryTree:
         if moved_node is not None:
             moved_node.parent = replaced_node.parent
 
+    @staticmethod
+    def __node_height(node: TreeNode):
+        return node.height if node is not None else 0
+
+    @staticmethod
+    def __node_size(node: TreeNode):
+        return node.size if node is not None else 0
+
+    def __update_node(self, node: TreeNode):
+        node.height = 1 + max(self.__node_height(node.left), self.__node_height(node.right))
+        node.size = 1 + self.__node_size(node.left) + self.__node_size(node.right)
+
+    def __rotate_left(self, node: TreeNode):
+        """
+            Move the right child of node to its position, making node its left child
+        :param node: root of the rotated subtree
+        :return: new root of the rotated subtree
+        """
+        pivot = node.right
+        node.right = pivot.left
+        if pivot.left is not None:
+            pivot.left.parent = node
+
+        self.__transplant_node(node, pivot)
+        pivot.left = node
+        node.parent = pivot
+
+        self.__update_node(node)
+        self.__update_node(pivot)
+        return pivot
+
+    def __rotate_right(self, node: TreeNode):
+        """
+            Move the left child of node to its position, making node its right child
+        :param node: root of the rotated subtree
+        :return: new root of the rotated subtree
+        """
+        pivot = node.left
+        node.left = pivot.right
+        if pivot.right is not None:
+            pivot.right.parent = node
+
+        self.__transplant_node(node, pivot)
+        pivot.right = node
+        node.parent = pivot
+
+        self.__update_node(node)
+        self.__update_node(pivot)
+        return pivot
+
+    def __rebalance_from(self, node: TreeNode):
+        """
+            Update the heights and sizes from node up to the root, rotating the subtrees
+            whose children heights differ by more than one (AVL property)
+        :param node: lowest node with a changed subtree
+        :return: None
+        """
+        while node is not None:
+            self.__update_node(node)
+            balance = self.__node_height(node.left) - self.__node_height(node.right)
+
+            if balance > 1:
+                if self.__node_height(node.left.left) < self.__node_height(node.left.right):
+                    self.__rotate_left(node.left)
+                node = self.__rotate_right(node)
+            elif balance < -1:
+                if self.__node_height(node.right.right) < self.__node_height(node.right.left):
+                    self.__rotate_right(node.right)
+                node = self.__rotate_left(node)
+
+            node = node.parent
+
+    def __rebalance_heights_from(self, node: TreeNode):
+        """
+            Restore the AVL property after linking a single node below node, updating only the heights and
+            stopping as soon as a subtree keeps its height (the sizes are left to __update_paths_from)
+        :param node: parent from the linked node
+        :return: root of the rotated subtree (None if no rotation)
+        """
+        while node is not None:
+            previous_height = node.height
+            node.height = 1 + max(self.__node_height(node.left), self.__node_height(node.right))
+            balance = self.__node_height(node.left) - self.__node_height(node.right)
+
+            if balance > 1:
+                if self.__node_height(node.left.left) < self.__node_height(node.left.right):
+                    self.__rotate_left(node.left)
+                return self.__rotate_right(node)
+            if balance < -1:
+                if self.__node_height(node.right.right) < self.__node_height(node.right.left):
+                    self.__rotate_right(node.right)
+                return self.__rotate_left(node)
+
+            if node.height == previous_height:
+                return None
+            node = node.parent
+
+        return None
+
+    def __update_path_from(self, node: TreeNode):
+        """
+            Update the heights and sizes from node up to the root, rebalancing the Tree when it is balanced
+        :param node: lowest node with a changed subtree
+        :return: None
+        """
+        if self.__balanced:
+            self.__rebalance_from(node)
+            return
+
+        while node is not None:
+            self.__update_node(node)
+            node = node.parent
+
+    def __update_paths_from(self, nodes):
+        """
+            Update the heights and sizes from several nodes up to the root, visiting each changed node
+            a single time and always after its changed children
+        :param nodes: lowest nodes with changed subtrees
+        :return: None
+        """
+        changed_nodes = set()
+        for node in nodes:
+            while node is not None and node not in changed_nodes:
+                changed_nodes.add(node)
+                node = node.parent
+
+        stack = [(self.__root, False)] if self.__root in changed_nodes else []
+        while stack:
+            node, children_updated = stack.pop()
+            if children_updated:
+                self.__update_node(node)
+                continue
+
+            stack.append((node, True))
+            for child in (node.left, node.right):
+                if child in changed_nodes:
+                    stack.append((child, False))
+
     def delete_node(self, key_to_delete):
         """
             Delete node with specified key from the Tree
         :param key_to_delete: key from the element to be deleted
         :return: None
         """
-        node_to_delete = self.__search_element(key_to_delete, self.__root)
+        node_to_delete = self.__find_node(key_to_delete)
         if node_to_delete is None:
             raise IndexError("Invalid key!")
 
         if node_to_delete.left is None:
+            lowest_changed_node = node_to_delete.parent
             self.__transplant_node(node_to_delete, node_to_delete.right)
         elif node_to_delete.right is None:
+            lowest_changed_node = node_to_delete.parent
             self.__transplant_node(node_to_delete, node_to_delete.left)
         else:
             subtree_minimum = self.__get_subtree_minimum(node_to_delete.right)
+            lowest_changed_node = subtree_minimum
             if subtree_minimum.parent != node_to_delete:
+                lowest_changed_node = subtree_minimum.parent
                 self.__transplant_node(subtree_minimum, subtree_minimum.right)
                 subtree_minimum.right = node_to_delete.right
                 subtree_minimum.right.parent = subtree_minimum
@@ -188,6 +611,8 @@ class BinaryTree:
             subtree_minimum.left = node_to_delete.left
             node_to_delete.left.parent = subtree_minimum
 
+        self.__update_path_from(lowest_changed_node)
+
     def set_value(self, key, element_data):
         """
             Update the value from an existing element
@@ -195,7 +620,7 @@ class BinaryTree:
         :param element_data: value to be assigned to the node
         :return: None
         """
-        key_node = self.__search_element(key, self.__root)
+        key_node = self.__find_node(key)
         if key_node is None:
             raise IndexError("Invalid key!")
         key_node.data = element_data
@@ -206,34 +631,201 @@ class BinaryTree:
         :param key: key from the node be returned
         :return: value from the requested node
         """
-        key_node = self.__search_element(key, self.__root)
+        key_node = self.__find_node(key)
         if key_node is None:
             raise IndexError("Invalid key!")
         return key_node.data
 
-    def __in_order_walk_ascending(self, node: TreeNode, result: list):
-        if node is not None:
-            self.__in_order_walk_ascending(node.left, result)
-            result.append(node)
-            self.__in_order_walk_ascending(node.right, result)
+    def __iter_nodes(self, start_sort_key=None, reverse=False):
+        """
+            Lazily walk the nodes in order, keeping only the path to the next node in an explicit stack
+        :param start_sort_key: nodes before this sort key (after it, when reversed) are skipped
+        :param reverse: The reverse flag can be set to walk in descending order
+        :return: generator of nodes
+        """
+        stack = []
+        node = self.__root
+        try:
+            while node is not None:
+                if start_sort_key is None or (node.sort_key <= start_sort_key if reverse else node.sort_key >= start_sort_key):
+                    stack.append(node)
+                    node = node.right if reverse else node.left
+                else:
+                    node = node.left if reverse else node.right
+        except TypeError:
+            raise IndexError("Invalid key type! It must be comparable to the Tree keys.")
 
-    def __in_order_walk_descending(self, node: TreeNode, result: list):
-        if node is not None:
-            self.__in_order_walk_descending(node.right, result)
-            result.append(node)
-            self.__in_order_walk_descending(node.left, result)
+        while stack:
+            node = stack.pop()
+            yield node
+            node = node.left if reverse else node.right
+            while node is not None:
+                stack.append(node)
+                node = node.right if reverse else node.left
 
-    def __pre_order_walk(self, node: TreeNode, result: list):
-        if node is not None:
+    @staticmethod
+    def __pre_order_walk(node: TreeNode, result: list):
+        stack = [node] if node is not None else []
+        while stack:
+            node = stack.pop()
             result.append(node)
-            self.__pre_order_walk(node.left, result)
-            self.__pre_order_walk(node.right, result)
+            if node.right is not None:
+                stack.append(node.right)
+            if node.left is not None:
+                stack.append(node.left)
 
-    def __post_order_walk(self, node: TreeNode, result: list):
-        if node is not None:
-            self.__post_order_walk(node.left, result)
-            self.__post_order_walk(node.right, result)
-            result.append(node)
+    @staticmethod
+    def __post_order_walk(node: TreeNode, result: list):
+        stack = [node] if node is not None else []
+        reversed_result = []
+        while stack:
+            node = stack.pop()
+            reversed_result.append(node)
+            if node.left is not None:
+                stack.append(node.left)
+            if node.right is not None:
+                stack.append(node.right)
+        result.extend(reversed(reversed_result))
+
+    def iter_items(self, reverse=False):
+        """
+            Lazily iterate over the Tree elements in key order
+        :param reverse: The reverse flag can be set to iterate in descending order
+        :return: generator of (key, value) pairs
+        """
+        for node in self.__iter_nodes(reverse=reverse):
+            yield node.key, node.data
+
+    def iter_range(self, lower_key=None, upper_key=None):
+        """
+            Lazily iterate over the elements with keys between the bounds (both inclusive)
+        :param lower_key: smallest key to be returned (no lower bound if None)
+        :param upper_key: biggest key to be returned (no upper bound if None)
+        :return: generator of (key, value) pairs in ascending order
+        """
+        lower_sort_key = None if lower_key is None else self.__get_sort_key(lower_key)
+        upper_sort_key = None if upper_key is None else self.__get_sort_key(upper_key)
+
+        for node in self.__iter_nodes(lower_sort_key):
+            try:
+                if upper_sort_key is not None and node.sort_key > upper_sort_key:
+                    return
+            except TypeError:
+                raise IndexError("Invalid key type! It must be comparable to the Tree keys.")
+            yield node.key, node.data
+
+    def keys_from(self, start_key):
+        """
+            Lazily iterate over the keys starting at the first key not smaller than start_key
+        :param start_key: key where the iteration starts
+        :return: generator of keys in ascending order
+        """
+        for node in self.__iter_nodes(self.__get_sort_key(start_key)):
+            yield node.key
+
+    def __find_bound(self, key, lower):
+        """
+            Descend the Tree a single time looking for the closest key on one side of the provided key
+        :param key: reference key (it does not need to be in the Tree)
+        :param lower: search the closest key not bigger (True) or not smaller (False) than the reference
+        :return: closest key or None
+        """
+        searched_sort_key = self.__get_sort_key(key)
+        bound_node = None
+        current_node = self.__root
+
+        try:
+            while current_node is not None:
+                if searched_sort_key == current_node.sort_key:
+                    return current_node.key
+                if (current_node.sort_key < searched_sort_key) == lower:
+                    bound_node = current_node
+                if current_node.sort_key < searched_sort_key:
+                    current_node = current_node.right
+                else:
+                    current_node = current_node.left
+        except TypeError:
+            raise IndexError("Invalid key type! It must be comparable to the Tree keys.")
+
+        return None if bound_node is None else bound_node.key
+
+    def floor(self, key):
+        """
+            Get the biggest key in the Tree not bigger than the provided key
+        :param key: reference key (it does not need to be in the Tree)
+        :return: floor key or None
+        """
+        return self.__find_bound(key, lower=True)
+
+    def ceiling(self, key):
+        """
+            Get the smallest key in the Tree not smaller than the provided key
+        :param key: reference key (it does not need to be in the Tree)
+        :return: ceiling key or None
+        """
+        return self.__find_bound(key, lower=False)
+
+    def __count_smaller(self, key, inclusive):
+        """
+            Descend the Tree a single time adding up the sizes from the subtrees left behind
+        :param key: reference key (it does not need to be in the Tree)
+        :param inclusive: also count the key itself when it is in the Tree
+        :return: amount of keys smaller than (or equal to) the reference key
+        """
+        searched_sort_key = self.__get_sort_key(key)
+        smaller_keys = 0
+        current_node = self.__root
+
+        try:
+            while current_node is not None:
+                if current_node.sort_key < searched_sort_key or (inclusive and current_node.sort_key == searched_sort_key):
+                    smaller_keys += self.__node_size(current_node.left) + 1
+                    current_node = current_node.right
+                else:
+                    current_node = current_node.left
+        except TypeError:
+            raise IndexError("Invalid key type! It must be comparable to the Tree keys.")
+
+        return smaller_keys
+
+    def rank(self, key):
+        """
+            Get the amount of keys in the Tree smaller than the provided key in O(height)
+        :param key: reference key (it does not need to be in the Tree)
+        :return: rank from the key, which is its position in the sorted keys when it is in the Tree
+        """
+        return self.__count_smaller(key, inclusive=False)
+
+    def select(self, index:int):
+        """
+            Get the key in defined position from the sorted keys in O(height)
+        :param index: position from the key in ascending order (negative values count from the end)
+        :return: key
+        """
+        if index < 0:
+            index += len(self)
+        if index < 0 or index >= len(self):
+            raise IndexError("Index out of range!")
+
+        current_node = self.__root
+        while True:
+            left_size = self.__node_size(current_node.left)
+            if index == left_size:
+                return current_node.key
+            if index < left_size:
+                current_node = current_node.left
+            else:
+                index -= left_size + 1
+                current_node = current_node.right
+
+    def count_range(self, lower_key, upper_key):
+        """
+            Count the keys between the bounds (both inclusive) in O(height)
+        :param lower_key: smallest key to be counted
+        :param upper_key: biggest key to be counted
+        :return: amount of keys in the range
+        """
+        return max(0, self.__count_smaller(upper_key, inclusive=True) - self.__count_smaller(lower_key, inclusive=False))
 
     def get_sorted_tree_keys(self, reverse=False):
         """
@@ -241,14 +833,7 @@ class BinaryTree:
         :param reverse: The reverse flag can be set to sort in descending order
         :return: sorted nodes keys
         """
-        sorted_nodes = []
-        if reverse:
-            self.__in_order_walk_descending(self.__root, sorted_nodes)
-        else:
-            self.__in_order_walk_ascending(self.__root, sorted_nodes)
-
-        sorted_keys = [node.key for node in sorted_nodes]
-        return sorted_keys
+        return [node.key for node in self.__iter_nodes(reverse=reverse)]
 
     def get_sorted_tree_values(self, reverse=False):
         """
@@ -256,14 +841,18 @@ class BinaryTree:
         :param reverse: The reverse flag can be set to sort in descending order
         :return: sorted nodes values
         """
-        sorted_nodes = []
-        if reverse:
-            self.__in_order_walk_descending(self.__root, sorted_nodes)
-        else:
-            self.__in_order_walk_ascending(self.__root, sorted_nodes)
+        return [node.data for node in self.__iter_nodes(reverse=reverse)]
+
+    def dump(self, path):
+        """
+            Write the Tree elements to a binary file that can be served by a MappedBinaryTree
+        :param path: path of the file to be written
+        :return: None
+        """
+        dump_sorted_items(path, self.iter_items(), key_sorted=self.__key_function is not None)
 
-        sorted_values = [node.data for node in sorted_nodes]
-        return sorted_values
+    def __len__(self):
+        return self.__node_size(self.__root)
 
     def __str__(self):
         tree_string = "Tree"
@@ -0,0 +1,178 @@
+# This file provides thread-safe and asyncio-compatible versions of the basic data structures
+import asyncio
+import threading
+
+from src.data_structures.basic_data_structures import LinkedList, Queue, Stack
+
+
+class ConcurrentContainer:
+    """
+        Base class guarding a Queue or Stack with a lock, allowing threads to wait for items or free space
+    """
+
+    def __init__(self, container, max_size=None):
+        if max_size is not None and max_size < 1:
+            raise ValueError("Invalid max size!")
+
+        self._container = container
+        self._max_size = max_size
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+
+    def __is_full(self):
+        return self._max_size is not None and len(self._container) >= self._max_size
+
+    def is_empty(self):
+        with self._lock:
+            return self._container.is_empty()
+
+    def add(self, new_value, timeout=None):
+        """
+            Add a new item, waiting for free space when the container is full
+        :param new_value: value to be added
+        :param timeout: max time (s) to wait for free space (wait forever if None)
+        :return: None
+        """
+        with self._not_full:
+            if not self._not_full.wait_for(lambda: not self.__is_full(), timeout):
+                raise TimeoutError("Timeout waiting for free space!")
+            self._container.add(new_value)
+            self._not_empty.notify()
+
+    def try_add(self, new_value):
+        """
+            Add a new item only if there is free space, without waiting
+        :param new_value: value to be added
+        :return: True if the value was added
+        """
+        with self._lock:
+            if self.__is_full():
+                return False
+            self._container.add(new_value)
+            self._not_empty.notify()
+            return True
+
+    def remove(self, timeout=None):
+        """
+            Remove an item, waiting for one when the container is empty
+        :param timeout: max time (s) to wait for an item (wait forever if None)
+        :return: value from the removed item
+        """
+        with self._not_empty:
+            if not self._not_empty.wait_for(lambda: not self._container.is_empty(), timeout):
+                raise TimeoutError("Timeout waiting for an item!")
+            removed_value = self._container.remove()
+            self._not_full.notify()
+            return removed_value
+
+    def try_remove(self, default=None):
+        """
+            Remove an item only if one is available, without waiting
+        :param default: value returned when the container is empty
+        :return: value from the removed item or default
+        """
+        with self._lock:
+            if self._container.is_empty():
+                return default
+            removed_value = self._container.remove()
+            self._not_full.notify()
+            return removed_value
+
+    def drain(self, max_items=None):
+        """
+            Remove all available items (up to max_items) holding the lock a single time
+        :param max_items: max amount of items to be removed (all items if None)
+        :return: list with the removed values
+        """
+        with self._lock:
+            removed_values = []
+            while not self._container.is_empty() and (max_items is None or len(removed_values) < max_items):
+                removed_values.append(self._container.remove())
+            self._not_full.notify(len(removed_values))
+            return removed_values
+
+    def __len__(self):
+        with self._lock:
+            return len(self._container)
+
+    def __str__(self):
+        with self._lock:
+            return self._container.__str__()
+
+
+class ConcurrentQueue(ConcurrentContainer):
+
+    def __init__(self, max_size=None, storage=LinkedList):
+        super().__init__(Queue(storage=storage), max_size)
+
+
+class ConcurrentStack(ConcurrentContainer):
+
+    def __init__(self, max_size=None, storage=LinkedList):
+        super().__init__(Stack(storage=storage), max_size)
+
+
+class AsyncQueue:
+    """
+        Queue class for asyncio producers and consumers running in the same event loop
+    """
+
+    def __init__(self, max_size=None, storage=LinkedList):
+        if max_size is not None and max_size < 1:
+            raise ValueError("Invalid max size!")
+
+        self.__queue = Queue(storage=storage)
+        self.__max_size = max_size
+        self.__lock = asyncio.Lock()
+        self.__not_empty = asyncio.Condition(self.__lock)
+        self.__not_full = asyncio.Condition(self.__lock)
+
+    def __is_full(self):
+        return self.__max_size is not None and len(self.__queue) >= self.__max_size
+
+    def is_empty(self):
+        return self.__queue.is_empty()
+
+    async def put(self, new_value, timeout=None):
+        """
+            Add a new item, waiting for free space when the queue is full
+        :param new_value: value to be added
+        :param timeout: max time (s) to wait for free space (wait forever if None)
+        :return: None
+        """
+        async with self.__not_full:
+            await asyncio.wait_for(self.__not_full.wait_for(lambda: not self.__is_full()), timeout)
+            self.__queue.add(new_value)
+            self.__not_empty.notify()
+
+    async def get(self, timeout=None):
+        """
+            Remove an item, waiting for one when the queue is empty
+        :param timeout: max time (s) to wait for an item (wait forever if None)
+        :return: value from the removed item
+        """
+        async with self.__not_empty:
+            await asyncio.wait_for(self.__not_empty.wait_for(lambda: not self.__queue.is_empty()), timeout)
+            removed_value = self.__queue.remove()
+            self.__not_full.notify()
+            return removed_value
+
+    async def drain(self, max_items=None):
+        """
+            Remove all available items (up to max_items) without waiting for new ones
+        :param max_items: max amount of items to be removed (all items if None)
+        :return: list with the removed values
+        """
+        async with self.__lock:
+            removed_values = []
+            while not self.__queue.is_empty() and (max_items is None or len(removed_values) < max_items):
+                removed_values.append(self.__queue.remove())
+            self.__not_full.notify(len(removed_values))
+            return removed_values
+
+    def __len__(self):
+        return len(self.__queue)
+
+    def __str__(self):
+        return self.__queue.__str__()
@@ -1,12 +1,292 @@
 import abc
 import copy
+import numbers
+from array import array
+from collections.abc import Mapping, Sequence, Set, Sized
+from itertools import islice
+from types import MappingProxyType
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class GraphView:
+    """
+        Base class for read-only views over a graph structure, which are created in O(1)
+        and become invalid as soon as the graph changes (its version is incremented)
+    """
+
+    def __init__(self, graph):
+        self._graph = graph
+        self._version = graph.get_version()
+
+    def _check_version(self):
+        if self._graph.get_version() != self._version:
+            raise RuntimeError("Graph changed after the view was created!")
+
+
+class NeighborsView(Set):
+    """
+        Read-only view over the neighbors from a vertice of an Adjacency List
+    """
+
+    def __init__(self, neighbors, graph_view:GraphView):
+        self.__neighbors = neighbors
+        self.__graph_view = graph_view
+
+    def __contains__(self, neighbor_key):
+        self.__graph_view._check_version()
+        return neighbor_key in self.__neighbors
+
+    def __iter__(self):
+        self.__graph_view._check_version()
+        return iter(self.__neighbors)
+
+    def __len__(self):
+        self.__graph_view._check_version()
+        return len(self.__neighbors)
+
+    def __repr__(self):
+        return f"{self.__neighbors}"
+
+
+class WeightedNeighborsView(Mapping):
+    """
+        Read-only view mapping the neighbors from a vertice of a Weighted Adjacency List to the edges weights
+    """
+
+    def __init__(self, neighbors, graph_view:GraphView):
+        self.__neighbors = neighbors
+        self.__graph_view = graph_view
+
+    def __getitem__(self, neighbor_key):
+        self.__graph_view._check_version()
+        return self.__neighbors[neighbor_key]
+
+    def __iter__(self):
+        self.__graph_view._check_version()
+        return iter(self.__neighbors)
+
+    def __len__(self):
+        self.__graph_view._check_version()
+        return len(self.__neighbors)
+
+    def items(self):
+        self.__graph_view._check_version()
+        return self.__neighbors.items()
+
+    def __repr__(self):
+        return f"{self.__neighbors}"
+
+
+class AdjListGraphView(GraphView, Mapping):
+    """
+        Read-only view mapping each vertice from an Adjacency List to the view of its neighbors
+    """
+
+    def __init__(self, graph, adjacency:dict, neighbors_view=NeighborsView):
+        super().__init__(graph)
+        self.__adjacency = adjacency
+        self.__neighbors_view = neighbors_view
+
+    def __getitem__(self, vertice_key):
+        self._check_version()
+        return self.__neighbors_view(self.__adjacency[vertice_key], self)
+
+    def __iter__(self):
+        self._check_version()
+        return iter(self.__adjacency)
+
+    def __len__(self):
+        self._check_version()
+        return len(self.__adjacency)
+
+    def __repr__(self):
+        return f"{self.__adjacency}"
+
+
+class MatrixRowView(Sequence):
+    """
+        Read-only view over the edges weights leaving a vertice of an Adjacency Matrix
+    """
+
+    def __init__(self, row, size, graph_view:GraphView):
+        self.__row = row
+        self.__size = size
+        self.__graph_view = graph_view
+
+    def __getitem__(self, dest_idx):
+        self.__graph_view._check_version()
+        if dest_idx < 0:
+            dest_idx += self.__size
+        if dest_idx < 0 or dest_idx >= self.__size:
+            raise IndexError("Index out of range!")
+        return self.__row[dest_idx]
+
+    def __iter__(self):
+        self.__graph_view._check_version()
+        return islice(self.__row, self.__size)
+
+    def __len__(self):
+        self.__graph_view._check_version()
+        return self.__size
+
+    def __eq__(self, other):
+        if not isinstance(other, (list, tuple, Sequence)):
+            return NotImplemented
+        return list(self) == list(other)
+
+    def __repr__(self):
+        row = self.__row[:self.__size]
+        return f"{row.tolist() if np is not None and isinstance(row, np.ndarray) else row}"
+
+
+class AdjMatrixGraphView(GraphView, Sequence):
+    """
+        Read-only view over the rows from an Adjacency Matrix (hiding the rows and columns reserved for growth)
+    """
+
+    def __init__(self, graph, matrix, size):
+        super().__init__(graph)
+        self.__matrix = matrix
+        self.__size = size
+
+    def __getitem__(self, source_idx):
+        self._check_version()
+        if source_idx < 0:
+            source_idx += self.__size
+        if source_idx < 0 or source_idx >= self.__size:
+            raise IndexError("Index out of range!")
+        return MatrixRowView(self.__matrix[source_idx], self.__size, self)
+
+    def __len__(self):
+        self._check_version()
+        return self.__size
+
+    def __eq__(self, other):
+        if not isinstance(other, (list, tuple, Sequence)):
+            return NotImplemented
+        return list(self) == list(other)
+
+    def __repr__(self):
+        return f"{[row for row in self]}"
+
+
+class CSRGraph:
+    """
+        Immutable graph in Compressed Sparse Row format: vertices get dense ids following the
+        key order and the neighbors of the vertice id are indices[indptr[id]:indptr[id + 1]],
+        with the edges weights at the same positions of weights. The arrays are contiguous
+        machine values, so traversals skip the per-neighbor hashing and the graph is cheap
+        to pickle and send to workers.
+    """
+
+    def __init__(self, vertice_keys, indptr, indices, weights):
+        if len(indptr) != len(vertice_keys) + 1 or len(indices) != len(weights) or indptr[-1] != len(indices):
+            raise ValueError("Invalid CSR arrays!")
+
+        self.__keys = tuple(vertice_keys)
+        self.__key_idx = {key: idx for idx, key in enumerate(self.__keys)}
+        if len(self.__key_idx) != len(self.__keys):
+            raise ValueError("Vertice keys must be unique!")
+        self.__indptr = array('q', indptr)
+        self.__indices = array('q', indices)
+        self.__weights = array('d', weights)
+
+    @classmethod
+    def from_adjacency(cls, adjacency:Mapping, default_weight=1):
+        """
+            Create a CSR graph from a mapping of each vertice to its neighbors
+        :param adjacency: mapping of vertice key to a set of neighbor keys or to a mapping of neighbor key to edge weight
+        :param default_weight: weight given to the edges of neighbors stored without weights
+        :return: new CSR graph
+        """
+        key_idx = {key: idx for idx, key in enumerate(adjacency)}
+        indptr = array('q', [0])
+        indices = array('q')
+        weights = array('d')
+        for neighbors in adjacency.values():
+            indices.extend(key_idx[neighbor_key] for neighbor_key in neighbors)
+            if isinstance(neighbors, Mapping):
+                weights.extend(neighbors.values())
+            else:
+                weights.extend([default_weight] * len(neighbors))
+            indptr.append(len(indices))
+
+        return cls(list(adjacency), indptr, indices, weights)
+
+    @property
+    def indptr(self):
+        """
+            Read-only offsets from the neighbors of each vertice id (V + 1 entries)
+        """
+        return memoryview(self.__indptr).toreadonly()
+
+    @property
+    def indices(self):
+        """
+            Read-only neighbor ids from all vertices (E entries)
+        """
+        return memoryview(self.__indices).toreadonly()
+
+    @property
+    def weights(self):
+        """
+            Read-only edges weights, aligned with indices (E entries)
+        """
+        return memoryview(self.__weights).toreadonly()
+
+    def get_vertice_keys(self):
+        """
+            Get the vertice keys ordered by their ids
+        :return: tuple of keys
+        """
+        return self.__keys
+
+    def get_key_idx_map(self):
+        """
+            Return a read-only view from the mapping of key name to vertice id
+        :return: key to id map
+        """
+        return MappingProxyType(self.__key_idx)
+
+    def get_neighbors(self, vertice_key):
+        """
+            Get the neighbors from a vertice with the weights from the edges reaching them
+        :param vertice_key: key associated to the vertice
+        :return: list of (neighbor key, weight) pairs
+        """
+        if vertice_key not in self.__key_idx:
+            raise KeyError("Invalid vertice_key!")
+
+        vertice_idx = self.__key_idx[vertice_key]
+        start, stop = self.__indptr[vertice_idx], self.__indptr[vertice_idx + 1]
+        return [(self.__keys[self.__indices[position]], self.__weights[position]) for position in range(start, stop)]
+
+    def get_edges_amount(self):
+        """
+            Amount of edges from the graph
+        :return: edges amount
+        """
+        return len(self.__indices)
+
+    def __len__(self):
+        return len(self.__keys)
+
+    def __str__(self):
+        return f"{ {key: [neighbor for neighbor, _ in self.get_neighbors(key)] for key in self.__keys} }"
 
 
 class GraphInterface(metaclass=abc.ABCMeta):
     _graph = None
+    _version = 0
 
     @classmethod
     def __subclasshook__(cls, __subclass):
+        if cls is not GraphInterface:
+            return NotImplemented
         return (hasattr(__subclass, '_graph') and
                 hasattr(__subclass, 'add_vertice') and
                 callable(__subclass.add_vertice) and
@@ -58,22 +338,49 @@ class GraphInterface(metaclass=abc.ABCMeta):
         """
         pass
 
+    def get_version(self):
+        """
+            Counter incremented by every change to the graph, invalidating the views created before it
+        :return: graph version
+        """
+        return self._version
+
+    @abc.abstractmethod
     def get_graph(self):
         """
-            Return the graph structure
-        :return: graph
+            Return a read-only view over the graph structure, created in O(1) without copying it
+        :return: graph view
         """
-        return copy.deepcopy(self._graph)
+        pass
 
+    @abc.abstractmethod
+    def freeze(self):
+        """
+            Create an immutable CSR copy from the graph, optimized for read-only traversals
+        :return: CSR graph
+        """
+        pass
+
+    def copy(self):
+        """
+            Create an independent (deep) copy from the graph
+        :return: new graph
+        """
+        return copy.deepcopy(self)
 
     def __str__(self):
         return f"{self._graph}"
 
 
 class AdjListGraph(GraphInterface):
+    """
+        Adjacency List graph keeping, along with the neighbors (out-edges) of each vertice, the set of
+        vertices pointing to it (in-edges), so deleting a vertice only visits its actual neighbors
+    """
 
     def __init__(self):
         self._graph = {}
+        self._reverse_graph = {}
 
     def add_vertice(self, vertice_key):
         """
@@ -85,17 +392,25 @@ class AdjListGraph(GraphInterface):
             raise KeyError("Vertice already in Graph!")
 
         self._graph[vertice_key] = set()
+        self._reverse_graph[vertice_key] = set()
+        self._version += 1
 
     def delete_vertice(self, deleted_vertice_key):
         """
-            Delete vertice from the graph
+            Delete vertice from the graph in O(degree), visiting only the vertices connected to it
         :param deleted_vertice_key: key associated to the vertice to be deleted
         :return: None
         """
-        for v_key in self._graph.keys():
-            self._graph[v_key].discard(deleted_vertice_key)
+        if deleted_vertice_key not in self._graph:
+            raise KeyError("Invalid vertice_key!")
 
-        self._graph.pop(deleted_vertice_key)
+        for predecessor_key in self._reverse_graph.pop(deleted_vertice_key):
+            self._graph[predecessor_key].discard(deleted_vertice_key)
+        for neighbor_key in self._graph.pop(deleted_vertice_key):
+            if neighbor_key != deleted_vertice_key:
+                self._reverse_graph[neighbor_key].discard(deleted_vertice_key)
+
+        self._version += 1
 
     def add_edge(self, source_key, dest_key):
         """
@@ -110,6 +425,8 @@ class AdjListGraph(GraphInterface):
             raise KeyError("Invalid dest_key!")
 
         self._graph[source_key].add(dest_key)
+        self._reverse_graph[dest_key].add(source_key)
+        self._version += 1
 
     def delete_edge(self, source_key, dest_key):
         """
@@ -118,14 +435,58 @@ class AdjListGraph(GraphInterface):
         :param dest_key: key associated with the destination node
         :return: None
         """
-        self._graph[source_key].discard(dest_key)
+        if dest_key in self._graph[source_key]:
+            self._graph[source_key].discard(dest_key)
+            self._reverse_graph[dest_key].discard(source_key)
+        self._version += 1
 
+    def get_graph(self):
+        """
+            Return a read-only view mapping each vertice to its neighbors
+        :return: graph view
+        """
+        return AdjListGraphView(self, self._graph)
 
-class AdjMatrixGraph(GraphInterface):
+    def get_reverse_graph(self):
+        """
+            Return a read-only view mapping each vertice to its predecessors (the graph with all edges reversed)
+        :return: graph view
+        """
+        return AdjListGraphView(self, self._reverse_graph)
 
-    def __init__(self):
-        self._graph = []
-        self._key_map = []
+    def predecessors(self, vertice_key):
+        """
+            Get the vertices with an edge pointing to the vertice
+        :param vertice_key: key associated to the vertice
+        :return: read-only view of the predecessor keys
+        """
+        if vertice_key not in self._reverse_graph:
+            raise KeyError("Invalid vertice_key!")
+        return self.get_reverse_graph()[vertice_key]
+
+    def in_degree(self, vertice_key):
+        """
+            Amount of edges pointing to the vertice, in O(1)
+        :param vertice_key: key associated to the vertice
+        :return: in-degree
+        """
+        if vertice_key not in self._reverse_graph:
+            raise KeyError("Invalid vertice_key!")
+        return len(self._reverse_graph[vertice_key])
+
+    def freeze(self):
+        """
+            Create an immutable CSR copy from the graph, with all edges weights equal to 1
+        :return: CSR graph
+        """
+        return CSRGraph.from_adjacency(self._graph)
+
+
+class WeightedAdjListGraph(AdjListGraph):
+    """
+        Adjacency List graph mapping the neighbors of each vertice to the weights from the edges
+        reaching them, so weighted graphs take memory proportional to E instead of the V^2 of a matrix
+    """
 
     def add_vertice(self, vertice_key):
         """
@@ -133,48 +494,216 @@ class AdjMatrixGraph(GraphInterface):
         :param vertice_key: key to associate to this vertice
         :return: None
         """
-        if vertice_key in self._key_map:
+        if vertice_key in self._graph.keys():
             raise KeyError("Vertice already in Graph!")
 
-        self._key_map.append(vertice_key)
-
-        new_vertice_edges = [0] * (len(self._graph))
-        self._graph.append(new_vertice_edges)
-
-        for vertice in self._graph:
-            vertice.append(0)
+        self._graph[vertice_key] = {}
+        self._reverse_graph[vertice_key] = set()
+        self._version += 1
 
     def delete_vertice(self, deleted_vertice_key):
         """
-            Delete vertice from the graph
+            Delete vertice from the graph in O(degree), visiting only the vertices connected to it
         :param deleted_vertice_key: key associated to the vertice to be deleted
         :return: None
         """
-        vertice_idx = self._key_map.index(deleted_vertice_key)
+        if deleted_vertice_key not in self._graph:
+            raise KeyError("Invalid vertice_key!")
 
-        for graph_rows in self._graph:
-            graph_rows.pop(vertice_idx)
+        for predecessor_key in self._reverse_graph.pop(deleted_vertice_key):
+            self._graph[predecessor_key].pop(deleted_vertice_key, None)
+        for neighbor_key in self._graph.pop(deleted_vertice_key):
+            if neighbor_key != deleted_vertice_key:
+                self._reverse_graph[neighbor_key].discard(deleted_vertice_key)
 
-        self._graph.pop(vertice_idx)
-        self._key_map.remove(deleted_vertice_key)
+        self._version += 1
 
     def add_edge(self, source_key, dest_key, weight=1):
         """
-            Include a new edge between source and destination nodes
-        :param weight: the cost/weight from this edge
+            Include a new edge between source and destination nodes, replacing the weight of an existing edge
         :param source_key: key associated with the source node
         :param dest_key: key associated with the destination node
+        :param weight: the cost/weight from this edge
         :return: None
         """
-        if source_key not in self._key_map:
+        if source_key not in self._graph.keys():
             raise KeyError("Invalid source_key!")
-        elif dest_key not in self._key_map:
+        elif dest_key not in self._graph.keys():
             raise KeyError("Invalid dest_key!")
 
-        source_idx = self._key_map.index(source_key)
-        dest_idx = self._key_map.index(dest_key)
+        self._graph[source_key][dest_key] = weight
+        self._reverse_graph[dest_key].add(source_key)
+        self._version += 1
+
+    def delete_edge(self, source_key, dest_key):
+        """
+            Delete a new edge between source and destination nodes
+        :param source_key: key associated with the source node
+        :param dest_key: key associated with the destination node
+        :return: None
+        """
+        if dest_key in self._graph[source_key]:
+            del self._graph[source_key][dest_key]
+            self._reverse_graph[dest_key].discard(source_key)
+        self._version += 1
+
+    def get_graph(self):
+        """
+            Return a read-only view mapping each vertice to the mapping of its neighbors to the edges weights
+        :return: graph view
+        """
+        return AdjListGraphView(self, self._graph, neighbors_view=WeightedNeighborsView)
+
+    def freeze(self):
+        """
+            Create an immutable CSR copy from the graph, keeping the edges weights
+        :return: CSR graph
+        """
+        return CSRGraph.from_adjacency(self._graph)
+
+
+class AdjMatrixGraph(GraphInterface):
+    """
+        Adjacency Matrix graph keeping a persistent key to index map. The matrix is stored as Python
+        lists with exactly one entry per vertice or, when a dtype is provided, as a NumPy array of that
+        dtype (NumPy must be installed). Only the NumPy matrix reserves rows and columns for new
+        vertices, doubling its capacity when full, which avoids copying the array on every new vertice
+        at the cost of up to 4x the memory of the used entries right after growing. Providing the
+        expected amount of vertices as capacity avoids both the copies and the extra memory.
+    """
+    INITIAL_CAPACITY = 16
+
+    def __init__(self, dtype=None, capacity=INITIAL_CAPACITY):
+        if dtype is not None and np is None:
+            raise ImportError("NumPy is required to create a typed Adjacency Matrix!")
+        if capacity < 1:
+            raise ValueError("Invalid capacity!")
+
+        self._dtype = dtype
+        self._capacity = capacity
+        self._key_map = []
+        self._key_idx = {}
+        if dtype is None:
+            self._graph = []
+        else:
+            self._graph = np.zeros((self._capacity, self._capacity), dtype=dtype)
+
+    def __grow(self):
+        """
+            Double the NumPy matrix capacity, keeping the current edges
+        :return: None
+        """
+        new_capacity = 2 * self._capacity
+        new_graph = np.zeros((new_capacity, new_capacity), dtype=self._dtype)
+        new_graph[:self._capacity, :self._capacity] = self._graph
+        self._graph = new_graph
+        self._capacity = new_capacity
+
+    @staticmethod
+    def is_edge_weight(weight):
+        """
+            Verifies if a matrix entry represents an edge (only positive weights do). Works element-wise on NumPy arrays.
+        :param weight: matrix entry
+        :return: edge status
+        """
+        return weight > 0
+
+    def __get_idx(self, vertice_key, key_name):
+        if vertice_key not in self._key_idx:
+            raise KeyError(f"Invalid {key_name}!")
+        return self._key_idx[vertice_key]
+
+    def add_vertice(self, vertice_key):
+        """
+            Include a new vertice to the graph, adding its column to every list row in O(V) or taking
+            a reserved row and column from the NumPy matrix (growing it when full)
+        :param vertice_key: key to associate to this vertice
+        :return: None
+        """
+        if vertice_key in self._key_idx:
+            raise KeyError("Vertice already in Graph!")
+
+        if self._dtype is None:
+            for row in self._graph:
+                row.append(0)
+            self._graph.append([0] * (len(self._key_map) + 1))
+        elif len(self._key_map) == self._capacity:
+            self.__grow()
+
+        self._key_idx[vertice_key] = len(self._key_map)
+        self._key_map.append(vertice_key)
+        self._version += 1
+
+    def delete_vertice(self, deleted_vertice_key):
+        """
+            Delete vertice from the graph in O(V), moving the last vertice to the index of the deleted one
+        :param deleted_vertice_key: key associated to the vertice to be deleted
+        :return: None
+        """
+        vertice_idx = self.__get_idx(deleted_vertice_key, "vertice_key")
+        last_idx = len(self._key_map) - 1
+        last_key = self._key_map[last_idx]
+
+        if self._dtype is None:
+            last_row = self._graph.pop()
+            if vertice_idx < last_idx:
+                self._graph[vertice_idx] = last_row
+            for row in self._graph:
+                last_weight = row.pop()
+                if vertice_idx < last_idx:
+                    row[vertice_idx] = last_weight
+        else:
+            self._graph[vertice_idx, :] = self._graph[last_idx, :]
+            self._graph[:, vertice_idx] = self._graph[:, last_idx]
+            self._graph[last_idx, :] = 0
+            self._graph[:, last_idx] = 0
+
+        self._key_map[vertice_idx] = last_key
+        self._key_idx[last_key] = vertice_idx
+        self._key_map.pop()
+        del self._key_idx[deleted_vertice_key]
+        self._version += 1
+
+    def add_edge(self, source_key, dest_key, weight=1):
+        """
+            Include a new edge between source and destination nodes
+        :param weight: the cost/weight from this edge
+        :param source_key: key associated with the source node
+        :param dest_key: key associated with the destination node
+        :return: None
+        """
+        source_idx = self.__get_idx(source_key, "source_key")
+        dest_idx = self.__get_idx(dest_key, "dest_key")
 
         self._graph[source_idx][dest_idx] = weight
+        self._version += 1
+
+    def add_edges(self, source_keys, dest_keys, weights=1):
+        """
+            Include a batch of edges, scattering all weights in a single vectorized assignment on NumPy matrices
+        :param source_keys: keys associated with the source nodes
+        :param dest_keys: keys associated with the destination nodes (same length as source_keys)
+        :param weights: weight shared by all edges or one weight per edge
+        :return: None
+        """
+        source_idxs = [self.__get_idx(source_key, "source_key") for source_key in source_keys]
+        dest_idxs = [self.__get_idx(dest_key, "dest_key") for dest_key in dest_keys]
+        if len(source_idxs) != len(dest_idxs):
+            raise ValueError("Source and destination keys must have the same length!")
+
+        is_scalar_weight = isinstance(weights, numbers.Number)
+        if not is_scalar_weight:
+            weights = weights if isinstance(weights, Sized) else list(weights)
+            if len(weights) != len(source_idxs):
+                raise ValueError("Weights must have the same length as the edges!")
+
+        if self._dtype is not None:
+            self._graph[np.asarray(source_idxs, dtype=np.intp), np.asarray(dest_idxs, dtype=np.intp)] = weights
+        else:
+            edge_weights = [weights] * len(source_idxs) if is_scalar_weight else weights
+            for source_idx, dest_idx, weight in zip(source_idxs, dest_idxs, edge_weights):
+                self._graph[source_idx][dest_idx] = weight
+        self._version += 1
 
     def delete_edge(self, source_key, dest_key):
         """
@@ -183,20 +712,51 @@ class AdjMatrixGraph(GraphInterface):
         :param dest_key: key associated with the destination node
         :return: None
         """
-        source_idx = self._key_map.index(source_key)
-        dest_key = self._key_map.index(dest_key)
+        source_idx = self.__get_idx(source_key, "source_key")
+        dest_idx = self.__get_idx(dest_key, "dest_key")
+
+        self._graph[source_idx][dest_idx] = 0
+        self._version += 1
 
-        self._graph[source_idx][dest_key] = 0
+    def get_graph(self):
+        """
+            Return a read-only view over the matrix rows
+        :return: graph view
+        """
+        return AdjMatrixGraphView(self, self._graph, len(self._key_map))
 
     def get_key_idx_map(self):
         """
-            Create a mapping from key name to index in the Adjacency Matrix
+            Return a read-only view from the persistent mapping of key name to index in the Adjacency Matrix
         :return: key to idx map
         """
-        key_to_idx = {}
-        idx = 0
-        for key in self._key_map:
-            key_to_idx[key] = idx
-            idx += 1
+        return MappingProxyType(self._key_idx)
 
-        return key_to_idx
\ No newline at end of file
+    def freeze(self):
+        """
+            Create an immutable CSR copy from the graph, keeping the entries accepted by is_edge_weight as weighted edges.
+            Vertice ids are the matrix indexes.
+        :return: CSR graph
+        """
+        vertices_amount = len(self._key_map)
+        if self._dtype is not None:
+            source_idxs, dest_idxs = np.nonzero(self.is_edge_weight(self._graph[:vertices_amount, :vertices_amount]))
+            indptr = np.zeros(vertices_amount + 1, dtype=np.int64)
+            np.cumsum(np.bincount(source_idxs, minlength=vertices_amount), out=indptr[1:])
+            weights = self._graph[source_idxs, dest_idxs].astype(np.float64)
+            return CSRGraph(self._key_map, indptr.tolist(), dest_idxs.tolist(), weights.tolist())
+
+        indptr = array('q', [0])
+        indices = array('q')
+        weights = array('d')
+        for row in self._graph:
+            for dest_idx in range(vertices_amount):
+                if self.is_edge_weight(row[dest_idx]):
+                    indices.append(dest_idx)
+                    weights.append(row[dest_idx])
+            indptr.append(len(indices))
+
+        return CSRGraph(self._key_map, indptr, indices, weights)
+
+    def __str__(self):
+        return f"{self.get_graph()}"
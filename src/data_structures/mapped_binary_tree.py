@@ -0,0 +1,199 @@
+# This file provides the binary file layout used to persist a BinaryTree and a read-only tree served from it.
+# Keys and values are stored with pickle, so tree files must only be opened from trusted sources.
+import mmap
+import pickle
+import struct
+from array import array
+
+TREE_FILE_MAGIC = b"BSTI"
+TREE_FILE_VERSION = 1
+TREE_FILE_HEADER = struct.Struct("<4sHHQ")
+KEY_FUNCTION_FLAG = 1
+
+
+def dump_sorted_items(path, sorted_items, key_sorted=False):
+    """
+        Write (key, value) pairs sorted by key as a tree file:
+        header | key offsets (n + 1) | value offsets (n + 1) | pickled keys | pickled values
+    :param path: path of the file to be written
+    :param sorted_items: iterable with (key, value) pairs sorted by key
+    :param key_sorted: flag the pairs as sorted by a key function instead of by the keys themselves
+    :return: amount of written pairs
+    """
+    pickled_keys = []
+    pickled_values = []
+    for key, value in sorted_items:
+        pickled_keys.append(pickle.dumps(key, protocol=pickle.HIGHEST_PROTOCOL))
+        pickled_values.append(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+
+    items_amount = len(pickled_keys)
+    offsets_size = 2 * (items_amount + 1) * array('Q').itemsize
+    key_offsets = array('Q', [TREE_FILE_HEADER.size + offsets_size])
+    for pickled_key in pickled_keys:
+        key_offsets.append(key_offsets[-1] + len(pickled_key))
+    value_offsets = array('Q', [key_offsets[-1]])
+    for pickled_value in pickled_values:
+        value_offsets.append(value_offsets[-1] + len(pickled_value))
+
+    with open(path, "wb") as tree_file:
+        flags = KEY_FUNCTION_FLAG if key_sorted else 0
+        tree_file.write(TREE_FILE_HEADER.pack(TREE_FILE_MAGIC, TREE_FILE_VERSION, flags, items_amount))
+        key_offsets.tofile(tree_file)
+        value_offsets.tofile(tree_file)
+        tree_file.writelines(pickled_keys)
+        tree_file.writelines(pickled_values)
+
+    return items_amount
+
+
+class MappedBinaryTree:
+    """
+        Read-only tree served from a file written by BinaryTree.dump. The file is memory-mapped,
+        so opening it is O(1): lookups binary search the offsets table and only unpickle the keys
+        they visit, and several processes reading the same file share one page-cache copy.
+        The file only records whether a key function sorted it, so the same key function given to
+        the dumped BinaryTree must be given here, otherwise lookups follow a different order.
+    """
+
+    def __init__(self, path, key=None):
+        self.__key_function = key
+        with open(path, "rb") as tree_file:
+            self.__mapped_file = mmap.mmap(tree_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(self.__mapped_file) < TREE_FILE_HEADER.size:
+            self.__mapped_file.close()
+            raise ValueError("Invalid tree file!")
+        magic, version, flags, items_amount = TREE_FILE_HEADER.unpack_from(self.__mapped_file)
+        if magic != TREE_FILE_MAGIC or version != TREE_FILE_VERSION:
+            self.__mapped_file.close()
+            raise ValueError("Invalid tree file!")
+        if bool(flags & KEY_FUNCTION_FLAG) != (key is not None):
+            self.__mapped_file.close()
+            raise ValueError("Key function must match the one used to dump the tree file!")
+
+        self.__tree_length = items_amount
+        offsets_end = TREE_FILE_HEADER.size + 2 * (items_amount + 1) * array('Q').itemsize
+        if len(self.__mapped_file) < offsets_end:
+            self.__mapped_file.close()
+            raise ValueError("Truncated tree file! It is shorter than its offsets table.")
+        self.__offsets = memoryview(self.__mapped_file)[TREE_FILE_HEADER.size:offsets_end].cast('Q')
+        if len(self.__mapped_file) < self.__offsets[-1]:
+            self.close()
+            raise ValueError("Truncated tree file! It is shorter than its stored items.")
+
+    def close(self):
+        """
+            Release the memory-mapped file
+        :return: None
+        """
+        if not self.__mapped_file.closed:
+            self.__offsets.release()
+            self.__mapped_file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def is_empty(self):
+        """
+            Verifies if the Tree is empty
+        :return: emptiness status
+        """
+        if self.__tree_length == 0:
+            return True
+
+        return False
+
+    def __get_sort_key(self, input_key):
+        if self.__key_function is None:
+            return input_key
+        return self.__key_function(input_key)
+
+    def __load_key(self, position):
+        return pickle.loads(self.__mapped_file[self.__offsets[position]:self.__offsets[position + 1]])
+
+    def __load_value(self, position):
+        value_position = self.__tree_length + 1 + position
+        return pickle.loads(self.__mapped_file[self.__offsets[value_position]:self.__offsets[value_position + 1]])
+
+    def __bisect(self, searched_key, right=False):
+        """
+            Binary search the position of a key among the stored sorted keys
+        :param searched_key: key provided by the user
+        :param right: place the position after an equal stored key instead of on it
+        :return: position of the first stored key bigger than (or equal to, if not right) the searched key
+        """
+        searched_sort_key = self.__get_sort_key(searched_key)
+        low, high = 0, self.__tree_length
+        try:
+            while low < high:
+                middle = (low + high) // 2
+                middle_sort_key = self.__get_sort_key(self.__load_key(middle))
+                if middle_sort_key < searched_sort_key or (right and middle_sort_key == searched_sort_key):
+                    low = middle + 1
+                else:
+                    high = middle
+        except TypeError:
+            raise IndexError("Invalid key type! It must be comparable to the Tree keys.")
+
+        return low
+
+    def get_value(self, key):
+        """
+            Get the value from the element matching the desired key
+        :param key: key from the element be returned
+        :return: value from the requested element
+        """
+        position = self.__bisect(key)
+        if position == self.__tree_length or self.__get_sort_key(self.__load_key(position)) != self.__get_sort_key(key):
+            raise IndexError("Invalid key!")
+        return self.__load_value(position)
+
+    def iter_items(self, reverse=False):
+        """
+            Lazily iterate over the Tree elements in key order
+        :param reverse: The reverse flag can be set to iterate in descending order
+        :return: generator of (key, value) pairs
+        """
+        positions = range(self.__tree_length)
+        for position in reversed(positions) if reverse else positions:
+            yield self.__load_key(position), self.__load_value(position)
+
+    def iter_range(self, lower_key=None, upper_key=None):
+        """
+            Lazily iterate over the elements with keys between the bounds (both inclusive)
+        :param lower_key: smallest key to be returned (no lower bound if None)
+        :param upper_key: biggest key to be returned (no upper bound if None)
+        :return: generator of (key, value) pairs in ascending order
+        """
+        start = 0 if lower_key is None else self.__bisect(lower_key)
+        stop = self.__tree_length if upper_key is None else self.__bisect(upper_key, right=True)
+        for position in range(start, stop):
+            yield self.__load_key(position), self.__load_value(position)
+
+    def get_sorted_tree_keys(self, reverse=False):
+        """
+            Get the keys from the Tree in sorted order
+        :param reverse: The reverse flag can be set to sort in descending order
+        :return: sorted keys
+        """
+        positions = range(self.__tree_length)
+        return [self.__load_key(position) for position in (reversed(positions) if reverse else positions)]
+
+    def get_sorted_tree_values(self, reverse=False):
+        """
+            Get the values from the Tree sorted by their keys
+        :param reverse: The reverse flag can be set to sort in descending order
+        :return: sorted values
+        """
+        positions = range(self.__tree_length)
+        return [self.__load_value(position) for position in (reversed(positions) if reverse else positions)]
+
+    def __len__(self):
+        return self.__tree_length
+
+    def __str__(self):
+        tree_string = "MappedTree"
+        return tree_string
@@ -0,0 +1,259 @@
+class PersistentTreeNode:
+    """
+        Tree node never changed after being created, so it can be shared between several tree versions
+    """
+
+    def __init__(self, key, data, left, right, sort_key):
+        self.key = key
+        self.sort_key = sort_key
+        self.data = data
+        self.left = left
+        self.right = right
+        self.height = 1 + max(left.height if left else 0, right.height if right else 0)
+        self.size = 1 + (left.size if left else 0) + (right.size if right else 0)
+
+
+class PersistentBinaryTree:
+    """
+        Balanced (AVL) binary search tree with path copying: insertions and deletions create
+        new nodes only along the changed path and share all the other subtrees with the previous
+        version. The nodes have no parent pointers, so a version is fully defined by its root and
+        snapshot() is O(1). Readers can iterate a snapshot without locks while a writer keeps
+        changing the tree (writers must still be serialized between themselves).
+    """
+
+    def __init__(self, key=None):
+        self.__root = None
+        self.__key_function = key
+
+    def is_empty(self):
+        """
+            Verifies if the Tree is empty
+        :return: emptiness status
+        """
+        if self.__root is None:
+            return True
+
+        return False
+
+    def snapshot(self):
+        """
+            Create an independent Tree sharing the current version of all nodes in O(1)
+        :return: new Tree
+        """
+        tree_snapshot = PersistentBinaryTree(key=self.__key_function)
+        tree_snapshot.__root = self.__root
+        return tree_snapshot
+
+    def get_height(self):
+        """
+            Get the amount of levels from the Tree
+        :return: tree height
+        """
+        return self.__root.height if self.__root else 0
+
+    def __get_sort_key(self, input_key):
+        if self.__key_function is None:
+            return input_key
+        return self.__key_function(input_key)
+
+    @staticmethod
+    def __node_height(node: PersistentTreeNode):
+        return node.height if node is not None else 0
+
+    @staticmethod
+    def __copy_node(node: PersistentTreeNode, left, right):
+        return PersistentTreeNode(node.key, node.data, left, right, node.sort_key)
+
+    def __balance(self, node: PersistentTreeNode, left, right):
+        """
+            Create a copy of node with new children, rotating it when their heights differ by more than one
+        :param node: node to be copied
+        :param left: new left child
+        :param right: new right child
+        :return: root of the new (balanced) subtree
+        """
+        balance = self.__node_height(left) - self.__node_height(right)
+        if balance > 1:
+            if self.__node_height(left.left) < self.__node_height(left.right):
+                left = self.__rotate_left(left, left.left, left.right)
+            return self.__rotate_right(node, left, right)
+        if balance < -1:
+            if self.__node_height(right.right) < self.__node_height(right.left):
+                right = self.__rotate_right(right, right.left, right.right)
+            return self.__rotate_left(node, left, right)
+
+        return self.__copy_node(node, left, right)
+
+    def __rotate_left(self, node, left, right):
+        return self.__copy_node(right, self.__copy_node(node, left, right.left), right.right)
+
+    def __rotate_right(self, node, left, right):
+        return self.__copy_node(left, left.left, self.__copy_node(node, left.right, right))
+
+    def __insert(self, node, new_key, new_key_data, sort_key):
+        """
+            Insert a new element in the subtree, copying the nodes on the path to it
+        :param node: root of the subtree
+        :param new_key: key from the new element
+        :param new_key_data: value from the new element
+        :param sort_key: value used to order the new key
+        :return: root of the new subtree
+        """
+        if node is None:
+            return PersistentTreeNode(new_key, new_key_data, None, None, sort_key)
+        if sort_key == node.sort_key:
+            raise IndexError("Key already exists!")
+
+        if sort_key < node.sort_key:
+            return self.__balance(node, self.__insert(node.left, new_key, new_key_data, sort_key), node.right)
+        return self.__balance(node, node.left, self.__insert(node.right, new_key, new_key_data, sort_key))
+
+    def insert_node(self, new_key, new_key_data = None):
+        """
+            Inserts a new element to the Tree, replacing its root by the root of the new version
+        :param new_key: key from the new element
+        :param new_key_data: value from the new element
+        :return: None
+        """
+        if isinstance(new_key, list):
+            raise IndexError("Key must not be a List!")
+        elif isinstance(new_key, dict):
+            raise IndexError("Key must not be a Dict!")
+
+        try:
+            self.__root = self.__insert(self.__root, new_key, new_key_data, self.__get_sort_key(new_key))
+        except TypeError:
+            raise IndexError("Invalid key type! It must be comparable to the Tree keys.")
+
+    def __delete_minimum(self, node):
+        """
+            Remove the smallest element from the subtree, copying the nodes on the path to it
+        :param node: root of the subtree
+        :return: removed node, root of the new subtree
+        """
+        if node.left is None:
+            return node, node.right
+
+        minimum_node, new_left = self.__delete_minimum(node.left)
+        return minimum_node, self.__balance(node, new_left, node.right)
+
+    def __delete(self, node, sort_key):
+        """
+            Remove the element with the sort key from the subtree, copying the nodes on the path to it
+        :param node: root of the subtree
+        :param sort_key: value used to order the removed key
+        :return: root of the new subtree
+        """
+        if node is None:
+            raise IndexError("Invalid key!")
+
+        if sort_key == node.sort_key:
+            if node.left is None:
+                return node.right
+            if node.right is None:
+                return node.left
+            successor, new_right = self.__delete_minimum(node.right)
+            return self.__balance(successor, node.left, new_right)
+
+        if sort_key < node.sort_key:
+            return self.__balance(node, self.__delete(node.left, sort_key), node.right)
+        return self.__balance(node, node.left, self.__delete(node.right, sort_key))
+
+    def delete_node(self, key_to_delete):
+        """
+            Delete node with specified key from the Tree, replacing its root by the root of the new version
+        :param key_to_delete: key from the element to be deleted
+        :return: None
+        """
+        try:
+            self.__root = self.__delete(self.__root, self.__get_sort_key(key_to_delete))
+        except TypeError:
+            raise IndexError("Invalid key type! It must be comparable to the Tree keys.")
+
+    def __set(self, node, sort_key, element_data):
+        if node is None:
+            raise IndexError("Invalid key!")
+
+        if sort_key == node.sort_key:
+            return PersistentTreeNode(node.key, element_data, node.left, node.right, node.sort_key)
+        if sort_key < node.sort_key:
+            return self.__copy_node(node, self.__set(node.left, sort_key, element_data), node.right)
+        return self.__copy_node(node, node.left, self.__set(node.right, sort_key, element_data))
+
+    def set_value(self, key, element_data):
+        """
+            Update the value from an existing element, copying the nodes on the path to it
+        :param key: key from the node to receive a new value
+        :param element_data: value to be assigned to the node
+        :return: None
+        """
+        try:
+            self.__root = self.__set(self.__root, self.__get_sort_key(key), element_data)
+        except TypeError:
+            raise IndexError("Invalid key type! It must be comparable to the Tree keys.")
+
+    def get_value(self, key):
+        """
+            Get the value from the node matching the desired key
+        :param key: key from the node be returned
+        :return: value from the requested node
+        """
+        searched_sort_key = self.__get_sort_key(key)
+        current_node = self.__root
+        try:
+            while current_node is not None:
+                if searched_sort_key == current_node.sort_key:
+                    return current_node.data
+                if searched_sort_key < current_node.sort_key:
+                    current_node = current_node.left
+                else:
+                    current_node = current_node.right
+        except TypeError:
+            raise IndexError("Invalid key type! It must be comparable to the Tree keys.")
+
+        raise IndexError("Invalid key!")
+
+    @staticmethod
+    def __iter_version(node, reverse):
+        stack = []
+        while stack or node is not None:
+            if node is not None:
+                stack.append(node)
+                node = node.right if reverse else node.left
+            else:
+                node = stack.pop()
+                yield node.key, node.data
+                node = node.left if reverse else node.right
+
+    def iter_items(self, reverse=False):
+        """
+            Lazily iterate over the elements from the current version in key order. Later changes
+            to the Tree do not affect a running iteration, as the version nodes are never changed.
+        :param reverse: The reverse flag can be set to iterate in descending order
+        :return: generator of (key, value) pairs
+        """
+        return self.__iter_version(self.__root, reverse)
+
+    def get_sorted_tree_keys(self, reverse=False):
+        """
+            Get the keys from the Tree in sorted order
+        :param reverse: The reverse flag can be set to sort in descending order
+        :return: sorted keys
+        """
+        return [key for key, _ in self.iter_items(reverse=reverse)]
+
+    def get_sorted_tree_values(self, reverse=False):
+        """
+            Get the values from the Tree sorted by their keys
+        :param reverse: The reverse flag can be set to sort in descending order
+        :return: sorted values
+        """
+        return [value for _, value in self.iter_items(reverse=reverse)]
+
+    def __len__(self):
+        return self.__root.size if self.__root else 0
+
+    def __str__(self):
+        tree_string = "PersistentTree"
+        return tree_string
@@ -0,0 +1,206 @@
+class PriorityQueue:
+    """
+        Min Priority Queue class implemented with an indexed d-ary heap. A position map
+        from item to heap slot allows changing the priority of queued items in O(log n).
+    """
+
+    def __init__(self, arity=2):
+        if arity < 2:
+            raise ValueError("Invalid heap arity!")
+
+        self.__arity = arity
+        self.__items = []
+        self.__priorities = []
+        self.__positions = {}
+
+    @classmethod
+    def heapify(cls, items_and_priorities, arity=2):
+        """
+            Create a priority queue from (item, priority) pairs in O(n)
+        :param items_and_priorities: iterable with (item, priority) pairs
+        :param arity: amount of children per heap node
+        :return: new priority queue
+        """
+        priority_queue = cls(arity=arity)
+        priority_queue.__append_all(items_and_priorities)
+        priority_queue.__build_heap()
+        return priority_queue
+
+    def is_empty(self):
+        """
+            Verifies if the Priority Queue is empty
+        :return: emptiness status
+        """
+        if not self.__items:
+            return True
+
+        return False
+
+    def __append_all(self, items_and_priorities):
+        """
+            Place (item, priority) pairs at the end of the heap without restoring the heap property
+        :param items_and_priorities: iterable with (item, priority) pairs
+        :return: amount of added items
+        """
+        items_and_priorities = list(items_and_priorities)
+        new_items = {item for item, _ in items_and_priorities}
+        if len(new_items) != len(items_and_priorities) or not new_items.isdisjoint(self.__positions):
+            raise KeyError("Item already in queue!")
+
+        for item, priority in items_and_priorities:
+            self.__positions[item] = len(self.__items)
+            self.__items.append(item)
+            self.__priorities.append(priority)
+
+        return len(items_and_priorities)
+
+    def __build_heap(self):
+        """
+            Restore the heap property from the bottom up (O(n))
+        :return: None
+        """
+        last_parent = (len(self.__items) - 2) // self.__arity
+        for position in range(last_parent, -1, -1):
+            self.__sift_down(position)
+
+    def __place(self, position, item, priority):
+        self.__items[position] = item
+        self.__priorities[position] = priority
+        self.__positions[item] = position
+
+    def __sift_up(self, position):
+        """
+            Move the item at position towards the root while it has a smaller priority than its parent
+        :param position: heap slot of the item
+        :return: None
+        """
+        item = self.__items[position]
+        priority = self.__priorities[position]
+
+        while position > 0:
+            parent = (position - 1) // self.__arity
+            if self.__priorities[parent] <= priority:
+                break
+            self.__place(position, self.__items[parent], self.__priorities[parent])
+            position = parent
+
+        self.__place(position, item, priority)
+
+    def __sift_down(self, position):
+        """
+            Move the item at position towards the leaves while a child has a smaller priority
+        :param position: heap slot of the item
+        :return: None
+        """
+        heap_size = len(self.__items)
+        item = self.__items[position]
+        priority = self.__priorities[position]
+
+        while True:
+            first_child = self.__arity * position + 1
+            if first_child >= heap_size:
+                break
+
+            smallest_child = first_child
+            for child in range(first_child + 1, min(first_child + self.__arity, heap_size)):
+                if self.__priorities[child] < self.__priorities[smallest_child]:
+                    smallest_child = child
+
+            if self.__priorities[smallest_child] >= priority:
+                break
+            self.__place(position, self.__items[smallest_child], self.__priorities[smallest_child])
+            position = smallest_child
+
+        self.__place(position, item, priority)
+
+    def push(self, item, priority):
+        """
+            Add a new item to the queue
+        :param item: hashable item, unique in the queue
+        :param priority: priority from the item (smaller values are popped first)
+        :return: None
+        """
+        self.__append_all([(item, priority)])
+        self.__sift_up(len(self.__items) - 1)
+
+    def push_many(self, items_and_priorities):
+        """
+            Add a batch of items to the queue, rebuilding the heap when the batch is large
+        :param items_and_priorities: iterable with (item, priority) pairs
+        :return: None
+        """
+        previous_size = len(self.__items)
+        added_items = self.__append_all(items_and_priorities)
+
+        if added_items > previous_size:
+            self.__build_heap()
+        else:
+            for position in range(previous_size, previous_size + added_items):
+                self.__sift_up(position)
+
+    def peek(self):
+        """
+            Get the item with the smallest priority without removing it
+        :return: item, priority
+        """
+        if self.is_empty():
+            raise IndexError("Peek from empty priority queue!")
+
+        return self.__items[0], self.__priorities[0]
+
+    def pop(self):
+        """
+            Remove the item with the smallest priority
+        :return: item, priority
+        """
+        if self.is_empty():
+            raise IndexError("Pop from empty priority queue!")
+
+        top_item = self.__items[0]
+        top_priority = self.__priorities[0]
+        del self.__positions[top_item]
+
+        last_item = self.__items.pop()
+        last_priority = self.__priorities.pop()
+        if self.__items:
+            self.__place(0, last_item, last_priority)
+            self.__sift_down(0)
+
+        return top_item, top_priority
+
+    def get_priority(self, item):
+        """
+            Get the current priority from a queued item
+        :param item: queued item
+        :return: priority
+        """
+        if item not in self.__positions:
+            raise KeyError("Item not in queue!")
+
+        return self.__priorities[self.__positions[item]]
+
+    def decrease_key(self, item, new_priority):
+        """
+            Reduce the priority from a queued item
+        :param item: queued item
+        :param new_priority: new priority, not bigger than the current one
+        :return: None
+        """
+        if item not in self.__positions:
+            raise KeyError("Item not in queue!")
+
+        position = self.__positions[item]
+        if new_priority > self.__priorities[position]:
+            raise ValueError("New priority must not be bigger than the current one!")
+
+        self.__priorities[position] = new_priority
+        self.__sift_up(position)
+
+    def __contains__(self, item):
+        return item in self.__positions
+
+    def __len__(self):
+        return len(self.__items)
+
+    def __str__(self):
+        return f"{list(zip(self.__items, self.__priorities))}"
@@ -0,0 +1,231 @@
+import io
+import random
+
+from src.data_structures.basic_data_structures import write_indexed_rows
+
+
+class SkipNode:
+
+    def __init__(self, data, level):
+        self.data = data
+        self.next = [None] * level
+        self.width = [0] * level
+
+
+class IndexableSkipList:
+    """
+        Skip List class keeping the amount of items spanned by each link (its width),
+        which allows positional access, insertion and deletion in O(log n)
+    """
+    MAX_LEVEL = 32
+    PROBABILITY = 0.5
+
+    def __init__(self):
+        self.__head = SkipNode(None, self.MAX_LEVEL)
+        self.__levels = 1
+        self.__skip_list_length = 0
+
+    def is_empty(self):
+        """
+            Verifies if the List is empty
+        :return: emptiness status
+        """
+        if self.__skip_list_length == 0:
+            return True
+
+        return False
+
+    def __random_level(self):
+        """
+            Draw the amount of levels for a new node (geometric distribution)
+        :return: node level
+        """
+        level = 1
+        while level < self.MAX_LEVEL and random.random() < self.PROBABILITY:
+            level += 1
+        return level
+
+    def __get_predecessors(self, index:int):
+        """
+            Retrieve, for each level, the last node placed before the index position
+        :param index: position to be reached
+        :return: predecessor nodes and their positions (head is at position -1)
+        """
+        predecessors = [self.__head] * self.MAX_LEVEL
+        positions = [-1] * self.MAX_LEVEL
+
+        current_node = self.__head
+        position = -1
+        for level in reversed(range(self.__levels)):
+            while current_node.next[level] is not None and position + current_node.width[level] < index:
+                position += current_node.width[level]
+                current_node = current_node.next[level]
+            predecessors[level] = current_node
+            positions[level] = position
+
+        return predecessors, positions
+
+    def __validate_index(self, index:int):
+        """
+            Convert negative indexes and verify if the index is inside the list
+        :param index: position requested by the user
+        :return: valid non-negative index
+        """
+        if index < 0:
+            index += self.__skip_list_length
+
+        if index < 0 or index >= self.__skip_list_length:
+            raise IndexError("Index out of range!")
+
+        return index
+
+    def __insert(self, index, new_value):
+        """
+            Link a new node at the index position (index may be equal to the length)
+        :param index: position to add the new item
+        :param new_value: value to be added to the list
+        :return: None
+        """
+        new_level = self.__random_level()
+        predecessors, positions = self.__get_predecessors(index)
+        self.__levels = max(self.__levels, new_level)
+
+        new_node = SkipNode(new_value, new_level)
+        for level in range(new_level):
+            predecessor = predecessors[level]
+            steps_to_new_node = index - positions[level]
+
+            new_node.next[level] = predecessor.next[level]
+            new_node.width[level] = predecessor.width[level] - steps_to_new_node + 1
+            predecessor.next[level] = new_node
+            predecessor.width[level] = steps_to_new_node
+
+        for level in range(new_level, self.__levels):
+            predecessors[level].width[level] += 1
+
+        self.__skip_list_length += 1
+
+    def __remove(self, index):
+        """
+            Unlink the node at the index position
+        :param index: position to remove the item
+        :return: value from the removed item
+        """
+        predecessors, _ = self.__get_predecessors(index)
+        removed_node = predecessors[0].next[0]
+
+        for level in range(self.__levels):
+            predecessor = predecessors[level]
+            if predecessor.next[level] is removed_node:
+                predecessor.width[level] += removed_node.width[level] - 1
+                predecessor.next[level] = removed_node.next[level]
+            else:
+                predecessor.width[level] -= 1
+
+        while self.__levels > 1 and self.__head.next[self.__levels - 1] is None:
+            self.__levels -= 1
+
+        self.__skip_list_length -= 1
+        return removed_node.data
+
+    def get_index(self, index:int):
+        """
+            Retrieve the item in defined index position
+        :param index: position to retrieve the data
+        :return: data
+        """
+        index = self.__validate_index(index)
+        predecessors, _ = self.__get_predecessors(index)
+        return predecessors[0].next[0].data
+
+    def add_at_head(self, new_value):
+        """
+            Add a new item to the beginning of th list
+        :param new_value: value to be added to the list
+        :return:
+        """
+        self.__insert(0, new_value)
+
+    def add_at_tail(self, new_value):
+        """
+            Add a new item to the end of the list
+        :param new_value: value to be added to the list
+        :return:
+        """
+        self.__insert(self.__skip_list_length, new_value)
+
+    def add_at_index(self, index, new_value):
+        """
+            Add a new item to the specified index position
+        :param index: position to add the new item
+        :param new_value: value to be added to the list
+        :return:
+        """
+        if self.is_empty():
+            raise IndexError
+
+        self.__insert(self.__validate_index(index), new_value)
+
+    def delete_from_head(self):
+        """
+            Remove the first item from the list
+        :return: value from the removed item
+        """
+        if self.is_empty():
+            raise IndexError("Delete from empty list!")
+
+        return self.__remove(0)
+
+    def delete_from_tail(self):
+        """
+            Remove the last item from the list
+        :return: value from the removed item
+        """
+        if self.is_empty():
+            raise IndexError("Delete from empty list!")
+
+        return self.__remove(self.__skip_list_length - 1)
+
+    def delete_from_index(self, index):
+        """
+            Remove the item from the list at index position
+        :param index: position to remove the new item
+        :return: value from the removed item
+        """
+        if self.is_empty():
+            raise IndexError("Delete from empty list!")
+
+        return self.__remove(self.__validate_index(index))
+
+    def __len__(self):
+        return self.__skip_list_length
+
+    def __iter__(self):
+        current_node = self.__head.next[0]
+        while current_node is not None:
+            yield current_node.data
+            current_node = current_node.next[0]
+
+    def __reversed__(self):
+        for index in reversed(range(self.__skip_list_length)):
+            yield self.get_index(index)
+
+    def __contains__(self, value):
+        for item in self:
+            if item == value:
+                return True
+        return False
+
+    def write_to(self, stream, chunk_size=1024):
+        """
+            Write the list to a file-like object without building the whole string
+        :param stream: file-like object receiving the list rows
+        :param chunk_size: amount of rows to be joined in a single write call
+        :return: None
+        """
+        write_indexed_rows(stream, self, chunk_size)
+
+    def __str__(self):
+        list_string = io.StringIO()
+        self.write_to(list_string)
+        return list_string.getvalue()
@@ -1,15 +1,27 @@
 import sys
 import os
+import copy
+import heapq
 import timeit
 import random
+import threading
+import tracemalloc
 
 import numpy as np
 import pandas as pd
 from pympler import asizeof
 from matplotlib import pyplot as plt
 
-from src.data_structures.basic_data_structures import LinkedList, Queue, Stack, Node
+from src.data_structures.basic_data_structures import LinkedList, PooledLinkedList, Queue, RingBufferQueue, Stack, Node
+from src.data_structures.b_tree import BTree
 from src.data_structures.binary_tree import BinaryTree
+from src.data_structures.persistent_binary_tree import PersistentBinaryTree
+from src.data_structures.priority_queue import PriorityQueue
+from src.data_structures.graphs import AdjListGraph, AdjMatrixGraph, WeightedAdjListGraph
+from src.data_structures.concurrent_data_structures import ConcurrentQueue, ConcurrentStack
+from src.data_structures.skip_list import IndexableSkipList
+from src.data_structures.unrolled_linked_list import UnrolledLinkedList
+from src.search_algorithms.graphs_search import BFS, Dijkstra
 
 
 class MemoryAnalyzer:
@@ -19,18 +31,23 @@ class MemoryAnalyzer:
         self.__list = []
         self.__dict = {}
         self.__linked_list = LinkedList()
+        self.__pooled_linked_list = PooledLinkedList()
+        self.__unrolled_linked_list = UnrolledLinkedList()
         self.__queue = Queue()
         self.__stack = Stack()
         self.__tree = BinaryTree()
 
         self.values_for_test = random.sample(range(100000), self.__datapoints)
-        self.__memory_usage = pd.DataFrame(columns=['list', 'dict', 'linked_list', 'queue', 'stack', 'tree'])
+        self.__memory_usage = pd.DataFrame(columns=['list', 'dict', 'linked_list', 'pooled_linked_list',
+                                                     'unrolled_linked_list', 'queue', 'stack', 'tree'])
 
     def __measure_memory_sizes(self):
         memory_sizes = {
             'list': asizeof.asizeof(self.__list, limit=10000, detail=True),
             'dict': asizeof.asizeof(self.__dict, limit=10000, detail=True),
             'linked_list': asizeof.asizeof(self.__linked_list, limit=10000, detail=True),
+            'pooled_linked_list': asizeof.asizeof(self.__pooled_linked_list, limit=10000, detail=True),
+            'unrolled_linked_list': asizeof.asizeof(self.__unrolled_linked_list, limit=10000, detail=True),
             'queue': asizeof.asizeof(self.__queue, limit=10000, detail=True),
             'stack': asizeof.asizeof(self.__stack, limit=10000, detail=True),
             'tree': asizeof.asizeof(self.__tree, limit=10000, detail=True)
@@ -46,6 +63,8 @@ class MemoryAnalyzer:
             self.__dict[test_value] = None
 
             self.__linked_list.add_at_tail(test_value)
+            self.__pooled_linked_list.add_at_tail(test_value)
+            self.__unrolled_linked_list.add_at_tail(test_value)
             self.__queue.add(test_value)
             self.__stack.add(test_value)
             self.__tree.insert_node(test_value, None)
@@ -55,6 +74,36 @@ class MemoryAnalyzer:
 
         return self.__memory_usage.copy()
 
+    @staticmethod
+    def measure_final_footprint(datapoints):
+        """
+            Measure the memory allocated by each list engine while adding all datapoints. tracemalloc counts
+            every allocation, so long node chains are not truncated as in a recursive walk. The values are
+            created beforehand, so only the memory held by the structure itself is counted.
+        :param datapoints: amount of items to be added to each structure
+        :return: memory usage (Bytes) per structure
+        """
+        values = list(range(datapoints))
+        engines = {
+            'list': (list, 'append'),
+            'linked_list': (LinkedList, 'add_at_tail'),
+            'pooled_linked_list': (PooledLinkedList, 'add_at_tail'),
+            'unrolled_linked_list': (UnrolledLinkedList, 'add_at_tail'),
+        }
+
+        footprint = {}
+        for name, (engine, add_method) in engines.items():
+            tracemalloc.start()
+            structure = engine()
+            add_value = getattr(structure, add_method)
+            for value in values:
+                add_value(value)
+            footprint[name] = tracemalloc.get_traced_memory()[0]
+            tracemalloc.stop()
+            del structure, add_value
+
+        return pd.Series(footprint)
+
     def plot_memory_usage(self):
         plt.style.use("bmh")
 
@@ -81,10 +130,13 @@ class TimeAnalyzer:
         self._list = []
         self._dict = {}
         self._linked_list = LinkedList()
+        self._skip_list = IndexableSkipList()
+        self._unrolled_linked_list = UnrolledLinkedList()
         self._tree = BinaryTree()
 
         self.values_for_test = random.sample(range(100000), self.__datapoints)
-        self._times = pd.DataFrame(columns=['list', 'linked_list', 'dict', 'tree'])
+        self._times = pd.DataFrame(columns=['list', 'linked_list', 'dict', 'tree', 'skip_list',
+                                                'unrolled_linked_list'])
 
     def measure_times(self):
         pass
@@ -132,8 +184,8 @@ class TimeAnalyzer:
 
         times_moving_avg = self._times.rolling(window=50).mean()
 
-        self.__plot_linear_data(times_moving_avg.loc[:, ['list', 'linked_list']], self._axes[0])
-        self.__plot_non_linear_data(times_moving_avg.loc[:, ['dict', 'tree']], self._axes[1])
+        self.__plot_linear_data(times_moving_avg.loc[:, ['list', 'linked_list', 'unrolled_linked_list']], self._axes[0])
+        self.__plot_non_linear_data(times_moving_avg.loc[:, ['dict', 'tree', 'skip_list']], self._axes[1])
 
         fig.suptitle(self.__title, fontsize=16, fontweight='bold')
         fig.tight_layout()
@@ -149,12 +201,17 @@ class InsertTimeAnalyzer(TimeAnalyzer):
             self._dict[new_key] = None
 
         self._linked_list.add_at_head(-1)
+        self._skip_list.add_at_head(-1)
+        self._unrolled_linked_list.add_at_head(-1)
 
         counter = 0
         for test_value in self.values_for_test:
             new_index = random.randint(0, counter)
             list_insert_time = timeit.timeit(lambda: self._list.insert(new_index, test_value), number=1)
             linked_list_insert_time = timeit.timeit(lambda: self._linked_list.add_at_index(new_index, test_value), number=1)
+            skip_list_insert_time = timeit.timeit(lambda: self._skip_list.add_at_index(new_index, test_value), number=1)
+            unrolled_linked_list_insert_time = timeit.timeit(
+                lambda: self._unrolled_linked_list.add_at_index(new_index, test_value), number=1)
 
             dict_insert_time = timeit.timeit(lambda: add_to_dict(test_value), number=1)
             tree_insert_time = timeit.timeit(lambda: self._tree.insert_node(test_value, None), number=1)
@@ -162,7 +219,9 @@ class InsertTimeAnalyzer(TimeAnalyzer):
             self._times.loc[counter, :] = [list_insert_time,
                                            linked_list_insert_time,
                                            dict_insert_time,
-                                           tree_insert_time]
+                                           tree_insert_time,
+                                           skip_list_insert_time,
+                                           unrolled_linked_list_insert_time]
             counter += 1
 
 
@@ -173,12 +232,16 @@ class SearchTimeAnalyzer(TimeAnalyzer):
 
     def measure_times(self):
         self._linked_list.add_at_head(-1)
+        self._skip_list.add_at_head(-1)
+        self._unrolled_linked_list.add_at_head(-1)
 
         counter = 0
         for test_value in self.values_for_test:
             new_index = random.randint(0, counter)
             self._list.insert(new_index, test_value)
             self._linked_list.add_at_index(new_index, test_value)
+            self._skip_list.add_at_index(new_index, test_value)
+            self._unrolled_linked_list.add_at_index(new_index, test_value)
             self._dict[test_value] = None
             self._tree.insert_node(test_value, None)
 
@@ -190,13 +253,18 @@ class SearchTimeAnalyzer(TimeAnalyzer):
 
             list_search_time = timeit.timeit(lambda: key_to_search in self._list, number=1)
             linked_list_search_time = timeit.timeit(lambda: self._linked_list.get_index(item_to_search_idx), number=1)
+            skip_list_search_time = timeit.timeit(lambda: self._skip_list.get_index(item_to_search_idx), number=1)
+            unrolled_linked_list_search_time = timeit.timeit(
+                lambda: self._unrolled_linked_list.get_index(item_to_search_idx), number=1)
             dict_search_time = timeit.timeit(lambda: self._dict[key_to_search], number=1)
             tree_search_time = timeit.timeit(lambda: self._tree.get_value(key_to_search), number=1)
 
             self._times.loc[counter, :] = [list_search_time,
                                            linked_list_search_time,
                                            dict_search_time,
-                                           tree_search_time]
+                                           tree_search_time,
+                                           skip_list_search_time,
+                                           unrolled_linked_list_search_time]
             counter += 1
 
 
@@ -207,12 +275,16 @@ class DeleteTimeAnalyzer(TimeAnalyzer):
 
     def measure_times(self):
         self._linked_list.add_at_head(-1)
+        self._skip_list.add_at_head(-1)
+        self._unrolled_linked_list.add_at_head(-1)
 
         counter = 0
         for test_value in self.values_for_test:
             new_index = random.randint(0, counter)
             self._list.insert(new_index, test_value)
             self._linked_list.add_at_index(new_index, test_value)
+            self._skip_list.add_at_index(new_index, test_value)
+            self._unrolled_linked_list.add_at_index(new_index, test_value)
             self._dict[test_value] = None
             self._tree.insert_node(test_value, None)
 
@@ -226,16 +298,701 @@ class DeleteTimeAnalyzer(TimeAnalyzer):
 
             list_delete_time = timeit.timeit(lambda: self._list.remove(key_to_delete), number=1)
             linked_list_delete_time = timeit.timeit(lambda: self._linked_list.delete_from_index(item_to_delete_idx), number=1)
+            skip_list_delete_time = timeit.timeit(lambda: self._skip_list.delete_from_index(item_to_delete_idx), number=1)
+            unrolled_linked_list_delete_time = timeit.timeit(
+                lambda: self._unrolled_linked_list.delete_from_index(item_to_delete_idx), number=1)
             dict_delete_time = timeit.timeit(lambda: self._dict.pop(key_to_delete), number=1)
             tree_delete_time = timeit.timeit(lambda: self._tree.delete_node(key_to_delete), number=1)
 
             self._times.loc[run_idx, :] = [list_delete_time,
                                            linked_list_delete_time,
                                            dict_delete_time,
-                                           tree_delete_time]
+                                           tree_delete_time,
+                                           skip_list_delete_time,
+                                           unrolled_linked_list_delete_time]
             run_idx -= 1
 
 
+class QueueThroughputAnalyzer:
+
+    def __init__(self, max_operations):
+        self.__max_operations = max_operations
+        self._times = pd.DataFrame(columns=['queue', 'ring_buffer_queue'])
+
+    @staticmethod
+    def __get_sampling_amounts(max_operations):
+        amounts = []
+        power = 1000
+        while power <= max_operations:
+            for multiplier in [1, 2, 5]:
+                if power * multiplier <= max_operations:
+                    amounts.append(power * multiplier)
+            power *= 10
+
+        return amounts
+
+    @staticmethod
+    def __enqueue_and_dequeue(queue, amount_of_items):
+        for value in range(amount_of_items):
+            queue.add(value)
+        while not queue.is_empty():
+            queue.remove()
+
+    def measure_times(self):
+        for amount_of_items in self.__get_sampling_amounts(self.__max_operations):
+            queue_time = timeit.timeit(lambda: self.__enqueue_and_dequeue(Queue(), amount_of_items), number=1)
+            ring_buffer_time = timeit.timeit(lambda: self.__enqueue_and_dequeue(RingBufferQueue(), amount_of_items),
+                                             number=1)
+            self._times.loc[amount_of_items, :] = [queue_time, ring_buffer_time]
+
+    def plot_times(self):
+        plt.style.use("bmh")
+        fig, axes = plt.subplots(2, 1, figsize=(6, 8), sharex=True)
+
+        self._times.plot(ax=axes[0], marker='o')
+        reference_scale = self._times['queue'].iloc[0] / self._times.index[0]
+        axes[0].plot(self._times.index, [n * reference_scale for n in self._times.index], '--', label='O(n)')
+        axes[0].set_ylabel("Time (s)", fontsize=14)
+        axes[0].set_yscale('log')
+        axes[0].legend(loc='upper left')
+
+        throughput = self._times.rdiv(2 * self._times.index.to_series(), axis=0)
+        throughput.plot(ax=axes[1], marker='o')
+        axes[1].set_ylabel("Operations per second", fontsize=14)
+
+        for ax in axes:
+            ax.set_xlabel("Amount of data (n)", fontsize=14)
+            ax.set_xscale('log')
+            ax.grid(True)
+
+        fig.suptitle("Queue Throughput", fontsize=16, fontweight='bold')
+        fig.tight_layout()
+
+
+class ConcurrencyThroughputAnalyzer:
+
+    def __init__(self, operations_per_thread, thread_counts):
+        self.__operations_per_thread = operations_per_thread
+        self.__thread_counts = thread_counts
+        self._throughput = pd.DataFrame(columns=['concurrent_queue', 'concurrent_stack'])
+
+    def __stress(self, container, thread_count):
+        """
+            Run half of the threads as producers and half as consumers sharing the container
+        :param container: thread-safe container under test
+        :param thread_count: amount of threads (producers + consumers)
+        :return: operations per second
+        """
+        producers = max(thread_count // 2, 1)
+
+        def produce():
+            for value in range(self.__operations_per_thread):
+                container.add(value)
+
+        def consume():
+            for _ in range(self.__operations_per_thread):
+                container.remove()
+
+        workers = [threading.Thread(target=produce) for _ in range(producers)]
+        workers += [threading.Thread(target=consume) for _ in range(producers)]
+
+        def run_workers():
+            for worker in workers:
+                worker.start()
+            for worker in workers:
+                worker.join()
+
+        elapsed_time = timeit.timeit(run_workers, number=1)
+        return 2 * producers * self.__operations_per_thread / elapsed_time
+
+    def measure_times(self):
+        for thread_count in self.__thread_counts:
+            self._throughput.loc[thread_count, :] = [self.__stress(ConcurrentQueue(max_size=1024), thread_count),
+                                                     self.__stress(ConcurrentStack(max_size=1024), thread_count)]
+
+    def plot_times(self):
+        plt.style.use("bmh")
+        fig, axes = plt.subplots(1, 1)
+        self._throughput.plot(ax=axes, marker='o')
+
+        axes.set_xlabel("Threads", fontsize=14)
+        axes.set_ylabel("Operations per second", fontsize=14)
+        axes.grid(True)
+        fig.suptitle("Concurrent Throughput", fontsize=16, fontweight='bold')
+        fig.tight_layout()
+
+
+class SnapshotReadThroughputAnalyzer:
+    """
+        Compare readers scanning a BinaryTree guarded by a lock against readers scanning
+        snapshots from a PersistentBinaryTree, both while a writer keeps inserting keys
+    """
+
+    def __init__(self, initial_keys, written_keys, reader_counts):
+        self.__initial_keys = initial_keys
+        self.__written_keys = written_keys
+        self.__reader_counts = reader_counts
+        self._reads = pd.DataFrame(columns=['locked_tree', 'snapshot_tree'])
+        self._writes = pd.DataFrame(columns=['locked_tree', 'snapshot_tree'])
+
+    @staticmethod
+    def __stress(insert, read, reader_count, written_keys):
+        """
+            Run one writer and reader_count readers until the writer is done
+        :param insert: function inserting a key
+        :param read: function scanning the whole tree
+        :param reader_count: amount of reader threads
+        :param written_keys: keys inserted by the writer
+        :return: full scans per second, insertions per second
+        """
+        writer_done = threading.Event()
+        scans = [0] * reader_count
+
+        def write():
+            for key in written_keys:
+                insert(key)
+            writer_done.set()
+
+        def scan(reader):
+            while not writer_done.is_set():
+                read()
+                scans[reader] += 1
+
+        workers = [threading.Thread(target=write)]
+        workers += [threading.Thread(target=scan, args=(reader,)) for reader in range(reader_count)]
+
+        def run_workers():
+            for worker in workers:
+                worker.start()
+            for worker in workers:
+                worker.join()
+
+        elapsed_time = timeit.timeit(run_workers, number=1)
+        return sum(scans) / elapsed_time, len(written_keys) / elapsed_time
+
+    def measure_times(self):
+        written_keys = range(-self.__written_keys, 0)
+        for reader_count in self.__reader_counts:
+            tree_lock = threading.Lock()
+            locked_tree = BinaryTree.from_sorted([(key, None) for key in range(self.__initial_keys)], balanced=True)
+
+            def locked_insert(key):
+                with tree_lock:
+                    locked_tree.insert_node(key)
+
+            def locked_read():
+                with tree_lock:
+                    locked_tree.get_sorted_tree_keys()
+
+            snapshot_tree = PersistentBinaryTree()
+            for key in range(self.__initial_keys):
+                snapshot_tree.insert_node(key)
+
+            locked_throughput = self.__stress(locked_insert, locked_read, reader_count, written_keys)
+            snapshot_throughput = self.__stress(snapshot_tree.insert_node,
+                                                lambda: snapshot_tree.snapshot().get_sorted_tree_keys(),
+                                                reader_count, written_keys)
+            self._reads.loc[reader_count, :] = [locked_throughput[0], snapshot_throughput[0]]
+            self._writes.loc[reader_count, :] = [locked_throughput[1], snapshot_throughput[1]]
+
+    def plot_times(self):
+        plt.style.use("bmh")
+        fig, axes = plt.subplots(1, 2, figsize=(14, 6))
+        self._reads.plot(ax=axes[0], marker='o')
+        self._writes.plot(ax=axes[1], marker='o')
+
+        axes[0].set_ylabel("Full scans per second", fontsize=14)
+        axes[1].set_ylabel("Insertions per second", fontsize=14)
+        for ax in axes:
+            ax.set_xlabel("Reader threads", fontsize=14)
+            ax.grid(True)
+        fig.suptitle("Reader Throughput Under Writes", fontsize=16, fontweight='bold')
+        fig.tight_layout()
+
+
+class PriorityQueueAnalyzer:
+    """
+        Compare Dijkstra-like workloads (pop the minimum, then decrease some pending priorities)
+    """
+    DECREASES_PER_POP = 2
+
+    def __init__(self, max_datapoints):
+        self.__max_datapoints = max_datapoints
+        self._times = pd.DataFrame(columns=['priority_queue', 'heapq', 'sort_per_iteration'])
+
+    @staticmethod
+    def __get_sampling_amounts(max_datapoints):
+        amounts = []
+        amount = 100
+        while amount <= max_datapoints:
+            amounts.append(amount)
+            amount *= 2
+
+        return amounts
+
+    def __build_workload(self, datapoints):
+        priorities = [random.randint(0, 10 * datapoints) for _ in range(datapoints)]
+        decreases = [[(random.randrange(datapoints), random.random()) for _ in range(self.DECREASES_PER_POP)]
+                     for _ in range(datapoints)]
+        return priorities, decreases
+
+    @staticmethod
+    def __run_priority_queue(priorities, decreases):
+        pending = PriorityQueue.heapify(enumerate(priorities))
+        for pop_decreases in decreases:
+            pending.pop()
+            for item, factor in pop_decreases:
+                if item in pending:
+                    pending.decrease_key(item, pending.get_priority(item) * factor)
+
+    @staticmethod
+    def __run_heapq(priorities, decreases):
+        current_priorities = list(priorities)
+        processed = [False] * len(priorities)
+        pending = [(priority, item) for item, priority in enumerate(priorities)]
+        heapq.heapify(pending)
+        for pop_decreases in decreases:
+            # Lazy deletion: skip entries with outdated priorities
+            while True:
+                priority, item = heapq.heappop(pending)
+                if not processed[item] and priority == current_priorities[item]:
+                    break
+            processed[item] = True
+            for item, factor in pop_decreases:
+                if not processed[item]:
+                    current_priorities[item] *= factor
+                    heapq.heappush(pending, (current_priorities[item], item))
+
+    @staticmethod
+    def __run_sort_per_iteration(priorities, decreases):
+        current_priorities = list(priorities)
+        pending = list(range(len(priorities)))
+        processed = [False] * len(priorities)
+        for pop_decreases in decreases:
+            pending.sort(key=lambda pending_item: current_priorities[pending_item], reverse=True)
+            processed[pending.pop()] = True
+            for item, factor in pop_decreases:
+                if not processed[item]:
+                    current_priorities[item] *= factor
+
+    def measure_times(self):
+        for datapoints in self.__get_sampling_amounts(self.__max_datapoints):
+            priorities, decreases = self.__build_workload(datapoints)
+            self._times.loc[datapoints, :] = [
+                timeit.timeit(lambda: self.__run_priority_queue(priorities, decreases), number=1),
+                timeit.timeit(lambda: self.__run_heapq(priorities, decreases), number=1),
+                timeit.timeit(lambda: self.__run_sort_per_iteration(priorities, decreases), number=1)
+            ]
+
+    def plot_times(self):
+        plt.style.use("bmh")
+        fig, axes = plt.subplots(1, 1)
+        self._times.plot(ax=axes, marker='o')
+
+        axes.set_xlabel("Amount of data (n)", fontsize=14)
+        axes.set_ylabel("Time (s)", fontsize=14)
+        axes.set_xscale('log')
+        axes.set_yscale('log')
+        axes.grid(True)
+        fig.suptitle("Priority Queue Time", fontsize=16, fontweight='bold')
+        fig.tight_layout()
+
+
+class SortedInsertTimeAnalyzer:
+    """
+        Compare the insertion of sorted keys in unbalanced and balanced trees
+    """
+
+    def __init__(self, datapoints):
+        self.__datapoints = datapoints
+        self.__trees = {'tree': BinaryTree(), 'balanced_tree': BinaryTree(balanced=True)}
+        self._times = pd.DataFrame(columns=list(self.__trees.keys()))
+
+    def measure_times(self):
+        for sorted_key in range(self.__datapoints):
+            self._times.loc[sorted_key, :] = [timeit.timeit(lambda: tree.insert_node(sorted_key, None), number=1)
+                                              for tree in self.__trees.values()]
+
+        for tree_name, tree in self.__trees.items():
+            print(f"{tree_name} height: {tree.get_height()}")
+
+    def plot_times(self):
+        plt.style.use("bmh")
+        fig, axes = plt.subplots(1, 1)
+        self._times.rolling(window=50).mean().plot(ax=axes)
+
+        axes.set_xlabel("Amount of data (n)", fontsize=14)
+        axes.set_ylabel("Time (s)", fontsize=14)
+        axes.set_xscale('log')
+        axes.set_yscale('log')
+        axes.grid(True)
+        axes.legend(loc='upper left')
+        fig.suptitle("Sorted Keys Insertion Time", fontsize=16, fontweight='bold')
+        fig.tight_layout()
+
+
+class IntegerKeyThroughputAnalyzer:
+    """
+        Compare trees ordering integer keys natively against ordering them by their string
+    """
+
+    def __init__(self, max_datapoints):
+        self.__max_datapoints = max_datapoints
+        self._throughput = pd.DataFrame(columns=['tree_native_keys', 'tree_str_keys'])
+
+    @staticmethod
+    def __insert_and_lookup(tree, keys):
+        for key in keys:
+            tree.insert_node(key, None)
+        for key in keys:
+            tree.get_value(key)
+
+    def measure_times(self):
+        datapoints = 1000
+        while datapoints <= self.__max_datapoints:
+            keys = random.sample(range(100 * datapoints), datapoints)
+            native_time = timeit.timeit(lambda: self.__insert_and_lookup(BinaryTree(), keys), number=1)
+            str_time = timeit.timeit(lambda: self.__insert_and_lookup(BinaryTree(key=str), keys), number=1)
+            self._throughput.loc[datapoints, :] = [2 * datapoints / native_time, 2 * datapoints / str_time]
+            datapoints *= 2
+
+    def plot_times(self):
+        plt.style.use("bmh")
+        fig, axes = plt.subplots(1, 1)
+        self._throughput.plot(ax=axes, marker='o')
+
+        axes.set_xlabel("Amount of data (n)", fontsize=14)
+        axes.set_ylabel("Operations per second", fontsize=14)
+        axes.set_xscale('log')
+        axes.grid(True)
+        fig.suptitle("Integer Keys Throughput", fontsize=16, fontweight='bold')
+        fig.tight_layout()
+
+
+class BulkLoadTimeAnalyzer:
+    """
+        Compare building a tree with one insertion per key against bulk-loading the keys
+    """
+
+    def __init__(self, max_datapoints):
+        self.__max_datapoints = max_datapoints
+        self._times = pd.DataFrame(columns=['balanced_inserts', 'from_sorted', 'from_unsorted'])
+
+    @staticmethod
+    def __insert_one_by_one(items):
+        tree = BinaryTree(balanced=True)
+        for key, data in items:
+            tree.insert_node(key, data)
+
+    def measure_times(self):
+        datapoints = 1000
+        while datapoints <= self.__max_datapoints:
+            sorted_items = [(key, None) for key in range(datapoints)]
+            shuffled_items = random.sample(sorted_items, datapoints)
+            self._times.loc[datapoints, :] = [
+                timeit.timeit(lambda: self.__insert_one_by_one(sorted_items), number=1),
+                timeit.timeit(lambda: BinaryTree.from_sorted(sorted_items), number=1),
+                timeit.timeit(lambda: BinaryTree.from_unsorted(shuffled_items), number=1)]
+            datapoints *= 2
+
+    def plot_times(self):
+        plt.style.use("bmh")
+        fig, axes = plt.subplots(1, 1)
+        self._times.plot(ax=axes, marker='o')
+
+        axes.set_xlabel("Amount of data (n)", fontsize=14)
+        axes.set_ylabel("Time (s)", fontsize=14)
+        axes.set_xscale('log')
+        axes.set_yscale('log')
+        axes.grid(True)
+        fig.suptitle("Tree Bulk-Load Time", fontsize=16, fontweight='bold')
+        fig.tight_layout()
+
+
+class TreeLayoutAnalyzer:
+    """
+        Compare memory and lookup latency from the balanced BinaryTree (one object per key)
+        against the BTree (up to fanout keys per node) and a dict
+    """
+
+    def __init__(self, max_datapoints, lookups=100000):
+        self.__max_datapoints = max_datapoints
+        self.__lookups = lookups
+        self._memory = pd.DataFrame(columns=['tree', 'b_tree', 'dict'])
+        self._latency = pd.DataFrame(columns=['tree', 'b_tree', 'dict'])
+
+    @staticmethod
+    def __build_structures(keys):
+        b_tree = BTree()
+        for key in keys:
+            b_tree.insert_node(key, None)
+
+        return {'tree': BinaryTree.from_unsorted([(key, None) for key in keys], balanced=True),
+                'b_tree': b_tree,
+                'dict': dict.fromkeys(keys)}
+
+    def measure_times(self):
+        datapoints = 125000
+        while datapoints <= self.__max_datapoints:
+            keys = random.sample(range(10 * datapoints), datapoints)
+            searched_keys = random.choices(keys, k=self.__lookups)
+            structures = self.__build_structures(keys)
+
+            self._memory.loc[datapoints, :] = [asizeof.asizeof(structure) for structure in structures.values()]
+            lookups = [lambda: [structures['tree'].get_value(key) for key in searched_keys],
+                       lambda: [structures['b_tree'].get_value(key) for key in searched_keys],
+                       lambda: [structures['dict'][key] for key in searched_keys]]
+            self._latency.loc[datapoints, :] = [timeit.timeit(lookup, number=1) / self.__lookups for lookup in lookups]
+            datapoints *= 2
+
+    def plot_times(self):
+        plt.style.use("bmh")
+        fig, axes = plt.subplots(1, 2, figsize=(14, 6))
+        self._memory.plot(ax=axes[0], marker='o')
+        self._latency.plot(ax=axes[1], marker='o')
+
+        axes[0].set_ylabel("Memory usage (Bytes)", fontsize=14)
+        axes[1].set_ylabel("Time per lookup (s)", fontsize=14)
+        for ax in axes:
+            ax.set_xlabel("Amount of data (n)", fontsize=14)
+            ax.set_xscale('log')
+            ax.grid(True)
+        fig.suptitle("Tree Layout Memory and Lookup Latency", fontsize=16, fontweight='bold')
+        fig.tight_layout()
+
+
+class GraphSetupTimeAnalyzer:
+    """
+        Compare the traversal setup from a deep copy of the adjacency (former get_graph) against
+        the read-only graph view, along with a full BFS run for reference
+    """
+
+    def __init__(self, max_edges, edges_per_vertice=10):
+        self.__max_edges = max_edges
+        self.__edges_per_vertice = edges_per_vertice
+        self._times = pd.DataFrame(columns=['deepcopy_setup', 'view_setup', 'bfs_run'])
+
+    def __build_graph(self, edges):
+        vertices = edges // self.__edges_per_vertice
+        graph = AdjListGraph()
+        for vertice in range(vertices):
+            graph.add_vertice(vertice)
+        for vertice in range(vertices):
+            for neighbor in random.sample(range(vertices), self.__edges_per_vertice):
+                graph.add_edge(vertice, neighbor)
+        return graph
+
+    def measure_times(self):
+        edges = 62500
+        while edges <= self.__max_edges:
+            graph = self.__build_graph(edges)
+            self._times.loc[edges, :] = [timeit.timeit(lambda: copy.deepcopy(graph), number=1),
+                                         timeit.timeit(graph.get_graph, number=1),
+                                         timeit.timeit(lambda: BFS(graph).run(0), number=1)]
+            edges *= 2
+
+    def plot_times(self):
+        plt.style.use("bmh")
+        fig, axes = plt.subplots(1, 1)
+        self._times.plot(ax=axes, marker='o')
+
+        axes.set_xlabel("Amount of edges (E)", fontsize=14)
+        axes.set_ylabel("Time (s)", fontsize=14)
+        axes.set_xscale('log')
+        axes.set_yscale('log')
+        axes.grid(True)
+        fig.suptitle("Graph Traversal Setup Time", fontsize=16, fontweight='bold')
+        fig.tight_layout()
+
+
+class GraphChurnAnalyzer:
+    """
+        Measure the time to delete a batch of vertices from Adjacency Lists of growing size and
+        add them back with new edges. With the in-edge sets, the time only depends on the degrees.
+    """
+
+    def __init__(self, max_vertices, churn_size=1000, edges_per_vertice=10):
+        self.__max_vertices = max_vertices
+        self.__churn_size = churn_size
+        self.__edges_per_vertice = edges_per_vertice
+        self._times = pd.DataFrame(columns=['delete_vertices', 'add_vertices'])
+
+    def __build_graph(self, vertices):
+        graph = AdjListGraph()
+        for vertice in range(vertices):
+            graph.add_vertice(vertice)
+        for vertice in range(vertices):
+            for neighbor in random.sample(range(vertices), self.__edges_per_vertice):
+                graph.add_edge(vertice, neighbor)
+        return graph
+
+    def __add_vertices(self, graph, churned_vertices, vertices):
+        for vertice in churned_vertices:
+            graph.add_vertice(vertice)
+        graph_view = graph.get_graph()
+        for vertice in churned_vertices:
+            for neighbor in random.sample(range(vertices), self.__edges_per_vertice):
+                if neighbor in graph_view:
+                    graph.add_edge(vertice, neighbor)
+
+    def measure_times(self):
+        vertices = 12500
+        while vertices <= self.__max_vertices:
+            graph = self.__build_graph(vertices)
+            churned_vertices = random.sample(range(vertices), self.__churn_size)
+            self._times.loc[vertices, :] = [
+                timeit.timeit(lambda: [graph.delete_vertice(vertice) for vertice in churned_vertices], number=1),
+                timeit.timeit(lambda: self.__add_vertices(graph, churned_vertices, vertices), number=1)]
+            vertices *= 2
+
+    def plot_times(self):
+        plt.style.use("bmh")
+        fig, axes = plt.subplots(1, 1)
+        self._times.plot(ax=axes, marker='o')
+
+        axes.set_xlabel("Amount of vertices (V)", fontsize=14)
+        axes.set_ylabel("Time (s)", fontsize=14)
+        axes.set_xscale('log')
+        axes.set_yscale('log')
+        axes.grid(True)
+        fig.suptitle("Adjacency List Vertices Churn Time", fontsize=16, fontweight='bold')
+        fig.tight_layout()
+
+
+class FrozenGraphTraversalAnalyzer:
+    """
+        Compare BFS over an Adjacency List against BFS over its frozen CSR copy,
+        along with the one-time freeze cost
+    """
+
+    def __init__(self, max_edges, edges_per_vertice=10):
+        self.__max_edges = max_edges
+        self.__edges_per_vertice = edges_per_vertice
+        self._times = pd.DataFrame(columns=['adj_list_bfs', 'csr_bfs', 'freeze'])
+
+    def __build_graph(self, edges):
+        vertices = edges // self.__edges_per_vertice
+        graph = AdjListGraph()
+        for vertice in range(vertices):
+            graph.add_vertice(vertice)
+        for vertice in range(vertices):
+            for neighbor in random.sample(range(vertices), self.__edges_per_vertice):
+                graph.add_edge(vertice, neighbor)
+        return graph
+
+    def measure_times(self):
+        edges = 62500
+        while edges <= self.__max_edges:
+            graph = self.__build_graph(edges)
+            frozen_graph = graph.freeze()
+            self._times.loc[edges, :] = [timeit.timeit(lambda: BFS(graph).run(0), number=1),
+                                         timeit.timeit(lambda: BFS(frozen_graph).run(0), number=1),
+                                         timeit.timeit(graph.freeze, number=1)]
+            edges *= 2
+
+    def plot_times(self):
+        plt.style.use("bmh")
+        fig, axes = plt.subplots(1, 1)
+        self._times.plot(ax=axes, marker='o')
+
+        axes.set_xlabel("Amount of edges (E)", fontsize=14)
+        axes.set_ylabel("Time (s)", fontsize=14)
+        axes.set_xscale('log')
+        axes.set_yscale('log')
+        axes.grid(True)
+        fig.suptitle("Frozen Graph Traversal Time", fontsize=16, fontweight='bold')
+        fig.tight_layout()
+
+
+class SparseDijkstraAnalyzer:
+    """
+        Compare Dijkstra over an Adjacency Matrix against a Weighted Adjacency List holding
+        the same sparse (road-network-like) graph, with a few edges per vertice
+    """
+
+    def __init__(self, max_vertices, edges_per_vertice=3):
+        self.__max_vertices = max_vertices
+        self.__edges_per_vertice = edges_per_vertice
+        self._times = pd.DataFrame(columns=['adj_matrix', 'weighted_adj_list'])
+
+    @staticmethod
+    def __build_graph(graph_type, vertices, edges):
+        graph = graph_type()
+        for vertice in range(vertices):
+            graph.add_vertice(vertice)
+        for source_key, dest_key, weight in edges:
+            graph.add_edge(source_key, dest_key, weight)
+        return graph
+
+    def measure_times(self):
+        vertices = 500
+        while vertices <= self.__max_vertices:
+            edges = [(vertice, random.randrange(vertices), random.uniform(1, 10))
+                     for vertice in range(vertices) for _ in range(self.__edges_per_vertice)]
+            matrix_graph = self.__build_graph(AdjMatrixGraph, vertices, edges)
+            list_graph = self.__build_graph(WeightedAdjListGraph, vertices, edges)
+            self._times.loc[vertices, :] = [timeit.timeit(lambda: Dijkstra(matrix_graph).run(0), number=1),
+                                            timeit.timeit(lambda: Dijkstra(list_graph).run(0), number=1)]
+            vertices *= 2
+
+    def plot_times(self):
+        plt.style.use("bmh")
+        fig, axes = plt.subplots(1, 1)
+        self._times.plot(ax=axes, marker='o')
+
+        axes.set_xlabel("Amount of vertices (V)", fontsize=14)
+        axes.set_ylabel("Time (s)", fontsize=14)
+        axes.set_xscale('log')
+        axes.set_yscale('log')
+        axes.grid(True)
+        fig.suptitle("Dijkstra Time on Sparse Graphs", fontsize=16, fontweight='bold')
+        fig.tight_layout()
+
+
+class MatrixGraphBuildTimeAnalyzer:
+    """
+        Compare building Adjacency Matrices backed by Python lists and by NumPy arrays,
+        adding the vertices one by one and the edges in a single batch
+    """
+
+    def __init__(self, max_vertices, edges_per_vertice=20):
+        self.__max_vertices = max_vertices
+        self.__edges_per_vertice = edges_per_vertice
+        self._times = pd.DataFrame(columns=['list_matrix', 'numpy_matrix'])
+
+    @staticmethod
+    def __build(dtype, vertices, source_keys, dest_keys, weights):
+        graph = AdjMatrixGraph(dtype=dtype)
+        for vertice in range(vertices):
+            graph.add_vertice(vertice)
+        graph.add_edges(source_keys, dest_keys, weights)
+
+    def measure_times(self):
+        vertices = 500
+        while vertices <= self.__max_vertices:
+            edges = vertices * self.__edges_per_vertice
+            source_keys = np.random.randint(0, vertices, edges).tolist()
+            dest_keys = np.random.randint(0, vertices, edges).tolist()
+            weights = np.random.random(edges).tolist()
+            self._times.loc[vertices, :] = [
+                timeit.timeit(lambda: self.__build(None, vertices, source_keys, dest_keys, weights), number=1),
+                timeit.timeit(lambda: self.__build("float32", vertices, source_keys, dest_keys, weights), number=1)]
+            vertices *= 2
+
+    def plot_times(self):
+        plt.style.use("bmh")
+        fig, axes = plt.subplots(1, 1)
+        self._times.plot(ax=axes, marker='o')
+
+        axes.set_xlabel("Amount of vertices (V)", fontsize=14)
+        axes.set_ylabel("Time (s)", fontsize=14)
+        axes.set_xscale('log')
+        axes.set_yscale('log')
+        axes.grid(True)
+        fig.suptitle("Adjacency Matrix Build Time", fontsize=16, fontweight='bold')
+        fig.tight_layout()
+
+
 class Analyzer:
     OUTPUT_DIR = "../outputs"
 
@@ -255,6 +1012,12 @@ class Analyzer:
         plt.savefig(self.OUTPUT_DIR + "/memory_usage.png")
         print("Done!")
 
+    def evaluate_memory_footprint(self):
+        print("Processing memory footprint ..")
+        footprint = MemoryAnalyzer.measure_final_footprint(1000000)
+        print(footprint / footprint['list'])
+        print("Done!")
+
     def evaluate_time(self, time_analyzer:TimeAnalyzer, output_file):
         time_analyzer.measure_times()
         time_analyzer.plot_times()
@@ -280,10 +1043,102 @@ class Analyzer:
         self.evaluate_time(search_timer, "/delete_time.png")
         print("Done!")
 
+    def evaluate_queue_throughput(self):
+        print("Processing queue throughput ..")
+        throughput_timer = QueueThroughputAnalyzer(2000000)
+        self.evaluate_time(throughput_timer, "/queue_throughput.png")
+        print("Done!")
+
+    def evaluate_concurrent_throughput(self):
+        print("Processing concurrent throughput ..")
+        throughput_timer = ConcurrencyThroughputAnalyzer(20000, [2, 4, 8, 16, 32])
+        self.evaluate_time(throughput_timer, "/concurrent_throughput.png")
+        print("Done!")
+
+    def evaluate_priority_queue_time(self):
+        print("Processing priority queue time ..")
+        priority_queue_timer = PriorityQueueAnalyzer(12800)
+        self.evaluate_time(priority_queue_timer, "/priority_queue_time.png")
+        print("Done!")
+
+    def evaluate_sorted_insertion_time(self):
+        print("Processing sorted keys insertion time ..")
+        sorted_insert_timer = SortedInsertTimeAnalyzer(5000)
+        self.evaluate_time(sorted_insert_timer, "/sorted_insertion_time.png")
+        print("Done!")
+
+    def evaluate_integer_keys_throughput(self):
+        print("Processing integer keys throughput ..")
+        integer_keys_timer = IntegerKeyThroughputAnalyzer(256000)
+        self.evaluate_time(integer_keys_timer, "/integer_keys_throughput.png")
+        print("Done!")
+
+    def evaluate_bulk_load_time(self):
+        print("Processing tree bulk-load time ..")
+        bulk_load_timer = BulkLoadTimeAnalyzer(512000)
+        self.evaluate_time(bulk_load_timer, "/bulk_load_time.png")
+        print("Done!")
+
+    def evaluate_tree_layout(self):
+        print("Processing tree layout memory and lookup latency ..")
+        tree_layout_timer = TreeLayoutAnalyzer(2000000)
+        self.evaluate_time(tree_layout_timer, "/tree_layout.png")
+        print("Done!")
+
+    def evaluate_snapshot_read_throughput(self):
+        print("Processing reader throughput under writes ..")
+        snapshot_timer = SnapshotReadThroughputAnalyzer(10000, 20000, [1, 2, 4, 8])
+        self.evaluate_time(snapshot_timer, "/snapshot_read_throughput.png")
+        print("Done!")
+
+    def evaluate_graph_setup_time(self):
+        print("Processing graph traversal setup time ..")
+        graph_setup_timer = GraphSetupTimeAnalyzer(1000000)
+        self.evaluate_time(graph_setup_timer, "/graph_setup_time.png")
+        print("Done!")
+
+    def evaluate_graph_churn_time(self):
+        print("Processing graph churn time ..")
+        graph_churn_timer = GraphChurnAnalyzer(200000)
+        self.evaluate_time(graph_churn_timer, "/graph_churn_time.png")
+        print("Done!")
+
+    def evaluate_frozen_graph_traversal_time(self):
+        print("Processing frozen graph traversal time ..")
+        frozen_traversal_timer = FrozenGraphTraversalAnalyzer(1000000)
+        self.evaluate_time(frozen_traversal_timer, "/frozen_graph_traversal_time.png")
+        print("Done!")
+
+    def evaluate_sparse_dijkstra_time(self):
+        print("Processing sparse graph dijkstra time ..")
+        sparse_dijkstra_timer = SparseDijkstraAnalyzer(8000)
+        self.evaluate_time(sparse_dijkstra_timer, "/sparse_dijkstra_time.png")
+        print("Done!")
+
+    def evaluate_matrix_graph_build_time(self):
+        print("Processing adjacency matrix build time ..")
+        matrix_build_timer = MatrixGraphBuildTimeAnalyzer(4000)
+        self.evaluate_time(matrix_build_timer, "/matrix_graph_build_time.png")
+        print("Done!")
+
 
 if __name__ == "__main__":
     analyzer = Analyzer()
     # analyzer.evaluate_memory()
+    # analyzer.evaluate_memory_footprint()
     # analyzer.evaluate_insertion_time()
     # analyzer.evaluate_search_time()
     analyzer.evaluate_delete_time()
+    # analyzer.evaluate_queue_throughput()
+    # analyzer.evaluate_concurrent_throughput()
+    # analyzer.evaluate_priority_queue_time()
+    # analyzer.evaluate_sorted_insertion_time()
+    # analyzer.evaluate_integer_keys_throughput()
+    # analyzer.evaluate_bulk_load_time()
+    # analyzer.evaluate_tree_layout()
+    # analyzer.evaluate_snapshot_read_throughput()
+    # analyzer.evaluate_graph_setup_time()
+    # analyzer.evaluate_matrix_graph_build_time()
+    # analyzer.evaluate_frozen_graph_traversal_time()
+    # analyzer.evaluate_graph_churn_time()
+    # analyzer.evaluate_sparse_dijkstra_time()
@@ -0,0 +1,411 @@
+import io
+
+from src.data_structures.basic_data_structures import write_indexed_rows
+
+
+class UnrolledNode:
+
+    def __init__(self, items, next_node):
+        self.items = items
+        self.next = next_node
+
+
+class UnrolledLinkedList:
+    """
+        Linked List class storing chunks of items per node, which reduces the amount
+        of nodes to be visited (and created) by the chunk capacity
+    """
+
+    def __init__(self, chunk_capacity=64):
+        if chunk_capacity < 2:
+            raise ValueError("Invalid chunk capacity!")
+
+        self.__head = None
+        self.__tail = None
+        self.__chunk_capacity = chunk_capacity
+        self.__linked_list_length = 0
+
+    def is_empty(self):
+        """
+            Verifies if the List is empty
+        :return: emptiness status
+        """
+        if self.__head is None:
+            return True
+
+        return False
+
+    def chunk_capacity(self):
+        """
+            Max amount of items held by each node
+        :return: chunk capacity
+        """
+        return self.__chunk_capacity
+
+    def __locate(self, index:int):
+        """
+            Retrieve the node holding the item in defined index position
+        :param index: position to be reached
+        :return: node, position of the item inside the node, parent node
+        """
+        if index < 0 or index >= self.__linked_list_length:
+            raise IndexError("Index out of range!")
+
+        current_node = self.__head
+        parent_node = None
+        while index >= len(current_node.items):
+            index -= len(current_node.items)
+            parent_node = current_node
+            current_node = current_node.next
+
+        return current_node, index, parent_node
+
+    def __unlink(self, node, parent_node):
+        """
+            Remove an empty node from the chain
+        :param node: node to be removed
+        :param parent_node: node preceding the removed node
+        :return: None
+        """
+        if parent_node is None:
+            self.__head = node.next
+        else:
+            parent_node.next = node.next
+
+        if node is self.__tail:
+            self.__tail = parent_node
+
+    def __split(self, node, offset):
+        """
+            Move the items placed after offset to a new node following the original one
+        :param node: node to be split
+        :param offset: position of the first item to be moved
+        :return: new node
+        """
+        new_node = UnrolledNode(node.items[offset:], node.next)
+        del node.items[offset:]
+        node.next = new_node
+        if node is self.__tail:
+            self.__tail = new_node
+        return new_node
+
+    def __merge_with_next(self, node):
+        """
+            Merge the following node into the provided one when it is less than half full
+        :param node: node to be verified
+        :return: None
+        """
+        next_node = node.next
+        if (next_node is None or len(node.items) >= self.__chunk_capacity // 2 or
+                len(node.items) + len(next_node.items) > self.__chunk_capacity):
+            return
+
+        node.items.extend(next_node.items)
+        node.next = next_node.next
+        if next_node is self.__tail:
+            self.__tail = node
+
+    def __insert(self, index, new_value):
+        """
+            Add an item at the index position (index may be equal to the length)
+        :param index: position to add the new item
+        :param new_value: value to be added to the list
+        :return: None
+        """
+        if self.is_empty():
+            self.__head = self.__tail = UnrolledNode([new_value], None)
+            self.__linked_list_length += 1
+            return
+
+        if index == self.__linked_list_length:
+            if len(self.__tail.items) == self.__chunk_capacity:
+                self.__tail.next = UnrolledNode([], None)
+                self.__tail = self.__tail.next
+            node, offset = self.__tail, len(self.__tail.items)
+        else:
+            node, offset, _ = self.__locate(index)
+
+        if len(node.items) == self.__chunk_capacity:
+            half = self.__chunk_capacity // 2
+            new_node = self.__split(node, half)
+            if offset > half:
+                node, offset = new_node, offset - half
+
+        node.items.insert(offset, new_value)
+        self.__linked_list_length += 1
+
+    def __remove(self, index):
+        """
+            Remove the item at the index position
+        :param index: position to remove the item
+        :return: value from the removed item
+        """
+        node, offset, parent_node = self.__locate(index)
+        removed_value = node.items.pop(offset)
+
+        if not node.items:
+            self.__unlink(node, parent_node)
+        else:
+            self.__merge_with_next(node)
+
+        self.__linked_list_length -= 1
+        return removed_value
+
+    def get_index(self, index:int):
+        """
+            Retrieve the item in defined index position
+        :param index: position to retrieve the data
+        :return: data
+        """
+        if index < 0:
+            index += self.__linked_list_length
+
+        if index == self.__linked_list_length - 1 and index >= 0:
+            return self.__tail.items[-1]
+
+        node, offset, _ = self.__locate(index)
+        return node.items[offset]
+
+    def add_at_head(self, new_value):
+        """
+            Add a new item to the beginning of th list
+        :param new_value: value to be added to the list
+        :return:
+        """
+        self.__insert(0, new_value)
+
+    def add_at_tail(self, new_value):
+        """
+            Add a new item to the end of the list
+        :param new_value: value to be added to the list
+        :return:
+        """
+        self.__insert(self.__linked_list_length, new_value)
+
+    def add_at_index(self, index, new_value):
+        """
+            Add a new item to the specified index position
+        :param index: position to add the new item
+        :param new_value: value to be added to the list
+        :return:
+        """
+        if self.is_empty():
+            raise IndexError
+
+        self.__locate(index)
+        self.__insert(index, new_value)
+
+    def delete_from_head(self):
+        """
+            Remove the first item from the list
+        :return: value from the removed item
+        """
+        if self.is_empty():
+            raise IndexError("Delete from empty list!")
+
+        return self.__remove(0)
+
+    def delete_from_tail(self):
+        """
+            Remove the last item from the list
+        :return: value from the removed item
+        """
+        if self.is_empty():
+            raise IndexError("Delete from empty list!")
+
+        if len(self.__tail.items) > 1:
+            self.__linked_list_length -= 1
+            return self.__tail.items.pop()
+
+        return self.__remove(self.__linked_list_length - 1)
+
+    def delete_from_index(self, index):
+        """
+            Remove the item from the list at index position
+        :param index: position to remove the new item
+        :return: value from the removed item
+        """
+        if self.is_empty():
+            raise IndexError("Delete from empty list!")
+
+        return self.__remove(index)
+
+    @classmethod
+    def from_iterable(cls, values, chunk_capacity=64):
+        """
+            Create a list holding the values in the iteration order
+        :param values: iterable with the values to be added to the list
+        :param chunk_capacity: max amount of items held by each node
+        :return: new list
+        """
+        new_list = cls(chunk_capacity=chunk_capacity)
+        new_list.extend(values)
+        return new_list
+
+    def extend(self, values):
+        """
+            Add the values to the end of the list, filling one chunk at a time
+        :param values: iterable with the values to be added to the list
+        :return: None
+        """
+        if values is self:
+            values = list(values)
+
+        for value in values:
+            if self.__tail is None:
+                self.__head = self.__tail = UnrolledNode([], None)
+            elif len(self.__tail.items) == self.__chunk_capacity:
+                self.__tail.next = UnrolledNode([], None)
+                self.__tail = self.__tail.next
+            self.__tail.items.append(value)
+            self.__linked_list_length += 1
+
+    def extendleft(self, values):
+        """
+            Add the values to the beginning of the list, one after the other (ending in reversed order)
+        :param values: iterable with the values to be added to the list
+        :return: None
+        """
+        if values is self:
+            values = list(values)
+
+        for value in values:
+            self.__insert(0, value)
+
+    def __take_nodes(self, other_list):
+        """
+            Detach all nodes from another list, leaving it empty
+        :param other_list: list to have its nodes taken
+        :return: head, tail and length from the taken chain of nodes
+        """
+        if other_list is self:
+            raise ValueError("Can not splice a list into itself!")
+        if (not isinstance(other_list, UnrolledLinkedList) or
+                other_list.__chunk_capacity != self.__chunk_capacity):
+            raise ValueError("Lists must share the same chunk capacity!")
+
+        taken_nodes = other_list.__head, other_list.__tail, other_list.__linked_list_length
+        other_list.__head = None
+        other_list.__tail = None
+        other_list.__linked_list_length = 0
+        return taken_nodes
+
+    def concat(self, other_list):
+        """
+            Move all items from another list to the end of this list in O(1)
+        :param other_list: list to be emptied into this one
+        :return: None
+        """
+        other_head, other_tail, other_length = self.__take_nodes(other_list)
+        if other_head is None:
+            return
+
+        if self.is_empty():
+            self.__head = other_head
+        else:
+            self.__tail.next = other_head
+
+        self.__tail = other_tail
+        self.__linked_list_length += other_length
+
+    def splice(self, index, other_list):
+        """
+            Move all items from another list into this list, starting at the index position
+        :param index: position to receive the first item from the other list
+        :param other_list: list to be emptied into this one
+        :return: None
+        """
+        if index == self.__linked_list_length:
+            self.concat(other_list)
+            return
+
+        node, offset, parent_node = self.__locate(index)
+        other_head, other_tail, other_length = self.__take_nodes(other_list)
+        if other_head is None:
+            return
+
+        if offset > 0:
+            parent_node = node
+            node = self.__split(node, offset)
+
+        if parent_node is None:
+            self.__head = other_head
+        else:
+            parent_node.next = other_head
+        other_tail.next = node
+
+        self.__linked_list_length += other_length
+
+    def delete_range(self, start, stop):
+        """
+            Remove the items from start (inclusive) to stop (exclusive) in a single pass
+        :param start: position of the first item to be removed
+        :param stop: position after the last item to be removed
+        :return: list holding the removed items
+        """
+        start, stop, _ = slice(start, stop).indices(self.__linked_list_length)
+        removed_items = UnrolledLinkedList(chunk_capacity=self.__chunk_capacity)
+        if start >= stop:
+            return removed_items
+
+        node, offset, parent_node = self.__locate(start)
+        items_to_remove = stop - start
+        while items_to_remove > 0:
+            taken_items = node.items[offset:offset + items_to_remove]
+            del node.items[offset:offset + items_to_remove]
+            removed_items.extend(taken_items)
+            items_to_remove -= len(taken_items)
+
+            if not node.items:
+                self.__unlink(node, parent_node)
+            else:
+                parent_node = node
+            node = node.next
+            offset = 0
+
+        if parent_node is not None:
+            self.__merge_with_next(parent_node)
+
+        self.__linked_list_length -= stop - start
+        return removed_items
+
+    def __len__(self):
+        return self.__linked_list_length
+
+    def __iter__(self):
+        current_node = self.__head
+        while current_node is not None:
+            yield from current_node.items
+            current_node = current_node.next
+
+    def __reversed__(self):
+        nodes = []
+        current_node = self.__head
+        while current_node is not None:
+            nodes.append(current_node)
+            current_node = current_node.next
+
+        for node in reversed(nodes):
+            yield from reversed(node.items)
+
+    def __contains__(self, value):
+        current_node = self.__head
+        while current_node is not None:
+            if value in current_node.items:
+                return True
+            current_node = current_node.next
+        return False
+
+    def write_to(self, stream, chunk_size=1024):
+        """
+            Write the list to a file-like object without building the whole string
+        :param stream: file-like object receiving the list rows
+        :param chunk_size: amount of rows to be joined in a single write call
+        :return: None
+        """
+        write_indexed_rows(stream, self, chunk_size)
+
+    def __str__(self):
+        list_string = io.StringIO()
+        self.write_to(list_string)
+        return list_string.getvalue()
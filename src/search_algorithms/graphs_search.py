@@ -1,7 +1,8 @@
 import math
 
-from src.data_structures.graphs import AdjListGraph, AdjMatrixGraph
-from src.data_structures.basic_data_structures import Queue
+from src.data_structures.graphs import AdjListGraph, AdjMatrixGraph, CSRGraph, WeightedAdjListGraph
+from src.data_structures.basic_data_structures import RingBufferQueue
+from src.data_structures.priority_queue import PriorityQueue
 
 
 class SearchNode:
@@ -13,12 +14,31 @@ class SearchNode:
         self.finish = 0
 
 
+def initialize_csr_nodes(graph:CSRGraph):
+    """
+        Create the search nodes from a CSR graph, reachable both by key and by vertice id
+    :param graph: CSR graph to be searched
+    :return: dictionary of key to node, list of nodes indexed by vertice id
+    """
+    nodes_by_idx = [SearchNode(vertex) for vertex in graph.get_vertice_keys()]
+    return {node.key: node for node in nodes_by_idx}, nodes_by_idx
+
+
 class BFS:
     """
-        Breadth-First Search class to provide graph the shortest paths
+        Breadth-First Search class to provide graph the shortest paths.
+        Frozen CSR graphs are traversed directly over their arrays of vertice ids.
+        With reverse, the edges from an AdjListGraph are followed backwards, finding
+        the shortest paths from every vertice to the search source.
     """
-    def __init__(self, graph:AdjListGraph):
-        self.__graph = graph.get_graph()
+    def __init__(self, graph:AdjListGraph | CSRGraph, frontier_type=RingBufferQueue, reverse=False):
+        if reverse and not isinstance(graph, AdjListGraph):
+            raise ValueError("Reverse search requires an AdjListGraph!")
+
+        self.__source_graph = graph
+        self.__graph = None
+        self.__frontier_type = frontier_type
+        self.__reverse = reverse
         self.__bfs_source = None
         self.__bfs_nodes = {}
 
@@ -29,6 +49,7 @@ class BFS:
         """
         graph_vertices = self.__graph.keys()
 
+        self.__bfs_nodes = {}
         for vertex in graph_vertices:
             self.__bfs_nodes[vertex] = SearchNode(vertex)
 
@@ -38,6 +59,13 @@ class BFS:
         :param search_source: start point for doing the search for other vertices from graph
         :return: Dictionary with nodes from the graph
         """
+        if isinstance(self.__source_graph, CSRGraph):
+            return self.__run_csr(search_source)
+
+        if self.__reverse:
+            self.__graph = self.__source_graph.get_reverse_graph()
+        else:
+            self.__graph = self.__source_graph.get_graph()
         self.__initialize_nodes()
         self.__bfs_source = search_source
 
@@ -47,7 +75,7 @@ class BFS:
         self.__bfs_nodes[search_source].visited = True
         self.__bfs_nodes[search_source].distance = 0
 
-        search_queue = Queue()
+        search_queue = self.__frontier_type()
         search_queue.add(search_source)
 
         while not search_queue.is_empty():
@@ -63,12 +91,47 @@ class BFS:
 
         return self.__bfs_nodes
 
+    def __run_csr(self, search_source):
+        """
+            Execute the BFS search over the vertice ids from a CSR graph
+        :param search_source: start point for doing the search for other vertices from graph
+        :return: Dictionary with nodes from the graph
+        """
+        self.__bfs_nodes, nodes_by_idx = initialize_csr_nodes(self.__source_graph)
+        self.__bfs_source = search_source
+
+        key_idx = self.__source_graph.get_key_idx_map()
+        if search_source not in key_idx:
+            raise KeyError("Source node not in Graph!")
+
+        indptr = self.__source_graph.indptr
+        indices = self.__source_graph.indices
+        source_idx = key_idx[search_source]
+        nodes_by_idx[source_idx].visited = True
+        nodes_by_idx[source_idx].distance = 0
+
+        search_queue = self.__frontier_type()
+        search_queue.add(source_idx)
+
+        while not search_queue.is_empty():
+            node_idx = search_queue.remove()
+            node = nodes_by_idx[node_idx]
+            for neighbor_idx in indices[indptr[node_idx]:indptr[node_idx + 1]]:
+                neighbor_node = nodes_by_idx[neighbor_idx]
+                if not neighbor_node.visited:
+                    neighbor_node.visited = True
+                    neighbor_node.distance = node.distance + 1
+                    neighbor_node.predecessor = node
+                    search_queue.add(neighbor_idx)
+
+        return self.__bfs_nodes
+
     def get_shortest_path(self, source, target):
         """
-            Get the shortest path from source to target
+            Get the shortest path from source to target (from target to source on reverse searches)
         :param source: start vertex
         :param target: final vertex
-        :return: distance and path
+        :return: distance and path, following the direction of the graph edges
         """
         if source != self.__bfs_source:
             raise ChildProcessError("Must run BFS with same source!")
@@ -80,15 +143,18 @@ class BFS:
             node = node.predecessor
         shortest_path.append(node.key)
 
-        shortest_path.reverse()
+        if not self.__reverse:
+            shortest_path.reverse()
         return self.__bfs_nodes[target].distance, shortest_path
 
 class DFS:
     """
-        Depth-First Search class to provide graph topological sort
+        Depth-First Search class to provide graph topological sort.
+        Frozen CSR graphs are traversed directly over their arrays of vertice ids.
     """
-    def __init__(self, graph:AdjListGraph):
-        self.__graph = graph.get_graph()
+    def __init__(self, graph:AdjListGraph | CSRGraph):
+        self.__source_graph = graph
+        self.__graph = None
         self.__dfs_nodes = {}
         self.__time = 0
 
@@ -99,6 +165,7 @@ class DFS:
         """
         graph_vertices = self.__graph.keys()
 
+        self.__dfs_nodes = {}
         for vertex in graph_vertices:
             self.__dfs_nodes[vertex] = SearchNode(vertex)
 
@@ -128,6 +195,10 @@ class DFS:
         :param search_source: start point for doing the search for other vertices from graph
         :return: Dictionary with nodes from the graph
         """
+        if isinstance(self.__source_graph, CSRGraph):
+            return self.__run_csr(search_source)
+
+        self.__graph = self.__source_graph.get_graph()
         self.__initialize_nodes()
 
         if search_source not in self.__dfs_nodes.keys():
@@ -147,6 +218,58 @@ class DFS:
 
         return self.__dfs_nodes
 
+    def __dfs_visit_csr(self, start_idx, nodes_by_idx):
+        """
+            Implements the deepest possible search over vertice ids with an explicit stack,
+            timing the nodes in the same order as the recursive visit
+        :param start_idx: id from the first node to be explored
+        :param nodes_by_idx: search nodes indexed by vertice id
+        :return: None
+        """
+        indptr = self.__source_graph.indptr
+        indices = self.__source_graph.indices
+
+        self.__time += 1
+        nodes_by_idx[start_idx].distance = self.__time
+        nodes_by_idx[start_idx].visited = True
+        stack = [(start_idx, indptr[start_idx])]
+
+        while stack:
+            node_idx, position = stack[-1]
+            if position < indptr[node_idx + 1]:
+                stack[-1] = (node_idx, position + 1)
+                neighbor_node = nodes_by_idx[indices[position]]
+                if not neighbor_node.visited:
+                    neighbor_node.predecessor = nodes_by_idx[node_idx]
+                    self.__time += 1
+                    neighbor_node.distance = self.__time
+                    neighbor_node.visited = True
+                    stack.append((indices[position], indptr[indices[position]]))
+            else:
+                stack.pop()
+                self.__time += 1
+                nodes_by_idx[node_idx].finish = self.__time
+
+    def __run_csr(self, search_source):
+        """
+            Execute the DFS search over the vertice ids from a CSR graph
+        :param search_source: start point for doing the search for other vertices from graph
+        :return: Dictionary with nodes from the graph
+        """
+        self.__dfs_nodes, nodes_by_idx = initialize_csr_nodes(self.__source_graph)
+
+        key_idx = self.__source_graph.get_key_idx_map()
+        if search_source not in key_idx:
+            raise KeyError("Source node not in Graph!")
+
+        self.__time = 0
+        self.__dfs_visit_csr(key_idx[search_source], nodes_by_idx)
+        for node_idx, node in enumerate(nodes_by_idx):
+            if not node.visited:
+                self.__dfs_visit_csr(node_idx, nodes_by_idx)
+
+        return self.__dfs_nodes
+
     def get_topological_sort(self):
         """
             Perform Topological Sorting using DFS
@@ -164,12 +287,19 @@ class DFS:
 
 class Dijkstra:
     """
-        Implementation of Dijkstra algorithm
+        Implementation of Dijkstra algorithm.
+        Adjacency Lists and frozen CSR graphs only have the existing edges from each vertice scanned,
+        instead of a whole matrix row, so the search scales with E instead of V^2. The edges from
+        unweighted Adjacency Lists weigh 1.
     """
-    def __init__(self, graph:AdjMatrixGraph):
-        self.__graph = graph.get_graph()
+    def __init__(self, graph:AdjMatrixGraph | AdjListGraph | CSRGraph):
+        if not isinstance(graph, (AdjMatrixGraph, AdjListGraph, CSRGraph)):
+            raise TypeError("Dijkstra requires an AdjMatrixGraph, AdjListGraph or CSRGraph!")
+
+        self.__source_graph = graph
+        self.__graph = None
         self.__nodes = {}
-        self.__graph_key_map = graph.get_key_idx_map()
+        self.__graph_key_map = {}
 
     def __initialize_nodes(self):
         """
@@ -178,6 +308,7 @@ class Dijkstra:
         """
         graph_vertices = self.__graph_key_map.keys()
 
+        self.__nodes = {}
         for vertex in graph_vertices:
             self.__nodes[vertex] = SearchNode(vertex)
 
@@ -188,11 +319,30 @@ class Dijkstra:
         :param source_node: possible new path to the target
         :param target_node: node having the distance checked
         :param weight: weight to move from source_node to target_node
-        :return: None
+        :return: True if the distance was reduced
         """
         if target_node.distance > source_node.distance + weight:
             target_node.distance = source_node.distance + weight
             target_node.predecessor = source_node
+            return True
+        return False
+
+    def __get_weighted_neighbors(self, vertice_key, idx_to_key):
+        """
+            Get the edges leaving a vertice: the stored neighbors on Adjacency Lists (weighing 1 when unweighted)
+            or the positive row entries on Adjacency Matrices
+        :param vertice_key: key associated to the vertice
+        :param idx_to_key: matrix index to key map (unused on Adjacency Lists)
+        :return: iterable of (neighbor key, weight) pairs
+        """
+        if isinstance(self.__source_graph, WeightedAdjListGraph):
+            return self.__graph[vertice_key].items()
+        if isinstance(self.__source_graph, AdjListGraph):
+            return ((neighbor_key, 1) for neighbor_key in self.__graph[vertice_key])
+
+        row = self.__graph[self.__graph_key_map[vertice_key]]
+        return ((idx_to_key[neighbor_idx], weight) for neighbor_idx, weight in enumerate(row)
+                if self.__source_graph.is_edge_weight(weight))
 
     def run(self, path_source):
         """
@@ -200,6 +350,14 @@ class Dijkstra:
         :param path_source: start point for doing the search for other vertices from graph
         :return: Dictionary with nodes from the graph
         """
+        if isinstance(self.__source_graph, CSRGraph):
+            return self.__run_csr(path_source)
+
+        self.__graph = self.__source_graph.get_graph()
+        if isinstance(self.__source_graph, AdjListGraph):
+            self.__graph_key_map = self.__graph
+        else:
+            self.__graph_key_map = self.__source_graph.get_key_idx_map()
         self.__initialize_nodes()
 
         if path_source not in self.__nodes.keys():
@@ -208,22 +366,50 @@ class Dijkstra:
         source_node = self.__nodes[path_source]
         source_node.distance = 0
 
-        processed_nodes = []
-        nodes_to_be_processed = list(self.__nodes.values())
+        idx_to_key = None
+        if isinstance(self.__source_graph, AdjMatrixGraph):
+            idx_to_key = [None] * len(self.__graph_key_map)
+            for key, idx in self.__graph_key_map.items():
+                idx_to_key[idx] = key
+        nodes_to_be_processed = PriorityQueue.heapify((node.key, node.distance) for node in self.__nodes.values())
 
-        while nodes_to_be_processed:
-            nodes_to_be_processed.sort(key=lambda node: node.distance, reverse=True)
-            current_vertex = nodes_to_be_processed.pop()
+        while not nodes_to_be_processed.is_empty():
+            current_key, _ = nodes_to_be_processed.pop()
+            current_vertex = self.__nodes[current_key]
 
-            current_vertex_idx = self.__graph_key_map[current_vertex.key]
-            processed_nodes.append(current_vertex)
+            for neighbor_key, weight in self.__get_weighted_neighbors(current_key, idx_to_key):
+                neighbor_node = self.__nodes[neighbor_key]
+                if self.__relax(current_vertex, neighbor_node, weight) and neighbor_key in nodes_to_be_processed:
+                    nodes_to_be_processed.decrease_key(neighbor_key, neighbor_node.distance)
+
+        return self.__nodes
+
+    def __run_csr(self, path_source):
+        """
+            Executes the Dijkstra algorithm over the vertice ids from a CSR graph
+        :param path_source: start point for doing the search for other vertices from graph
+        :return: Dictionary with nodes from the graph
+        """
+        self.__nodes, nodes_by_idx = initialize_csr_nodes(self.__source_graph)
+
+        key_idx = self.__source_graph.get_key_idx_map()
+        if path_source not in key_idx:
+            raise KeyError("Source node not in Graph!")
 
-            neighbor_idx = 0
-            for weight in self.__graph[current_vertex_idx]:
-                if weight > 0:
-                    neighbor_key = list(self.__graph_key_map.keys())[neighbor_idx]
-                    neighbor_node = self.__nodes[neighbor_key]
-                    self.__relax(current_vertex, neighbor_node, weight)
-                neighbor_idx += 1
+        indptr = self.__source_graph.indptr
+        indices = self.__source_graph.indices
+        weights = self.__source_graph.weights
+        nodes_by_idx[key_idx[path_source]].distance = 0
+        nodes_to_be_processed = PriorityQueue.heapify((idx, node.distance) for idx, node in enumerate(nodes_by_idx))
+
+        while not nodes_to_be_processed.is_empty():
+            current_idx, _ = nodes_to_be_processed.pop()
+            current_vertex = nodes_by_idx[current_idx]
+
+            for position in range(indptr[current_idx], indptr[current_idx + 1]):
+                neighbor_idx = indices[position]
+                neighbor_node = nodes_by_idx[neighbor_idx]
+                if self.__relax(current_vertex, neighbor_node, weights[position]) and neighbor_idx in nodes_to_be_processed:
+                    nodes_to_be_processed.decrease_key(neighbor_idx, neighbor_node.distance)
 
         return self.__nodes
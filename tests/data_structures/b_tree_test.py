@@ -0,0 +1,98 @@
+import random
+
+import pytest
+from src.data_structures.b_tree import BTree
+
+
+class TestBTree:
+
+    @pytest.fixture(params=[4, 5, 64], ids=["fanout_4", "fanout_5", "fanout_64"])
+    def tree_under_test(self, request):
+        return BTree(fanout=request.param)
+
+    @pytest.fixture
+    def int_keys(self):
+        return [1, 15, 5, 150, 13, -6, 8, 9, 7]
+
+    def test_insert_and_get(self, tree_under_test, int_keys):
+        for key in int_keys:
+            tree_under_test.insert_node(key, str(key))
+
+        assert len(int_keys) == len(tree_under_test), "Fail at tree len control!"
+        for key in int_keys:
+            assert str(key) == tree_under_test.get_value(key), "Fail to find inserted key!"
+
+        tree_under_test.set_value(150, "updated")
+        assert "updated" == tree_under_test.get_value(150), "Fail to update node value!"
+
+    def test_insert_exceptions(self, tree_under_test):
+        tree_under_test.insert_node(1)
+
+        with pytest.raises(IndexError, match="Key already exists!"):
+            tree_under_test.insert_node(1)
+        with pytest.raises(IndexError, match="Key must not be a List!"):
+            tree_under_test.insert_node([2])
+        with pytest.raises(IndexError, match="Invalid key type!"):
+            tree_under_test.insert_node("a")
+
+    def test_missing_key_exception(self, tree_under_test, int_keys):
+        for key in int_keys:
+            tree_under_test.insert_node(key)
+
+        with pytest.raises(IndexError, match="Invalid key!"):
+            tree_under_test.get_value(2)
+        with pytest.raises(IndexError, match="Invalid key!"):
+            tree_under_test.delete_node(2)
+
+    def test_sorted_iteration(self, tree_under_test, int_keys):
+        for key in int_keys:
+            tree_under_test.insert_node(key, key * 10)
+
+        assert sorted(int_keys) == tree_under_test.get_sorted_tree_keys(), "Fail to sort keys!"
+        assert sorted(int_keys, reverse=True) == tree_under_test.get_sorted_tree_keys(reverse=True), \
+            "Fail to sort keys in descending order!"
+        assert [key * 10 for key in sorted(int_keys)] == tree_under_test.get_sorted_tree_values(), "Fail to sort values!"
+        assert [(7, 70), (8, 80), (9, 90)] == list(tree_under_test.iter_range(6, 12)), "Fail to iterate over range!"
+
+    def test_iter_range_invalid_key_type(self, tree_under_test, int_keys):
+        for key in int_keys:
+            tree_under_test.insert_node(key)
+
+        with pytest.raises(IndexError, match="Invalid key type!"):
+            list(tree_under_test.iter_range('a'))
+        with pytest.raises(IndexError, match="Invalid key type!"):
+            list(tree_under_test.iter_range(0, 'z'))
+
+    def test_random_inserts_and_deletes(self, tree_under_test):
+        random.seed(17)
+        reference = {}
+        for _ in range(3000):
+            key = random.randrange(500)
+            if key in reference:
+                tree_under_test.delete_node(key)
+                del reference[key]
+            else:
+                tree_under_test.insert_node(key, -key)
+                reference[key] = -key
+
+        assert sorted(reference) == tree_under_test.get_sorted_tree_keys(), "Fail to keep keys sorted!"
+        assert sorted(reference, reverse=True) == tree_under_test.get_sorted_tree_keys(reverse=True), \
+            "Fail to keep leaves linked!"
+        assert [(key, -key) for key in sorted(reference) if 100 <= key <= 300] == list(tree_under_test.iter_range(100, 300)), \
+            "Fail to iterate over range across leaves!"
+
+        for key in list(reference):
+            tree_under_test.delete_node(key)
+        assert tree_under_test.is_empty(), "Tree must be empty after deleting all keys!"
+        assert 0 == tree_under_test.get_height(), "Empty tree must not have levels!"
+
+    def test_height(self):
+        tree_under_test = BTree(fanout=16)
+        for key in range(10000):
+            tree_under_test.insert_node(key)
+
+        assert tree_under_test.get_height() <= 5, "Tree height must grow logarithmically with the fanout!"
+
+    def test_invalid_fanout(self):
+        with pytest.raises(ValueError, match="Invalid fanout!"):
+            BTree(fanout=3)
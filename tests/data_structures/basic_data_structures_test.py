@@ -1,5 +1,7 @@
+import io
+
 import pytest
-from src.data_structures.basic_data_structures import LinkedList, Queue, Stack
+from src.data_structures.basic_data_structures import LinkedList, PooledLinkedList, Queue, RingBufferQueue, Stack
 
 
 class TestLinkedList:
@@ -9,9 +11,9 @@ class TestLinkedList:
     TEST_STRING = "foobarfoobar"
     TEST_FLOAT = 101.98
 
-    @pytest.fixture()
-    def linked_list(self):
-        return LinkedList()
+    @pytest.fixture(params=[LinkedList, PooledLinkedList])
+    def linked_list(self, request):
+        return request.param()
 
     def test_add_data_to_head(self, linked_list):
         linked_list.add_at_head(self.TEST_INT)
@@ -121,6 +123,194 @@ class TestLinkedList:
         assert "c" == linked_list.get_index(-3), 'Fail to get value with negative index!'
         assert "d" == linked_list.get_index(-4), 'Fail to get value with negative index!'
 
+    def test_tail_tracking_after_deletions(self, linked_list):
+        linked_list.add_at_tail("a")
+        assert "a" == linked_list.delete_from_tail(), "Fail to remove single item from tail!"
+        assert linked_list.is_empty(), "List must be empty after removing its only item!"
+
+        linked_list.add_at_tail("b")
+        linked_list.add_at_tail("c")
+        linked_list.delete_from_index(1)
+        linked_list.add_at_tail("d")
+        assert "d" == linked_list.get_index(-1), "Fail to keep track of the tail!"
+        assert 2 == len(linked_list), "Fail at list len control!"
+
+    @pytest.mark.parametrize("doubly_linked", [False, True])
+    def test_head_and_tail_operations(self, doubly_linked):
+        linked_list = LinkedList(doubly_linked=doubly_linked)
+        assert doubly_linked == linked_list.is_doubly_linked(), "Fail to set the linking mode!"
+
+        for value in range(5):
+            linked_list.add_at_tail(value)
+        linked_list.add_at_head(-1)
+        linked_list.add_at_index(3, 10)
+
+        assert 4 == linked_list.delete_from_tail(), "Fail to remove item from tail!"
+        assert 3 == linked_list.delete_from_tail(), "Fail to remove item from tail!"
+        assert 2 == linked_list.delete_from_index(4), "Fail to remove item from index!"
+        assert 10 == linked_list.delete_from_index(3), "Fail to remove item from index!"
+        assert 1 == linked_list.delete_from_tail(), "Fail to remove item from tail!"
+        assert -1 == linked_list.delete_from_head(), "Fail to remove item from head!"
+        assert 0 == linked_list.delete_from_tail(), "Fail to remove item from tail!"
+        assert linked_list.is_empty(), "List must be empty after removing all items!"
+
+        linked_list.add_at_head("x")
+        assert "x" == linked_list.get_index(-1), "Fail to keep track of the tail!"
+
+    def test_iteration_protocol(self, linked_list):
+        values = list(range(2500))
+        for value in values:
+            linked_list.add_at_tail(value)
+
+        assert values == list(linked_list), "Fail to iterate over the list!"
+        assert values[::-1] == list(reversed(linked_list)), "Fail to iterate over the list in reverse order!"
+        assert 2499 in linked_list, "Fail to find value in the list!"
+        assert -1 not in linked_list, "Found value not added to the list!"
+
+    @pytest.mark.parametrize("doubly_linked", [False, True])
+    def test_reversed_linking_modes(self, doubly_linked):
+        linked_list = LinkedList(doubly_linked=doubly_linked)
+        for value in range(3000):
+            linked_list.add_at_head(value)
+
+        assert list(range(3000)) == list(reversed(linked_list)), "Fail to iterate over the list in reverse order!"
+
+    def test_list_rendering(self, linked_list):
+        assert "index\tvalue" == str(linked_list), "Fail to render empty list!"
+
+        linked_list.add_at_tail("a")
+        linked_list.add_at_tail("b")
+        linked_list.add_at_tail("c")
+        expected_string = "index\tvalue\n    0\ta\n    1\tb\n    2\tc"
+        assert expected_string == str(linked_list), "Fail to render list!"
+
+        stream = io.StringIO()
+        linked_list.write_to(stream, chunk_size=2)
+        assert expected_string == stream.getvalue(), "Fail to stream list rows!"
+
+    @pytest.mark.parametrize("doubly_linked", [False, True])
+    def test_bulk_construction(self, doubly_linked):
+        linked_list = LinkedList.from_iterable(range(3), doubly_linked=doubly_linked)
+        linked_list.extend([3, 4])
+        linked_list.extendleft([-1, -2])
+
+        assert [-2, -1, 0, 1, 2, 3, 4] == list(linked_list), "Fail to bulk add items to the list!"
+        assert [4, 3, 2, 1, 0, -1, -2] == list(reversed(linked_list)), "Fail to link bulk added items!"
+        assert 7 == len(linked_list), "Fail at list len control!"
+        assert 4 == linked_list.delete_from_tail(), "Fail to keep track of the tail!"
+
+        linked_list.extend(linked_list)
+        assert [-2, -1, 0, 1, 2, 3] * 2 == list(linked_list), "Fail to extend the list with itself!"
+
+    @pytest.mark.parametrize("doubly_linked", [False, True])
+    def test_concat_and_splice(self, doubly_linked):
+        linked_list = LinkedList.from_iterable([1, 2], doubly_linked=doubly_linked)
+        other_list = LinkedList.from_iterable([3, 4], doubly_linked=doubly_linked)
+
+        linked_list.concat(other_list)
+        assert [1, 2, 3, 4] == list(linked_list), "Fail to concatenate lists!"
+        assert other_list.is_empty() and 0 == len(other_list), "Concatenated list must be emptied!"
+
+        linked_list.splice(0, LinkedList.from_iterable([-1, 0], doubly_linked=doubly_linked))
+        linked_list.splice(4, LinkedList.from_iterable([2.5], doubly_linked=doubly_linked))
+        linked_list.splice(len(linked_list), LinkedList.from_iterable([5], doubly_linked=doubly_linked))
+        assert [-1, 0, 1, 2, 2.5, 3, 4, 5] == list(linked_list), "Fail to splice lists!"
+        assert [5, 4, 3, 2.5, 2, 1, 0, -1] == list(reversed(linked_list)), "Fail to link spliced lists!"
+        assert 8 == len(linked_list), "Fail at list len control!"
+
+        with pytest.raises(ValueError, match="Lists must share the same linking mode!"):
+            linked_list.concat(LinkedList(doubly_linked=not doubly_linked))
+
+        with pytest.raises(ValueError, match="Can not splice a list into itself!"):
+            linked_list.concat(linked_list)
+
+    @pytest.mark.parametrize("doubly_linked", [False, True])
+    def test_delete_range(self, doubly_linked):
+        linked_list = LinkedList.from_iterable(range(10), doubly_linked=doubly_linked)
+
+        removed_items = linked_list.delete_range(2, 5)
+        assert [2, 3, 4] == list(removed_items), "Fail to return removed range!"
+        assert [0, 1, 5, 6, 7, 8, 9] == list(linked_list), "Fail to remove range from list!"
+
+        assert [0] == list(linked_list.delete_range(0, 1)), "Fail to remove range from head!"
+        assert [8, 9] == list(linked_list.delete_range(-2, 100)), "Fail to remove range from tail!"
+        assert [] == list(linked_list.delete_range(3, 1)), "Empty range must not remove items!"
+
+        assert [1, 5, 6, 7] == list(linked_list), "Fail to remove range from list!"
+        assert [7, 6, 5, 1] == list(reversed(linked_list)), "Fail to relink list after range removal!"
+        assert 4 == len(linked_list), "Fail at list len control!"
+        linked_list.add_at_tail(10)
+        assert 10 == linked_list.get_index(-1), "Fail to keep track of the tail!"
+
+    @pytest.mark.parametrize("doubly_linked", [False, True])
+    def test_sequential_access_with_mutations(self, doubly_linked):
+        linked_list = LinkedList.from_iterable(range(10), doubly_linked=doubly_linked)
+        reference_list = list(range(10))
+
+        assert reference_list == [linked_list.get_index(i) for i in range(10)], "Fail at sequential access!"
+
+        linked_list.add_at_index(3, "a")
+        reference_list.insert(3, "a")
+        assert reference_list[5] == linked_list.get_index(5), "Fail to access after insertion!"
+        assert reference_list[4] == linked_list.get_index(4), "Fail to access before last accessed index!"
+
+        linked_list.delete_from_index(2)
+        reference_list.pop(2)
+        linked_list.delete_from_head()
+        reference_list.pop(0)
+        assert reference_list == [linked_list.get_index(i) for i in range(len(reference_list))], \
+            "Fail at sequential access after deletions!"
+
+        linked_list.delete_range(5, 7)
+        del reference_list[5:7]
+        linked_list.add_at_tail("z")
+        reference_list.append("z")
+        assert reference_list == [linked_list.get_index(i) for i in range(len(reference_list))], \
+            "Fail at sequential access after range deletion!"
+
+    @pytest.mark.parametrize("doubly_linked", [False, True])
+    def test_cursor_operations(self, doubly_linked):
+        linked_list = LinkedList.from_iterable(range(6), doubly_linked=doubly_linked)
+
+        cursor = linked_list.cursor()
+        while cursor.is_valid():
+            if cursor.get() % 2 == 0:
+                cursor.insert_after(f"after {cursor.get()}")
+                cursor.next()
+                cursor.next()
+            else:
+                assert cursor.get() == cursor.delete(), "Fail to delete item at cursor!"
+
+        assert [0, "after 0", 2, "after 2", 4, "after 4"] == list(linked_list), "Fail to edit list with cursor!"
+        assert ["after 4", 4, "after 2", 2, "after 0", 0] == list(reversed(linked_list)), "Fail to link cursor edits!"
+        assert 6 == len(linked_list), "Fail at list len control!"
+
+        linked_list.add_at_tail(6)
+        assert 6 == linked_list.get_index(-1), "Fail to keep track of the tail!"
+
+        cursor = linked_list.cursor(1)
+        assert 1 == cursor.index(), "Fail to position cursor at index!"
+        cursor.set("replaced")
+        assert "replaced" == linked_list.get_index(1), "Fail to update item at cursor!"
+
+        with pytest.raises(IndexError, match="Cursor out of range!"):
+            LinkedList().cursor().get()
+
+    def test_pooled_slots_reuse(self):
+        linked_list = PooledLinkedList(capacity=2)
+        for value in range(5):
+            linked_list.add_at_tail(value)
+        assert 8 == linked_list.capacity(), "Fail to grow the node pool!"
+        assert [0, 1, 2, 3, 4] == [linked_list.get_index(i) for i in range(5)], "Fail to link pooled nodes!"
+
+        for _ in range(5):
+            linked_list.delete_from_head()
+        for value in range(8):
+            linked_list.add_at_head(value)
+        assert 8 == linked_list.capacity(), "Fail to reuse released slots!"
+        assert 7 == linked_list.get_index(0), "Fail to link pooled nodes!"
+        assert 0 == linked_list.get_index(-1), "Fail to link pooled nodes!"
+
 
 class TestQueue:
 
@@ -129,9 +319,9 @@ class TestQueue:
     TEST_STRING = "foobarfoobar"
     TEST_FLOAT = 101.98
 
-    @pytest.fixture()
-    def queue_under_test(self):
-        return Queue()
+    @pytest.fixture(params=[LinkedList, PooledLinkedList])
+    def queue_under_test(self, request):
+        return Queue(storage=request.param)
 
     def test_queue_fifo_order(self, queue_under_test):
         queue_under_test.add(self.TEST_INT)
@@ -149,6 +339,84 @@ class TestQueue:
         assert self.TEST_FLOAT == queue_under_test.remove(), "Fail to process values in FIFO order!"
         assert 0 == len(queue_under_test), "Fail at queue len control!"
 
+    def test_queue_iteration(self, queue_under_test):
+        for value in [1, 2, 3]:
+            queue_under_test.add(value)
+
+        assert [1, 2, 3] == list(queue_under_test), "Fail to iterate over the queue in FIFO order!"
+        assert [3, 2, 1] == list(reversed(queue_under_test)), "Fail to iterate over the queue in reverse order!"
+        assert 2 in queue_under_test, "Fail to find value in the queue!"
+
+    def test_dequeuing_empty_queue(self, queue_under_test):
+        with pytest.raises(IndexError, match="Delete from empty queue!"):
+            queue_under_test.remove()
+
+
+class TestRingBufferQueue:
+
+    @pytest.fixture()
+    def queue_under_test(self):
+        return RingBufferQueue(capacity=2)
+
+    def test_queue_fifo_order_with_growth(self, queue_under_test):
+        for value in range(5):
+            queue_under_test.add(value)
+
+        assert 8 == queue_under_test.capacity(), "Fail to grow the ring buffer!"
+        assert [0, 1] == [queue_under_test.remove(), queue_under_test.remove()], "Fail to process values in FIFO order!"
+
+        for value in range(5, 10):
+            queue_under_test.add(value)
+
+        assert 8 == queue_under_test.capacity(), "Fail to reuse the ring buffer slots!"
+        assert list(range(2, 10)) == list(queue_under_test), "Fail to iterate over wrapped buffer!"
+        assert list(range(9, 1, -1)) == list(reversed(queue_under_test)), "Fail to iterate over wrapped buffer!"
+        assert 8 == len(queue_under_test), "Fail at queue len control!"
+
+    def test_batch_operations(self, queue_under_test):
+        queue_under_test.add_many(range(3))
+        assert [0, 1] == queue_under_test.remove_many(2), "Fail to remove a batch of items!"
+
+        queue_under_test.add_many(range(3, 10))
+        assert 5 in queue_under_test, "Fail to find value in the queue!"
+        assert [2, 3, 4] == queue_under_test.remove_many(3), "Fail to remove a batch of items!"
+        assert list(range(5, 10)) == queue_under_test.remove_many(), "Fail to drain the queue!"
+        assert [] == queue_under_test.remove_many(), "Draining an empty queue must return no items!"
+        assert queue_under_test.is_empty(), "Queue must be empty after being drained!"
+
+    def test_remove_many_negative_amount_exception(self, queue_under_test):
+        queue_under_test.add(1)
+
+        with pytest.raises(ValueError, match="Invalid max items!"):
+            queue_under_test.remove_many(-1)
+        assert [1] == list(queue_under_test), "Rejected batch must not change the queue!"
+        assert 1 == len(queue_under_test), "Rejected batch must not change the queue length!"
+
+    def test_bounded_queue_reject_policy(self):
+        bounded_queue = RingBufferQueue(max_size=3)
+        bounded_queue.add_many([1, 2])
+        bounded_queue.add(3)
+
+        assert bounded_queue.is_full(), "Fail to detect full queue!"
+        with pytest.raises(OverflowError, match="Add to full queue!"):
+            bounded_queue.add(4)
+        with pytest.raises(OverflowError, match="Add to full queue!"):
+            bounded_queue.add_many([4])
+        assert [1, 2, 3] == list(bounded_queue), "Rejected items must not change the queue!"
+
+    def test_bounded_queue_overwrite_policy(self):
+        bounded_queue = RingBufferQueue(capacity=2, max_size=3, overflow_policy=RingBufferQueue.OVERWRITE)
+        bounded_queue.add_many(range(5))
+        assert [2, 3, 4] == list(bounded_queue), "Fail to overwrite oldest items!"
+
+        bounded_queue.add(5)
+        assert [3, 4, 5] == list(bounded_queue), "Fail to overwrite oldest item!"
+        assert 3 == bounded_queue.capacity(), "Buffer must not grow beyond max size!"
+
+    def test_invalid_overflow_policy(self):
+        with pytest.raises(ValueError, match="Invalid overflow policy!"):
+            RingBufferQueue(overflow_policy="block")
+
     def test_dequeuing_empty_queue(self, queue_under_test):
         with pytest.raises(IndexError, match="Delete from empty queue!"):
             queue_under_test.remove()
@@ -161,9 +429,9 @@ class TestStack:
     TEST_STRING = "foobarfoobar"
     TEST_FLOAT = 101.98
 
-    @pytest.fixture()
-    def stack_under_test(self):
-        return Stack()
+    @pytest.fixture(params=[LinkedList, PooledLinkedList])
+    def stack_under_test(self, request):
+        return Stack(storage=request.param)
 
     def test_stack_lifo_order(self, stack_under_test):
         stack_under_test.add(self.TEST_INT)
@@ -181,6 +449,13 @@ class TestStack:
         assert self.TEST_INT == stack_under_test.remove(), "Fail to process values in LIFO order!"
         assert 0 == len(stack_under_test), "Fail at stack len control!"
 
+    def test_stack_iteration(self, stack_under_test):
+        for value in [1, 2, 3]:
+            stack_under_test.add(value)
+
+        assert [3, 2, 1] == list(stack_under_test), "Fail to iterate over the stack in LIFO order!"
+        assert 4 not in stack_under_test, "Found value not added to the stack!"
+
     def test_unstacking_empty_stack(self, stack_under_test):
         with pytest.raises(IndexError, match="Delete from empty stack!"):
             stack_under_test.remove()
\ No newline at end of file
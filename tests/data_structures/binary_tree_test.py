@@ -1,11 +1,19 @@
+import math
+import random
+import sys
+
 import pytest
 from src.data_structures.binary_tree import BinaryTree
 
 class TestBinaryTree:
 
-    @pytest.fixture()
-    def tree_under_test(self):
-        return BinaryTree()
+    @pytest.fixture(params=[False, True], ids=["unbalanced", "balanced"])
+    def tree_under_test(self, request):
+        return BinaryTree(balanced=request.param)
+
+    @pytest.fixture(params=[False, True], ids=["unbalanced", "balanced"])
+    def mixed_keys_tree(self, request):
+        return BinaryTree(balanced=request.param, key=str)
 
     @pytest.fixture
     def keys_to_test(self):
@@ -15,17 +23,17 @@ class TestBinaryTree:
     def int_keys(self):
         return [1, 15, 5, 150, 13, -6, 8, 9, 7]
 
-    def test_tree_insert_types(self, tree_under_test, keys_to_test):
+    def test_tree_insert_types(self, mixed_keys_tree, keys_to_test):
         for test_key in keys_to_test:
-            tree_under_test.insert_node(test_key, "value")
-            node_value = tree_under_test.get_value(test_key)
+            mixed_keys_tree.insert_node(test_key, "value")
+            node_value = mixed_keys_tree.get_value(test_key)
             assert "value" == node_value, f"Error inserting key of type {type(test_key)}"
 
-    def test_insert_duplicate_key_exception(self, tree_under_test, keys_to_test):
+    def test_insert_duplicate_key_exception(self, mixed_keys_tree, keys_to_test):
         for test_key in keys_to_test:
-            tree_under_test.insert_node(test_key, "value")
+            mixed_keys_tree.insert_node(test_key, "value")
             with pytest.raises(IndexError, match="Key already exists!"):
-                tree_under_test.insert_node(test_key)
+                mixed_keys_tree.insert_node(test_key)
 
     def test_insert_invalid_key_type(self, tree_under_test):
         with pytest.raises(IndexError, match="Key must not be a List!"):
@@ -78,18 +86,18 @@ class TestBinaryTree:
         for i in range(1000):
             assert sorted_values == tree_under_test.get_sorted_tree_values(reverse=True), "Returning variable descending sorted values!"
 
-    def test_updating_node_value(self,tree_under_test):
-        tree_under_test.insert_node("a", 150)
-        tree_under_test.set_value("a", 100)
-        assert 100 == tree_under_test.get_value("a"), "Failed to update node value!"
+    def test_updating_node_value(self,mixed_keys_tree):
+        mixed_keys_tree.insert_node("a", 150)
+        mixed_keys_tree.set_value("a", 100)
+        assert 100 == mixed_keys_tree.get_value("a"), "Failed to update node value!"
 
-        tree_under_test.insert_node(True, [150, 89])
-        tree_under_test.set_value(True, "new_value")
-        assert "new_value" == tree_under_test.get_value(True), "Failed to update node value!"
+        mixed_keys_tree.insert_node(True, [150, 89])
+        mixed_keys_tree.set_value(True, "new_value")
+        assert "new_value" == mixed_keys_tree.get_value(True), "Failed to update node value!"
 
-        tree_under_test.insert_node(5, "initial_value")
-        tree_under_test.set_value(5, -11.5)
-        assert -11.5 == tree_under_test.get_value(5), "Failed to update node value!"
+        mixed_keys_tree.insert_node(5, "initial_value")
+        mixed_keys_tree.set_value(5, -11.5)
+        assert -11.5 == mixed_keys_tree.get_value(5), "Failed to update node value!"
 
     def test_invalid_node_exception(self, tree_under_test):
         with pytest.raises(IndexError, match="Invalid key!"):
@@ -98,3 +106,278 @@ class TestBinaryTree:
         with pytest.raises(IndexError, match="Invalid key!"):
             tree_under_test.set_value("a", 0)
 
+    def test_balanced_tree_height_with_sorted_keys(self):
+        balanced_tree = BinaryTree(balanced=True)
+        sorted_keys = [f"{key:05}" for key in range(2000)]
+        for key in sorted_keys:
+            balanced_tree.insert_node(key, key)
+
+        assert balanced_tree.is_balanced(), "Fail to set the balancing mode!"
+        assert balanced_tree.get_height() <= 1.44 * math.log2(len(sorted_keys) + 2), "Tree is not balanced!"
+        assert sorted_keys == balanced_tree.get_sorted_tree_keys(), "Rotations must keep keys order!"
+
+        random.seed(11)
+        deleted_keys = random.sample(sorted_keys, 1500)
+        for key in deleted_keys:
+            balanced_tree.delete_node(key)
+
+        remaining_keys = sorted(set(sorted_keys) - set(deleted_keys))
+        assert remaining_keys == balanced_tree.get_sorted_tree_keys(), "Fail to delete nodes from balanced tree!"
+        assert balanced_tree.get_height() <= 1.44 * math.log2(len(remaining_keys) + 2), "Tree is not balanced!"
+        for key in remaining_keys:
+            assert key == balanced_tree.get_value(key), "Fail to find node after rotations!"
+
+    def test_unbalanced_tree_height_with_sorted_keys(self):
+        unbalanced_tree = BinaryTree()
+        for key in range(1, 10):
+            unbalanced_tree.insert_node(key)
+
+        assert 9 == unbalanced_tree.get_height(), "Unbalanced tree must degrade with sorted keys!"
+
+    def test_native_key_order(self, tree_under_test):
+        for key in [10, 9, 100, -1, 2.5]:
+            tree_under_test.insert_node(key, str(key))
+
+        assert [-1, 2.5, 9, 10, 100] == tree_under_test.get_sorted_tree_keys(), "Keys must follow native order!"
+
+    def test_key_function(self):
+        calls = []
+
+        def case_insensitive(key):
+            calls.append(key)
+            return key.lower()
+
+        tree_with_key = BinaryTree(key=case_insensitive)
+        for key in ["b", "C", "a"]:
+            tree_with_key.insert_node(key, key)
+
+        assert ["a", "b", "C"] == tree_with_key.get_sorted_tree_keys(), "Keys must follow the key function order!"
+        assert "C" == tree_with_key.get_value("c"), "Fail to find node through the key function!"
+        assert 4 == len(calls), "Key function must be called once per insert or lookup!"
+
+        with pytest.raises(IndexError, match="Key already exists!"):
+            tree_with_key.insert_node("A")
+
+    def test_incomparable_key_exception(self, tree_under_test):
+        tree_under_test.insert_node(1)
+        with pytest.raises(IndexError, match="Invalid key type!"):
+            tree_under_test.insert_node("a")
+
+        with pytest.raises(IndexError, match="Invalid key type!"):
+            tree_under_test.get_value("a")
+
+    def test_upsert(self, tree_under_test):
+        tree_under_test.upsert(5, "five")
+        tree_under_test.upsert(3, "three")
+        tree_under_test.upsert(5, "FIVE")
+
+        assert [3, 5] == tree_under_test.get_sorted_tree_keys(), "Fail to insert missing keys through upsert!"
+        assert "FIVE" == tree_under_test.get_value(5), "Fail to update existing key through upsert!"
+
+        with pytest.raises(IndexError, match="Key must not be a List!"):
+            tree_under_test.upsert([1], "list")
+
+    def test_get_or_insert(self, tree_under_test):
+        assert [] == tree_under_test.get_or_insert("a", []), "Fail to return the inserted default value!"
+        tree_under_test.get_or_insert("a", []).append(1)
+
+        assert [1] == tree_under_test.get_value("a"), "Fail to return the existing value!"
+        assert ["a"] == tree_under_test.get_sorted_tree_keys(), "Existing key must not be inserted again!"
+
+    def test_deep_unbalanced_tree(self):
+        deep_tree = BinaryTree()
+        keys_amount = sys.getrecursionlimit() + 500
+        for key in range(keys_amount):
+            deep_tree.insert_node(key, key)
+
+        assert keys_amount - 1 == deep_tree.get_value(keys_amount - 1), "Fail to find node in a deep tree!"
+        assert list(range(keys_amount)) == deep_tree.get_sorted_tree_keys(), "Fail to walk a deep tree!"
+
+        deep_tree.delete_node(keys_amount - 1)
+        assert keys_amount - 1 == deep_tree.get_height(), "Fail to delete node from a deep tree!"
+
+    def test_iter_items(self, tree_under_test, int_keys):
+        for key in int_keys:
+            tree_under_test.insert_node(key, key * 10)
+
+        expected_items = [(key, key * 10) for key in sorted(int_keys)]
+        assert expected_items == list(tree_under_test.iter_items()), "Fail to iterate items in ascending order!"
+        assert expected_items[::-1] == list(tree_under_test.iter_items(reverse=True)), \
+            "Fail to iterate items in descending order!"
+
+    def test_iter_range(self, tree_under_test):
+        for key in range(0, 100, 10):
+            tree_under_test.insert_node(key, str(key))
+
+        assert [(20, "20"), (30, "30"), (40, "40")] == list(tree_under_test.iter_range(15, 40)), \
+            "Fail to iterate over keys inside the bounds!"
+        assert [0, 10] == [key for key, _ in tree_under_test.iter_range(upper_key=10)], "Fail to iterate without lower bound!"
+        assert [90] == [key for key, _ in tree_under_test.iter_range(lower_key=85)], "Fail to iterate without upper bound!"
+        assert [] == list(tree_under_test.iter_range(41, 49)), "Range without keys must be empty!"
+
+    def test_keys_from_is_lazy(self, tree_under_test):
+        for key in range(100):
+            tree_under_test.insert_node(key)
+
+        keys_generator = tree_under_test.keys_from(42.5)
+        assert 43 == next(keys_generator), "Fail to start iteration at the first bigger key!"
+        tree_under_test.set_value(44, "page")
+        assert [44, 45] == [next(keys_generator), next(keys_generator)], "Fail to continue the iteration!"
+
+    def test_floor_and_ceiling(self, tree_under_test):
+        for key in [10, 20, 30]:
+            tree_under_test.insert_node(key)
+
+        assert 20 == tree_under_test.floor(25), "Fail to find the floor key!"
+        assert 30 == tree_under_test.ceiling(25), "Fail to find the ceiling key!"
+        assert 20 == tree_under_test.floor(20) == tree_under_test.ceiling(20), \
+            "Existing key must be its own floor and ceiling!"
+        assert None is tree_under_test.floor(5), "Key smaller than all keys must not have a floor!"
+        assert None is tree_under_test.ceiling(35), "Key bigger than all keys must not have a ceiling!"
+
+        with pytest.raises(IndexError, match="Invalid key type!"):
+            tree_under_test.floor("a")
+
+    @pytest.mark.parametrize("balanced", [False, True], ids=["unbalanced", "balanced"])
+    def test_from_sorted(self, balanced):
+        sorted_items = [(key, key * 2) for key in range(1000)]
+        loaded_tree = BinaryTree.from_sorted(sorted_items, balanced=balanced)
+
+        assert list(range(1000)) == loaded_tree.get_sorted_tree_keys(), "Fail to load keys in order!"
+        assert 1998 == loaded_tree.get_value(999), "Fail to load values with their keys!"
+        assert math.ceil(math.log2(1001)) == loaded_tree.get_height(), "Bulk-loaded tree must be perfectly balanced!"
+        assert balanced == loaded_tree.is_balanced(), "Fail to keep the balancing mode!"
+
+        loaded_tree.insert_node(1000)
+        loaded_tree.delete_node(0)
+        assert list(range(1, 1001)) == loaded_tree.get_sorted_tree_keys(), "Fail to update bulk-loaded tree!"
+
+    def test_from_sorted_invalid_items(self):
+        with pytest.raises(ValueError, match="Items must be sorted by key!"):
+            BinaryTree.from_sorted([(2, None), (1, None)])
+
+        with pytest.raises(IndexError, match="Key already exists!"):
+            BinaryTree.from_sorted([(1, None), (1, None)])
+
+        with pytest.raises(IndexError, match="Key must not be a List!"):
+            BinaryTree.from_sorted([([1], None)])
+
+    def test_from_unsorted(self, int_keys):
+        loaded_tree = BinaryTree.from_unsorted([(key, str(key)) for key in int_keys])
+
+        assert sorted(int_keys) == loaded_tree.get_sorted_tree_keys(), "Fail to sort numeric keys!"
+        assert [str(key) for key in sorted(int_keys)] == loaded_tree.get_sorted_tree_values(), "Fail to keep values!"
+
+        with pytest.raises(IndexError, match="Key already exists!"):
+            BinaryTree.from_unsorted([(1, None), (1, None)])
+
+    def test_from_unsorted_with_key_function(self, keys_to_test):
+        loaded_tree = BinaryTree.from_unsorted([(key, None) for key in keys_to_test], key=str)
+
+        assert sorted(keys_to_test, key=str) == loaded_tree.get_sorted_tree_keys(), "Fail to sort with key function!"
+
+        with pytest.raises(IndexError, match="Invalid key type!"):
+            BinaryTree.from_unsorted([(1, None), ("a", None)])
+
+    def test_order_statistics(self, tree_under_test, int_keys):
+        for key in int_keys:
+            tree_under_test.insert_node(key)
+        sorted_keys = sorted(int_keys)
+
+        assert len(int_keys) == len(tree_under_test), "Fail at tree len control!"
+        assert sorted_keys == [tree_under_test.select(index) for index in range(len(int_keys))], "Fail to select keys!"
+        assert sorted_keys[-1] == tree_under_test.select(-1), "Fail to select keys from the end!"
+        assert [sorted_keys.index(key) for key in int_keys] == [tree_under_test.rank(key) for key in int_keys], \
+            "Fail to rank existing keys!"
+        assert 3 == tree_under_test.rank(6), "Fail to rank missing key!"
+        assert 4 == tree_under_test.count_range(5, 9), "Fail to count keys in range!"
+        assert 0 == tree_under_test.count_range(10, 12), "Range without keys must be empty!"
+        assert 0 == tree_under_test.count_range(9, 5), "Inverted range must be empty!"
+
+        with pytest.raises(IndexError, match="Index out of range!"):
+            tree_under_test.select(len(int_keys))
+
+    def test_order_statistics_after_updates(self, tree_under_test):
+        random.seed(16)
+        keys = random.sample(range(1000), 300)
+        for key in keys:
+            tree_under_test.insert_node(key)
+        for key in keys[::3]:
+            tree_under_test.delete_node(key)
+
+        remaining_keys = sorted(set(keys) - set(keys[::3]))
+        assert len(remaining_keys) == len(tree_under_test), "Fail to keep sizes through deletions!"
+        assert remaining_keys == [tree_under_test.select(index) for index in range(len(remaining_keys))], \
+            "Fail to select keys after deletions!"
+        assert sum(1 for key in remaining_keys if 250 <= key <= 750) == tree_under_test.count_range(250, 750), \
+            "Fail to count keys after deletions!"
+
+    def test_order_statistics_from_sorted(self):
+        loaded_tree = BinaryTree.from_sorted([(key, None) for key in range(0, 200, 2)])
+
+        assert 100 == len(loaded_tree), "Fail to set sizes on bulk-load!"
+        assert 50 == loaded_tree.rank(100), "Fail to rank key on bulk-loaded tree!"
+        assert 100 == loaded_tree.select(50), "Fail to select key on bulk-loaded tree!"
+
+    def test_get_values(self, tree_under_test, int_keys):
+        for key in int_keys:
+            tree_under_test.insert_node(key, key * 10)
+
+        searched_keys = [150, -6, 8, 150, 1]
+        assert [key * 10 for key in searched_keys] == tree_under_test.get_values(searched_keys), \
+            "Fail to get values in the keys order!"
+        assert [10, None, 50, None] == tree_under_test.get_values([1, 2, 5, 1000], default=None), \
+            "Fail to fill missing keys with default!"
+
+        with pytest.raises(IndexError, match=r"Invalid keys: \[2, 1000\]!"):
+            tree_under_test.get_values([1000, 5, 2])
+
+    def test_get_values_matches_get_value(self, tree_under_test):
+        random.seed(20)
+        keys = random.sample(range(5000), 1000)
+        for key in keys:
+            tree_under_test.insert_node(key, str(key))
+
+        searched_keys = random.sample(keys, 300)
+        assert [tree_under_test.get_value(key) for key in searched_keys] == tree_under_test.get_values(searched_keys), \
+            "Batched lookup must match single lookups!"
+
+    @pytest.mark.parametrize("batch_size", [1, 50], ids=["small_batch", "big_batch"])
+    def test_insert_many(self, tree_under_test, int_keys, batch_size):
+        for key in int_keys:
+            tree_under_test.insert_node(key, key)
+
+        new_keys = list(range(1000, 1000 + batch_size))[::-1]
+        tree_under_test.insert_many((key, key) for key in new_keys)
+
+        assert sorted(int_keys + new_keys) == tree_under_test.get_sorted_tree_keys(), "Fail to insert batch of keys!"
+        assert new_keys == tree_under_test.get_values(new_keys), "Fail to insert batch values!"
+        assert len(int_keys) + batch_size == len(tree_under_test), "Fail to keep sizes after batch insertion!"
+        assert len(int_keys) + batch_size - 1 == tree_under_test.rank(999 + batch_size), "Fail to rank after batch!"
+
+        tree_under_test.delete_node(1000)
+        tree_under_test.insert_node(1000)
+
+    def test_insert_many_small_batch_in_big_tree(self, tree_under_test):
+        random.seed(21)
+        keys = random.sample(range(0, 20000, 2), 2000)
+        for key in keys:
+            tree_under_test.insert_node(key, key)
+
+        new_keys = random.sample(range(1, 20000, 2), 100) + [-1, 20001, 20003]
+        tree_under_test.insert_many((key, -key) for key in new_keys)
+
+        assert sorted(keys + new_keys) == tree_under_test.get_sorted_tree_keys(), "Fail to insert small batch of keys!"
+        assert [-key for key in new_keys] == tree_under_test.get_values(new_keys), "Fail to insert small batch values!"
+        assert [tree_under_test.rank(key) for key in sorted(keys + new_keys)] == list(range(len(keys) + len(new_keys))), \
+            "Fail to keep sizes after small batch insertion!"
+        if tree_under_test.is_balanced():
+            assert tree_under_test.get_height() <= 1.45 * math.log2(len(tree_under_test) + 2), \
+                "Fail to keep tree balanced after small batch insertion!"
+
+    def test_insert_many_repeated_keys(self, tree_under_test):
+        tree_under_test.insert_node(1)
+
+        with pytest.raises(IndexError, match=r"Keys already exist: \[2, 1\]!"):
+            tree_under_test.insert_many([(1, None), (2, None), (3, None), (2, None)])
+        assert [1] == tree_under_test.get_sorted_tree_keys(), "Failed batch must not change the tree!"
@@ -0,0 +1,126 @@
+import asyncio
+import threading
+
+import pytest
+from src.data_structures.concurrent_data_structures import ConcurrentQueue, ConcurrentStack, AsyncQueue
+
+
+class TestConcurrentQueue:
+
+    @pytest.fixture()
+    def queue_under_test(self):
+        return ConcurrentQueue()
+
+    def test_queue_fifo_order(self, queue_under_test):
+        for value in [1, 2, 3]:
+            queue_under_test.add(value)
+
+        assert 3 == len(queue_under_test), "Fail at queue len control!"
+        assert 1 == queue_under_test.remove(), "Fail to process values in FIFO order!"
+        assert [2, 3] == queue_under_test.drain(), "Fail to drain values in FIFO order!"
+        assert queue_under_test.is_empty(), "Queue must be empty after being drained!"
+
+    def test_non_blocking_variants(self):
+        bounded_queue = ConcurrentQueue(max_size=2)
+
+        assert bounded_queue.try_add(1), "Fail to add item to queue with free space!"
+        assert bounded_queue.try_add(2), "Fail to add item to queue with free space!"
+        assert not bounded_queue.try_add(3), "Must not add item to full queue!"
+
+        assert 1 == bounded_queue.try_remove(), "Fail to remove available item!"
+        assert 2 == bounded_queue.try_remove(), "Fail to remove available item!"
+        assert "empty" == bounded_queue.try_remove(default="empty"), "Fail to return default from empty queue!"
+
+    def test_blocking_timeouts(self):
+        bounded_queue = ConcurrentQueue(max_size=1)
+
+        with pytest.raises(TimeoutError, match="Timeout waiting for an item!"):
+            bounded_queue.remove(timeout=0.01)
+
+        bounded_queue.add(1)
+        with pytest.raises(TimeoutError, match="Timeout waiting for free space!"):
+            bounded_queue.add(2, timeout=0.01)
+
+    def test_drain_batches(self, queue_under_test):
+        for value in range(5):
+            queue_under_test.add(value)
+
+        assert [0, 1, 2] == queue_under_test.drain(max_items=3), "Fail to drain a batch of items!"
+        assert [3, 4] == queue_under_test.drain(max_items=3), "Fail to drain a batch of items!"
+
+    def test_producers_and_consumers(self):
+        bounded_queue = ConcurrentQueue(max_size=8)
+        items_per_producer = 500
+        consumed_values = []
+        consumed_lock = threading.Lock()
+
+        def produce(offset):
+            for value in range(items_per_producer):
+                bounded_queue.add(offset + value, timeout=5)
+
+        def consume():
+            for _ in range(items_per_producer):
+                value = bounded_queue.remove(timeout=5)
+                with consumed_lock:
+                    consumed_values.append(value)
+
+        workers = [threading.Thread(target=produce, args=(offset * items_per_producer,)) for offset in range(4)]
+        workers += [threading.Thread(target=consume) for _ in range(4)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+        assert list(range(4 * items_per_producer)) == sorted(consumed_values), "Fail to share items across threads!"
+        assert bounded_queue.is_empty(), "Queue must be empty after consuming all items!"
+
+    def test_invalid_max_size(self):
+        with pytest.raises(ValueError, match="Invalid max size!"):
+            ConcurrentQueue(max_size=0)
+
+
+class TestConcurrentStack:
+
+    def test_stack_lifo_order(self):
+        stack_under_test = ConcurrentStack()
+        for value in [1, 2, 3]:
+            stack_under_test.add(value)
+
+        assert 3 == stack_under_test.remove(), "Fail to process values in LIFO order!"
+        assert [2, 1] == stack_under_test.drain(), "Fail to drain values in LIFO order!"
+        assert None is stack_under_test.try_remove(), "Fail to return default from empty stack!"
+
+
+class TestAsyncQueue:
+
+    def test_queue_fifo_order(self):
+        async def run():
+            queue_under_test = AsyncQueue()
+            for value in [1, 2, 3]:
+                await queue_under_test.put(value)
+            return [await queue_under_test.get(), await queue_under_test.drain()]
+
+        assert [1, [2, 3]] == asyncio.run(run()), "Fail to process values in FIFO order!"
+
+    def test_producer_and_consumer(self):
+        async def run():
+            queue_under_test = AsyncQueue(max_size=2)
+
+            async def produce():
+                for value in range(20):
+                    await queue_under_test.put(value, timeout=5)
+
+            async def consume():
+                return [await queue_under_test.get(timeout=5) for _ in range(20)]
+
+            _, consumed_values = await asyncio.gather(produce(), consume())
+            return consumed_values
+
+        assert list(range(20)) == asyncio.run(run()), "Fail to share items between coroutines!"
+
+    def test_get_timeout(self):
+        async def run():
+            await AsyncQueue().get(timeout=0.01)
+
+        with pytest.raises(TimeoutError):
+            asyncio.run(run())
@@ -1,5 +1,10 @@
+import importlib.util
+
 import pytest
-from src.data_structures.graphs import AdjListGraph, AdjMatrixGraph
+from src.data_structures.graphs import AdjListGraph, AdjMatrixGraph, CSRGraph, GraphInterface, WeightedAdjListGraph
+
+numpy_dtype = pytest.param("float64", marks=pytest.mark.skipif(importlib.util.find_spec("numpy") is None,
+                                                                 reason="NumPy is not installed"))
 
 class TestAdjListGraph:
     # Test graph (directed graph)
@@ -102,6 +107,177 @@ class TestAdjListGraph:
     def test_complete_graph_to_sample(self, graph_complete_adj_list, adj_list_sample):
         assert adj_list_sample == graph_complete_adj_list.get_graph(), "Fail to build Adjacency List for sample Graph!"
 
+    def test_graph_view_is_read_only(self, graph_complete_adj_list):
+        graph_view = graph_complete_adj_list.get_graph()
+
+        with pytest.raises(TypeError):
+            graph_view["F"] = set()
+        with pytest.raises(AttributeError):
+            graph_view["A"].add("D")
+        assert {"B", "C"} == graph_view["A"], "Fail to keep graph view unchanged!"
+
+    def test_graph_view_version(self, graph_complete_adj_list):
+        graph_view = graph_complete_adj_list.get_graph()
+        neighbors_view = graph_view["A"]
+        version = graph_complete_adj_list.get_version()
+
+        graph_complete_adj_list.add_edge("E", "A")
+        assert version + 1 == graph_complete_adj_list.get_version(), "Fail to increment graph version!"
+
+        with pytest.raises(RuntimeError, match="Graph changed after the view was created!"):
+            graph_view["A"]
+        with pytest.raises(RuntimeError, match="Graph changed after the view was created!"):
+            list(neighbors_view)
+        assert {"A"} == graph_complete_adj_list.get_graph()["E"], "Fail to create view from the changed graph!"
+
+    def test_copy(self, graph_complete_adj_list, adj_list_sample):
+        graph_copy = graph_complete_adj_list.copy()
+        graph_complete_adj_list.delete_vertice("B")
+
+        assert adj_list_sample == graph_copy.get_graph(), "Copy must not change with the original graph!"
+
+    def test_delete_vertice_with_self_loop(self, graph_complete_adj_list):
+        graph_complete_adj_list.add_edge("B", "B")
+        graph_complete_adj_list.delete_vertice("B")
+
+        assert {"C"} == graph_complete_adj_list.get_graph()["A"], "Fail to remove edges to deleted vertice!"
+        assert set() == graph_complete_adj_list.predecessors("A"), "Fail to remove edges from deleted vertice!"
+        with pytest.raises(KeyError, match="Invalid vertice_key!"):
+            graph_complete_adj_list.delete_vertice("B")
+
+    def test_predecessors(self, graph_complete_adj_list, adj_list_sample):
+        for vertice in adj_list_sample:
+            predecessors = {key for key, neighbors in adj_list_sample.items() if vertice in neighbors}
+            assert predecessors == graph_complete_adj_list.predecessors(vertice), "Fail to keep vertice predecessors!"
+            assert len(predecessors) == graph_complete_adj_list.in_degree(vertice), "Fail to count vertice in-degree!"
+
+        graph_complete_adj_list.delete_edge("D", "B")
+        graph_complete_adj_list.delete_edge("D", "A")
+        assert {"A", "C"} == graph_complete_adj_list.predecessors("B"), "Fail to remove deleted edge predecessor!"
+        assert 1 == graph_complete_adj_list.in_degree("A"), "Fail to keep in-degree of missing edge!"
+
+        with pytest.raises(KeyError, match="Invalid vertice_key!"):
+            graph_complete_adj_list.predecessors("F")
+        with pytest.raises(KeyError, match="Invalid vertice_key!"):
+            graph_complete_adj_list.in_degree("F")
+
+    def test_reverse_graph(self, graph_complete_adj_list):
+        reverse_graph = graph_complete_adj_list.get_reverse_graph()
+
+        assert {"A": {"B"}, "B": {"A", "C", "D"}, "C": {"A"}, "D": set(), "E": {"D"}} == reverse_graph, \
+            "Fail to build reverse graph!"
+        graph_complete_adj_list.add_edge("E", "C")
+        with pytest.raises(RuntimeError, match="Graph changed after the view was created!"):
+            reverse_graph["C"]
+
+    def test_freeze(self, graph_complete_adj_list, adj_list_sample):
+        frozen_graph = graph_complete_adj_list.freeze()
+        graph_complete_adj_list.delete_vertice("B")
+
+        assert 5 == len(frozen_graph), "Fail to freeze all vertices!"
+        assert 6 == frozen_graph.get_edges_amount(), "Fail to freeze all edges!"
+        for vertice, neighbors in adj_list_sample.items():
+            assert (sorted((neighbor, 1.0) for neighbor in neighbors) ==
+                    sorted(frozen_graph.get_neighbors(vertice))), "Fail to freeze vertice neighbors!"
+
+        key_idx = frozen_graph.get_key_idx_map()
+        indptr, indices = frozen_graph.indptr, frozen_graph.indices
+        assert ([key_idx["B"]] ==
+                list(indices[indptr[key_idx["C"]]:indptr[key_idx["C"] + 1]])), "Fail to build CSR arrays!"
+
+    def test_frozen_graph_is_read_only(self, graph_complete_adj_list):
+        frozen_graph = graph_complete_adj_list.freeze()
+
+        with pytest.raises(TypeError):
+            frozen_graph.indices[0] = 0
+        with pytest.raises(TypeError):
+            frozen_graph.get_key_idx_map()["F"] = 5
+        with pytest.raises(KeyError, match="Invalid vertice_key!"):
+            frozen_graph.get_neighbors("F")
+
+    def test_invalid_csr_arrays(self):
+        with pytest.raises(ValueError, match="Invalid CSR arrays!"):
+            CSRGraph(["A", "B"], [0, 1], [1], [1.0])
+        with pytest.raises(ValueError, match="Vertice keys must be unique!"):
+            CSRGraph(["A", "A"], [0, 1, 1], [1], [1.0])
+
+
+class TestWeightedAdjListGraph:
+
+    @pytest.fixture()
+    def weighted_adj_list_sample(self):
+        graph = {
+            "A": {"B": 5, "C": 10},
+            "B": {"A": 2},
+            "C": {"B": 3},
+            "D": {"B": 1, "E": 4},
+            "E": {}
+        }
+        return graph
+
+    @pytest.fixture()
+    def graph_complete_weighted_adj_list(self, weighted_adj_list_sample):
+        weighted_adj_list = WeightedAdjListGraph()
+        for vertice in weighted_adj_list_sample.keys():
+            weighted_adj_list.add_vertice(vertice)
+
+        for vertice, neighbors in weighted_adj_list_sample.items():
+            for neighbor, weight in neighbors.items():
+                weighted_adj_list.add_edge(vertice, neighbor, weight)
+
+        return weighted_adj_list
+
+    def test_is_graph(self, graph_complete_weighted_adj_list):
+        assert isinstance(graph_complete_weighted_adj_list, GraphInterface), "Fail to implement graph interface!"
+        assert not isinstance(AdjMatrixGraph(), WeightedAdjListGraph), "Fail to tell graph classes apart!"
+
+    def test_insert_edge_to_invalid_vertice_exception(self, graph_complete_weighted_adj_list):
+        with pytest.raises(KeyError, match="Invalid source_key!"):
+            graph_complete_weighted_adj_list.add_edge("F", "A", 1)
+        with pytest.raises(KeyError, match="Invalid dest_key!"):
+            graph_complete_weighted_adj_list.add_edge("A", "F", 1)
+
+    def test_complete_graph_to_sample(self, graph_complete_weighted_adj_list, weighted_adj_list_sample):
+        assert weighted_adj_list_sample == graph_complete_weighted_adj_list.get_graph(), \
+            "Fail to build Weighted Adjacency List for sample Graph!"
+
+    def test_update_edge_weight(self, graph_complete_weighted_adj_list):
+        graph_complete_weighted_adj_list.add_edge("A", "B", 7)
+
+        assert {"B": 7, "C": 10} == graph_complete_weighted_adj_list.get_graph()["A"], "Fail to update edge weight!"
+        assert 3 == graph_complete_weighted_adj_list.in_degree("B"), "Fail to keep single in-edge per edge!"
+
+    def test_delete_vertice(self, graph_complete_weighted_adj_list):
+        graph_complete_weighted_adj_list.delete_vertice("B")
+
+        graph_after_delete = graph_complete_weighted_adj_list.get_graph()
+        assert "B" not in graph_after_delete, "Fail to remove vertice from Weighted Adjacency List!"
+        assert {"C": 10} == graph_after_delete["A"], "Fail to remove edges to deleted vertice!"
+        assert set() == graph_complete_weighted_adj_list.predecessors("A"), "Fail to remove edges from deleted vertice!"
+
+    def test_delete_edge(self, graph_complete_weighted_adj_list):
+        graph_complete_weighted_adj_list.delete_edge("D", "B")
+        graph_complete_weighted_adj_list.delete_edge("D", "A")
+
+        assert {"E": 4} == graph_complete_weighted_adj_list.get_graph()["D"], "Fail to remove edge!"
+        assert {"A", "C"} == graph_complete_weighted_adj_list.predecessors("B"), "Fail to remove edge predecessor!"
+
+    def test_graph_view_is_read_only(self, graph_complete_weighted_adj_list):
+        graph_view = graph_complete_weighted_adj_list.get_graph()
+
+        with pytest.raises(TypeError):
+            graph_view["A"]["D"] = 1
+        graph_complete_weighted_adj_list.add_edge("E", "A", 1)
+        with pytest.raises(RuntimeError, match="Graph changed after the view was created!"):
+            graph_view["A"]
+
+    def test_freeze(self, graph_complete_weighted_adj_list, weighted_adj_list_sample):
+        frozen_graph = graph_complete_weighted_adj_list.freeze()
+
+        for vertice, neighbors in weighted_adj_list_sample.items():
+            assert sorted(neighbors.items()) == sorted(frozen_graph.get_neighbors(vertice)), \
+                "Fail to freeze edges weights!"
+
 
 class TestAdjMatrixGraph:
     # Test graph (directed graph)
@@ -122,15 +298,15 @@ class TestAdjMatrixGraph:
                  [0, 0, 0, 0, 0]]
         return graph
 
-    @pytest.fixture()
-    def graph_empty_adj_matrix(self):
-        return AdjMatrixGraph()
+    @pytest.fixture(params=[None, numpy_dtype], ids=["lists", "numpy"])
+    def graph_empty_adj_matrix(self, request):
+        return AdjMatrixGraph(dtype=request.param)
 
     @pytest.fixture()
-    def graph_complete_adj_matrix(self, adj_matrix_sample):
+    def graph_complete_adj_matrix(self, adj_matrix_sample, graph_empty_adj_matrix):
         graph_keys = ["A", "B", "C", "D", "E"]
 
-        adj_matrix = AdjMatrixGraph()
+        adj_matrix = graph_empty_adj_matrix
         for vertice in graph_keys:
             adj_matrix.add_vertice(vertice)
 
@@ -198,7 +374,7 @@ class TestAdjMatrixGraph:
     def test_delete_vertice(self, graph_complete_adj_matrix):
         vertice = "B"
 
-        graph_before_delete = graph_complete_adj_matrix.get_graph()
+        graph_before_delete = graph_complete_adj_matrix.copy().get_graph()
         graph_complete_adj_matrix.delete_vertice(vertice)
         graph_after_delete = graph_complete_adj_matrix.get_graph()
 
@@ -218,5 +394,86 @@ class TestAdjMatrixGraph:
         dest = key_map[edge[1]]
         assert 0 == graph_after_delete[source][dest], "Fail to remove edge from Adjacency Matrix!"
 
+    def test_delete_vertice_keeps_edges(self, graph_complete_adj_matrix):
+        graph_complete_adj_matrix.delete_vertice("A")
+
+        key_map = graph_complete_adj_matrix.get_key_idx_map()
+        matrix_graph = graph_complete_adj_matrix.get_graph()
+        edges = {(source, dest) for source in key_map for dest in key_map if matrix_graph[key_map[source]][key_map[dest]]}
+        assert {("C", "B"), ("D", "B"), ("D", "E")} == edges, "Fail to keep edges after deleting vertice!"
+
+        graph_complete_adj_matrix.delete_vertice("D")
+        matrix_graph = graph_complete_adj_matrix.get_graph()
+        edges = {(source, dest) for source in key_map for dest in key_map if matrix_graph[key_map[source]][key_map[dest]]}
+        assert {("C", "B")} == edges, "Fail to delete the last vertice!"
+        assert [3] * 3 == [len(row) for row in matrix_graph], "Fail to shrink the Adjacency Matrix rows!"
+
+    def test_capacity_growth(self, graph_empty_adj_matrix):
+        vertices = list(range(3 * AdjMatrixGraph.INITIAL_CAPACITY))
+        for vertice in vertices:
+            graph_empty_adj_matrix.add_vertice(vertice)
+        graph_empty_adj_matrix.add_edge(0, vertices[-1], 7)
+
+        matrix_graph = graph_empty_adj_matrix.get_graph()
+        assert len(vertices) == len(matrix_graph), "Fail to grow the Adjacency Matrix!"
+        assert len(vertices) == len(matrix_graph[0]), "Fail to grow the Adjacency Matrix rows!"
+        assert 7 == matrix_graph[0][-1], "Fail to keep edges while growing the Adjacency Matrix!"
+        with pytest.raises(IndexError, match="Index out of range!"):
+            matrix_graph[0][len(vertices)]
+
+    def test_invalid_capacity(self):
+        with pytest.raises(ValueError, match="Invalid capacity!"):
+            AdjMatrixGraph(capacity=0)
+
+    def test_add_edges(self, graph_complete_adj_matrix):
+        graph_complete_adj_matrix.add_edges(["E", "E", "A"], ["A", "B", "D"], [2, 3, 4])
+        graph_complete_adj_matrix.add_edges(["B"], ["C"])
+
+        key_map = graph_complete_adj_matrix.get_key_idx_map()
+        matrix_graph = graph_complete_adj_matrix.get_graph()
+        assert [2, 3, 0, 0, 0] == matrix_graph[key_map["E"]], "Fail to add batch of weighted edges!"
+        assert 4 == matrix_graph[key_map["A"]][key_map["D"]], "Fail to add batch of weighted edges!"
+        assert 1 == matrix_graph[key_map["B"]][key_map["C"]], "Fail to add batch of edges with default weight!"
+
+        with pytest.raises(KeyError, match="Invalid dest_key!"):
+            graph_complete_adj_matrix.add_edges(["A"], ["F"])
+
+    def test_add_edges_weights_length_exception(self, graph_complete_adj_matrix):
+        with pytest.raises(ValueError, match="Weights must have the same length as the edges!"):
+            graph_complete_adj_matrix.add_edges(["A", "B"], ["C", "D"], [1, 2, 3])
+        with pytest.raises(ValueError, match="Weights must have the same length as the edges!"):
+            graph_complete_adj_matrix.add_edges(["A", "B"], ["C", "D"], (weight for weight in [1]))
+        assert [0, 1, 1, 0, 0] == graph_complete_adj_matrix.get_graph()[0], "Rejected batch must not change the graph!"
+
+    @pytest.mark.skipif(importlib.util.find_spec("numpy") is None, reason="NumPy is not installed")
+    def test_add_edges_numpy_weights(self, graph_complete_adj_matrix):
+        import numpy as np
+
+        graph_complete_adj_matrix.add_edges(["A", "B"], ["D", "D"], np.int64(3))
+        graph_complete_adj_matrix.add_edges(["E", "E"], ["A", "B"], np.array([2.5, 4.0]))
+
+        matrix_graph = graph_complete_adj_matrix.get_graph()
+        assert [3, 3] == [matrix_graph[0][3], matrix_graph[1][3]], "Fail to add batch with NumPy scalar weight!"
+        assert [2.5, 4.0] == [matrix_graph[4][0], matrix_graph[4][1]], "Fail to add batch with NumPy array weights!"
+
+    def test_freeze(self, graph_complete_adj_matrix):
+        graph_complete_adj_matrix.add_edge("E", "A", 2.5)
+        graph_complete_adj_matrix.delete_vertice("C")
+        frozen_graph = graph_complete_adj_matrix.freeze()
+
+        assert ("A", "B", "E", "D") == frozen_graph.get_vertice_keys(), "Fail to keep the matrix indexes as ids!"
+        assert [0, 1, 2, 3, 5] == list(frozen_graph.indptr), "Fail to build CSR arrays!"
+        assert [1, 0, 0, 1, 2] == list(frozen_graph.indices), "Fail to build CSR arrays!"
+        assert [1.0, 1.0, 2.5, 1.0, 1.0] == list(frozen_graph.weights), "Fail to keep the edges weights!"
+        assert [("B", 1.0), ("E", 1.0)] == frozen_graph.get_neighbors("D"), "Fail to freeze vertice neighbors!"
+
+    def test_graph_view_version(self, graph_complete_adj_matrix):
+        graph_view = graph_complete_adj_matrix.get_graph()
+        graph_complete_adj_matrix.add_edge("E", "A")
+
+        with pytest.raises(RuntimeError, match="Graph changed after the view was created!"):
+            graph_view[0]
+        assert [1, 0, 0, 0, 0] == graph_complete_adj_matrix.get_graph()[4], "Fail to create view from the changed graph!"
+
     def test_complete_graph_to_sample(self, graph_complete_adj_matrix, adj_matrix_sample):
-        assert adj_matrix_sample == graph_complete_adj_matrix.get_graph(), "Fail to build Adjacency Matrix for sample Graph!"
\ No newline at end of file
+        assert adj_matrix_sample == graph_complete_adj_matrix.get_graph(), "Fail to build Adjacency Matrix for sample Graph!"
@@ -0,0 +1,85 @@
+import pytest
+from src.data_structures.binary_tree import BinaryTree
+from src.data_structures.mapped_binary_tree import MappedBinaryTree
+
+
+class TestMappedBinaryTree:
+
+    @pytest.fixture
+    def int_keys(self):
+        return [1, 15, 5, 150, 13, -6, 8, 9, 7]
+
+    @pytest.fixture
+    def tree_file(self, tmp_path, int_keys):
+        tree = BinaryTree()
+        for key in int_keys:
+            tree.insert_node(key, {"value": key * 10})
+
+        path = tmp_path / "tree.bin"
+        tree.dump(path)
+        return path
+
+    def test_get_value(self, tree_file, int_keys):
+        with MappedBinaryTree(tree_file) as mapped_tree:
+            assert len(int_keys) == len(mapped_tree), "Fail at tree len control!"
+            for key in int_keys:
+                assert {"value": key * 10} == mapped_tree.get_value(key), "Fail to find dumped key!"
+
+            with pytest.raises(IndexError, match="Invalid key!"):
+                mapped_tree.get_value(2)
+            with pytest.raises(IndexError, match="Invalid key!"):
+                mapped_tree.get_value(1000)
+            with pytest.raises(IndexError, match="Invalid key type!"):
+                mapped_tree.get_value("a")
+
+    def test_sorted_iteration(self, tree_file, int_keys):
+        with MappedBinaryTree(tree_file) as mapped_tree:
+            assert sorted(int_keys) == mapped_tree.get_sorted_tree_keys(), "Fail to keep keys sorted!"
+            assert sorted(int_keys, reverse=True) == mapped_tree.get_sorted_tree_keys(reverse=True), \
+                "Fail to sort keys in descending order!"
+            assert [{"value": key * 10} for key in sorted(int_keys)] == mapped_tree.get_sorted_tree_values(), \
+                "Fail to keep values with their keys!"
+            assert [7, 8, 9] == [key for key, _ in mapped_tree.iter_range(6, 9)], "Fail to scan key range!"
+            assert [13, 15, 150] == [key for key, _ in mapped_tree.iter_range(lower_key=10)], \
+                "Fail to scan range without upper bound!"
+
+    def test_key_function(self, tmp_path):
+        tree = BinaryTree(key=str)
+        for key in [58, True, "foobarfoobar", 101.98]:
+            tree.insert_node(key, str(key))
+
+        path = tmp_path / "tree.bin"
+        tree.dump(path)
+        with MappedBinaryTree(path, key=str) as mapped_tree:
+            assert tree.get_sorted_tree_keys() == mapped_tree.get_sorted_tree_keys(), "Fail to keep key function order!"
+            assert "True" == mapped_tree.get_value(True), "Fail to find key through the key function!"
+
+        with pytest.raises(ValueError, match="Key function must match the one used to dump the tree file!"):
+            MappedBinaryTree(path)
+
+    def test_empty_tree(self, tmp_path):
+        path = tmp_path / "tree.bin"
+        BinaryTree().dump(path)
+
+        with MappedBinaryTree(path) as mapped_tree:
+            assert mapped_tree.is_empty(), "Dumped empty tree must be empty!"
+            assert [] == list(mapped_tree.iter_items()), "Empty tree must not have items!"
+            with pytest.raises(IndexError, match="Invalid key!"):
+                mapped_tree.get_value(1)
+
+    def test_invalid_file(self, tmp_path):
+        path = tmp_path / "not_a_tree.bin"
+        path.write_bytes(b"not a tree file at all")
+
+        with pytest.raises(ValueError, match="Invalid tree file!"):
+            MappedBinaryTree(path)
+
+    def test_truncated_file(self, tree_file):
+        tree_bytes = tree_file.read_bytes()
+
+        tree_file.write_bytes(tree_bytes[:40])
+        with pytest.raises(ValueError, match="Truncated tree file! It is shorter than its offsets table."):
+            MappedBinaryTree(tree_file)
+        tree_file.write_bytes(tree_bytes[:-1])
+        with pytest.raises(ValueError, match="Truncated tree file! It is shorter than its stored items."):
+            MappedBinaryTree(tree_file)
@@ -0,0 +1,103 @@
+import math
+import random
+import threading
+
+import pytest
+from src.data_structures.persistent_binary_tree import PersistentBinaryTree
+
+
+class TestPersistentBinaryTree:
+
+    @pytest.fixture
+    def tree_under_test(self):
+        return PersistentBinaryTree()
+
+    @pytest.fixture
+    def int_keys(self):
+        return [1, 15, 5, 150, 13, -6, 8, 9, 7]
+
+    def test_insert_get_and_delete(self, tree_under_test, int_keys):
+        for key in int_keys:
+            tree_under_test.insert_node(key, key * 10)
+
+        assert len(int_keys) == len(tree_under_test), "Fail at tree len control!"
+        assert sorted(int_keys) == tree_under_test.get_sorted_tree_keys(), "Fail to keep keys sorted!"
+        assert 150 == tree_under_test.get_value(15), "Fail to find inserted key!"
+
+        tree_under_test.set_value(15, "updated")
+        tree_under_test.delete_node(5)
+        assert "updated" == tree_under_test.get_value(15), "Fail to update node value!"
+        assert 5 not in tree_under_test.get_sorted_tree_keys(), "Fail to delete node!"
+
+    def test_exceptions(self, tree_under_test):
+        tree_under_test.insert_node(1)
+
+        with pytest.raises(IndexError, match="Key already exists!"):
+            tree_under_test.insert_node(1)
+        with pytest.raises(IndexError, match="Key must not be a Dict!"):
+            tree_under_test.insert_node({})
+        with pytest.raises(IndexError, match="Invalid key type!"):
+            tree_under_test.insert_node("a")
+        with pytest.raises(IndexError, match="Invalid key!"):
+            tree_under_test.get_value(2)
+        with pytest.raises(IndexError, match="Invalid key!"):
+            tree_under_test.delete_node(2)
+
+    def test_snapshot_isolation(self, tree_under_test, int_keys):
+        for key in int_keys:
+            tree_under_test.insert_node(key, key)
+
+        tree_snapshot = tree_under_test.snapshot()
+        tree_under_test.insert_node(1000, 1000)
+        tree_under_test.delete_node(1)
+        tree_under_test.set_value(15, "updated")
+
+        assert sorted(int_keys) == tree_snapshot.get_sorted_tree_keys(), "Snapshot must not see later changes!"
+        assert 15 == tree_snapshot.get_value(15), "Snapshot must keep old values!"
+        assert 1000 == tree_under_test.get_value(1000), "Tree must see its own changes!"
+
+    def test_iteration_ignores_later_changes(self, tree_under_test):
+        for key in range(10):
+            tree_under_test.insert_node(key)
+
+        keys_iterator = tree_under_test.iter_items()
+        tree_under_test.delete_node(0)
+        tree_under_test.insert_node(10)
+
+        assert list(range(10)) == [key for key, _ in keys_iterator], "Iteration must keep its starting version!"
+
+    def test_balanced_height(self, tree_under_test):
+        random.seed(19)
+        keys = list(range(2000))
+        for key in keys:
+            tree_under_test.insert_node(key)
+        for key in random.sample(keys, 1000):
+            tree_under_test.delete_node(key)
+
+        assert 1000 == len(tree_under_test), "Fail to keep sizes through deletions!"
+        assert tree_under_test.get_height() <= 1.45 * math.log2(1002), "Tree must stay balanced!"
+
+    def test_readers_during_writes(self, tree_under_test):
+        for key in range(0, 2000, 2):
+            tree_under_test.insert_node(key)
+
+        inconsistent_reads = []
+
+        def write():
+            for key in range(1, 2000, 2):
+                tree_under_test.insert_node(key)
+
+        def read():
+            for _ in range(20):
+                keys = tree_under_test.snapshot().get_sorted_tree_keys()
+                if keys != sorted(keys):
+                    inconsistent_reads.append(keys)
+
+        workers = [threading.Thread(target=write)] + [threading.Thread(target=read) for _ in range(3)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+        assert not inconsistent_reads, "Readers must always see a consistent version!"
+        assert list(range(2000)) == tree_under_test.get_sorted_tree_keys(), "Fail to keep all written keys!"
@@ -0,0 +1,63 @@
+import random
+
+import pytest
+from src.data_structures.priority_queue import PriorityQueue
+
+
+class TestPriorityQueue:
+
+    @pytest.fixture(params=[2, 4])
+    def priority_queue(self, request):
+        return PriorityQueue(arity=request.param)
+
+    def test_pop_in_priority_order(self, priority_queue):
+        random.seed(5)
+        priorities = random.sample(range(1000), 300)
+        for item, priority in enumerate(priorities):
+            priority_queue.push(item, priority)
+
+        assert 300 == len(priority_queue), "Fail at priority queue len control!"
+        popped_priorities = [priority_queue.pop()[1] for _ in range(300)]
+        assert sorted(priorities) == popped_priorities, "Fail to pop items in priority order!"
+        assert priority_queue.is_empty(), "Priority queue must be empty after popping all items!"
+
+    @pytest.mark.parametrize("arity", [2, 4])
+    def test_heapify_and_push_many(self, arity):
+        heap = PriorityQueue.heapify([("a", 5), ("b", 3), ("c", 9)], arity=arity)
+        heap.push_many([("d", 1), ("e", 7)])
+        heap.push_many([("f", 4)])
+
+        assert ("d", 1) == heap.peek(), "Fail to keep the smallest priority at the top!"
+        assert ["d", "b", "f", "a", "e", "c"] == [heap.pop()[0] for _ in range(6)], "Fail to pop items in priority order!"
+
+    def test_decrease_key(self, priority_queue):
+        priority_queue.push_many([("a", 10), ("b", 20), ("c", 30)])
+        priority_queue.decrease_key("c", 5)
+
+        assert 5 == priority_queue.get_priority("c"), "Fail to update item priority!"
+        assert ("c", 5) == priority_queue.pop(), "Fail to move item with decreased priority to the top!"
+        assert "c" not in priority_queue, "Popped item must leave the queue!"
+
+        with pytest.raises(ValueError, match="New priority must not be bigger than the current one!"):
+            priority_queue.decrease_key("a", 50)
+
+        with pytest.raises(KeyError, match="Item not in queue!"):
+            priority_queue.decrease_key("c", 1)
+
+    def test_raise_exceptions(self, priority_queue):
+        with pytest.raises(IndexError, match="Pop from empty priority queue!"):
+            priority_queue.pop()
+
+        with pytest.raises(IndexError, match="Peek from empty priority queue!"):
+            priority_queue.peek()
+
+        priority_queue.push("a", 1)
+        with pytest.raises(KeyError, match="Item already in queue!"):
+            priority_queue.push("a", 2)
+
+        with pytest.raises(KeyError, match="Item already in queue!"):
+            priority_queue.push_many([("b", 1), ("b", 2)])
+        assert 1 == len(priority_queue), "Rejected batch must not change the queue!"
+
+        with pytest.raises(ValueError, match="Invalid heap arity!"):
+            PriorityQueue(arity=1)
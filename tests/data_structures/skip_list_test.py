@@ -0,0 +1,69 @@
+import random
+
+import pytest
+from src.data_structures.skip_list import IndexableSkipList
+
+
+class TestIndexableSkipList:
+
+    @pytest.fixture()
+    def skip_list(self):
+        return IndexableSkipList()
+
+    def test_head_and_tail_operations(self, skip_list):
+        skip_list.add_at_tail(1)
+        skip_list.add_at_tail(2)
+        skip_list.add_at_head(0)
+
+        assert [0, 1, 2] == list(skip_list), "Fail to add items at head and tail!"
+        assert 2 == skip_list.delete_from_tail(), "Fail to remove item from tail!"
+        assert 0 == skip_list.delete_from_head(), "Fail to remove item from head!"
+        assert 1 == len(skip_list), "Fail at list len control!"
+
+    def test_positional_operations_match_list(self, skip_list):
+        random.seed(7)
+        reference_list = []
+        for value in range(2000):
+            index = random.randint(0, len(reference_list))
+            reference_list.insert(index, value)
+            if index == len(skip_list):
+                skip_list.add_at_tail(value)
+            else:
+                skip_list.add_at_index(index, value)
+
+        assert reference_list == list(skip_list), "Fail to insert items at random positions!"
+        for index in random.sample(range(len(reference_list)), 200):
+            assert reference_list[index] == skip_list.get_index(index), "Wrong value retrieved!"
+
+        for _ in range(1500):
+            index = random.randrange(len(reference_list))
+            assert reference_list.pop(index) == skip_list.delete_from_index(index), "Fail to remove item from index!"
+
+        assert reference_list == list(skip_list), "Fail to keep items order after removals!"
+        assert reference_list[::-1] == list(reversed(skip_list)), "Fail to iterate over the list in reverse order!"
+        assert len(reference_list) == len(skip_list), "Fail at list len control!"
+
+    def test_negative_index(self, skip_list):
+        for value in ["a", "b", "c"]:
+            skip_list.add_at_tail(value)
+
+        assert "c" == skip_list.get_index(-1), "Fail to get value with negative index!"
+        assert "a" == skip_list.get_index(-3), "Fail to get value with negative index!"
+        assert "b" in skip_list, "Fail to find value in the list!"
+
+    def test_raise_exceptions(self, skip_list):
+        with pytest.raises(IndexError):
+            skip_list.add_at_index(0, 1)
+
+        with pytest.raises(IndexError, match="Delete from empty list!"):
+            skip_list.delete_from_head()
+
+        with pytest.raises(IndexError, match="Delete from empty list!"):
+            skip_list.delete_from_tail()
+
+        skip_list.add_at_head(1)
+        with pytest.raises(IndexError, match="Index out of range!"):
+            skip_list.get_index(1)
+
+        with pytest.raises(IndexError, match="Index out of range!"):
+            skip_list.delete_from_index(5)
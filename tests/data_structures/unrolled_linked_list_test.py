@@ -0,0 +1,74 @@
+import random
+
+import pytest
+from src.data_structures.unrolled_linked_list import UnrolledLinkedList
+
+
+class TestUnrolledLinkedList:
+
+    @pytest.fixture()
+    def linked_list(self):
+        return UnrolledLinkedList(chunk_capacity=4)
+
+    def test_head_and_tail_operations(self, linked_list):
+        for value in range(10):
+            linked_list.add_at_tail(value)
+        linked_list.add_at_head(-1)
+
+        assert [-1] + list(range(10)) == list(linked_list), "Fail to add items at head and tail!"
+        assert 9 == linked_list.get_index(-1), "Fail to get value with negative index!"
+        assert 9 == linked_list.delete_from_tail(), "Fail to remove item from tail!"
+        assert -1 == linked_list.delete_from_head(), "Fail to remove item from head!"
+        assert 9 == len(linked_list), "Fail at list len control!"
+
+    def test_positional_operations_match_list(self, linked_list):
+        random.seed(3)
+        reference_list = []
+        for value in range(1000):
+            index = random.randint(0, len(reference_list))
+            reference_list.insert(index, value)
+            if index == len(linked_list):
+                linked_list.add_at_tail(value)
+            else:
+                linked_list.add_at_index(index, value)
+
+        assert reference_list == list(linked_list), "Fail to insert items at random positions!"
+        for index in random.sample(range(len(reference_list)), 100):
+            assert reference_list[index] == linked_list.get_index(index), "Wrong value retrieved!"
+
+        for _ in range(900):
+            index = random.randrange(len(reference_list))
+            assert reference_list.pop(index) == linked_list.delete_from_index(index), "Fail to remove item from index!"
+
+        assert reference_list == list(linked_list), "Fail to keep items order after removals!"
+        assert reference_list[::-1] == list(reversed(linked_list)), "Fail to iterate over the list in reverse order!"
+
+    def test_bulk_operations(self, linked_list):
+        linked_list.extend(range(10))
+        linked_list.extendleft([-1, -2])
+        linked_list.concat(UnrolledLinkedList.from_iterable([10, 11], chunk_capacity=4))
+        linked_list.splice(5, UnrolledLinkedList.from_iterable(["a", "b"], chunk_capacity=4))
+        assert [-2, -1, 0, 1, 2, "a", "b", 3, 4, 5, 6, 7, 8, 9, 10, 11] == list(linked_list), "Fail to bulk add items!"
+
+        removed_items = linked_list.delete_range(3, 12)
+        assert [1, 2, "a", "b", 3, 4, 5, 6, 7] == list(removed_items), "Fail to return removed range!"
+        assert [-2, -1, 0, 8, 9, 10, 11] == list(linked_list), "Fail to remove range from list!"
+        assert 7 == len(linked_list), "Fail at list len control!"
+        assert 11 in linked_list, "Fail to find value in the list!"
+
+        with pytest.raises(ValueError, match="Lists must share the same chunk capacity!"):
+            linked_list.concat(UnrolledLinkedList(chunk_capacity=8))
+
+    def test_raise_exceptions(self, linked_list):
+        with pytest.raises(IndexError):
+            linked_list.add_at_index(0, 1)
+
+        with pytest.raises(IndexError, match="Delete from empty list!"):
+            linked_list.delete_from_tail()
+
+        linked_list.add_at_head(1)
+        with pytest.raises(IndexError, match="Index out of range!"):
+            linked_list.get_index(1)
+
+        with pytest.raises(ValueError, match="Invalid chunk capacity!"):
+            UnrolledLinkedList(chunk_capacity=1)
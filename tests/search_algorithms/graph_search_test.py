@@ -1,5 +1,6 @@
 import pytest
-from src.data_structures.graphs import AdjListGraph, AdjMatrixGraph
+from src.data_structures.graphs import AdjListGraph, AdjMatrixGraph, WeightedAdjListGraph
+from src.data_structures.basic_data_structures import Queue, RingBufferQueue
 from src.search_algorithms.graphs_search import BFS, DFS, Dijkstra
 
 @pytest.fixture()
@@ -35,9 +36,13 @@ def sample_graph():
 
 class TestBFS:
 
-    @pytest.fixture()
-    def bfs_under_test(self, sample_graph):
-        return BFS(sample_graph)
+    @pytest.fixture(params=[Queue, RingBufferQueue])
+    def bfs_under_test(self, sample_graph, request):
+        return BFS(sample_graph, frontier_type=request.param)
+
+    @pytest.fixture(params=[Queue, RingBufferQueue])
+    def frozen_bfs_under_test(self, sample_graph, request):
+        return BFS(sample_graph.freeze(), frontier_type=request.param)
 
     def test_bfs_invalid_source_exception(self, bfs_under_test):
         with pytest.raises(KeyError, match='Source node not in Graph!'):
@@ -69,6 +74,46 @@ class TestBFS:
         assert 3 == distance, "Fail to process shortest path!"
         assert ["A", "C", "D", "E"] == path, "Fail to process shortest path!"
 
+    def test_bfs_follows_graph_changes(self, sample_graph, bfs_under_test):
+        bfs_under_test.run("A")
+        sample_graph.add_edge("A", "E")
+        sample_graph.delete_vertice("D")
+        bfs_nodes = bfs_under_test.run("A")
+
+        assert "D" not in bfs_nodes, "Fail to drop deleted vertice from the search!"
+        assert (1, ["A", "E"]) == bfs_under_test.get_shortest_path("A", "E"), "Fail to use the new graph edge!"
+
+    def test_bfs_reverse_graph(self, sample_graph):
+        reverse_bfs = BFS(sample_graph, reverse=True)
+        bfs_nodes = reverse_bfs.run("E")
+
+        assert all(bfs_nodes[key].visited for key in "ABCD"), "Fail to reach vertices leading to the source!"
+        assert (3, ["A", "C", "D", "E"]) == reverse_bfs.get_shortest_path("E", "A"), "Fail to process reverse path!"
+
+        bfs_nodes = reverse_bfs.run("A")
+        assert not bfs_nodes["E"].visited, "Fail to follow the edges backwards!"
+        with pytest.raises(ValueError, match="Reverse search requires an AdjListGraph!"):
+            BFS(sample_graph.freeze(), reverse=True)
+        with pytest.raises(ValueError, match="Reverse search requires an AdjListGraph!"):
+            BFS(AdjMatrixGraph(), reverse=True)
+
+    def test_bfs_frozen_graph(self, bfs_under_test, frozen_bfs_under_test):
+        with pytest.raises(KeyError, match='Source node not in Graph!'):
+            frozen_bfs_under_test.run("F")
+
+        for source in ["A", "B", "C", "D", "E"]:
+            bfs_nodes = bfs_under_test.run(source)
+            frozen_bfs_nodes = frozen_bfs_under_test.run(source)
+            assert bfs_nodes.keys() == frozen_bfs_nodes.keys(), "Fail to search frozen graph vertices!"
+            for key, node in bfs_nodes.items():
+                frozen_node = frozen_bfs_nodes[key]
+                assert ((node.visited, node.distance) ==
+                        (frozen_node.visited, frozen_node.distance)), "Fail to search frozen graph!"
+                assert ((node.predecessor and node.predecessor.key) ==
+                        (frozen_node.predecessor and frozen_node.predecessor.key)), "Fail to keep frozen graph predecessors!"
+                assert (bfs_under_test.get_shortest_path(source, key) ==
+                        frozen_bfs_under_test.get_shortest_path(source, key)), "Fail to search frozen graph!"
+
 
 class TestDFS:
 
@@ -91,29 +136,42 @@ class TestDFS:
         with pytest.raises(ChildProcessError, match="Must run DFS before requesting topological sort!"):
             dfs_under_test.get_topological_sort()
 
+    def test_dfs_frozen_graph(self, sample_graph, dfs_under_test):
+        frozen_dfs = DFS(sample_graph.freeze())
+        with pytest.raises(KeyError, match='Source node not in Graph!'):
+            frozen_dfs.run("F")
+
+        for source in ["A", "B", "C", "D", "E"]:
+            dfs_nodes = dfs_under_test.run(source)
+            frozen_dfs_nodes = frozen_dfs.run(source)
+            for key, node in dfs_nodes.items():
+                assert ((node.distance, node.finish) ==
+                        (frozen_dfs_nodes[key].distance, frozen_dfs_nodes[key].finish)), "Fail to search frozen graph!"
+            assert dfs_under_test.get_topological_sort() == frozen_dfs.get_topological_sort(), "Fail to sort frozen graph!"
+
 class TestDijkstra:
 
-    @pytest.fixture()
-    def weighted_graph_sample(self):
-        matrix_graph = AdjMatrixGraph()
+    @pytest.fixture(params=[AdjMatrixGraph, WeightedAdjListGraph])
+    def weighted_graph_sample(self, request):
+        weighted_graph = request.param()
 
         vertices = ["A", "B", "C", "D", "E"]
         for vertex in vertices:
-            matrix_graph.add_vertice(vertex)
+            weighted_graph.add_vertice(vertex)
 
         # Tasks dependencies
-        matrix_graph.add_edge("A", "B", 5)
-        matrix_graph.add_edge("A", "C", 10)
-        matrix_graph.add_edge("B", "C", 3)
-        matrix_graph.add_edge("B", "D", 9)
-        matrix_graph.add_edge("B", "E", 2)
-        matrix_graph.add_edge("C", "B", 2)
-        matrix_graph.add_edge("C", "D", 1)
-        matrix_graph.add_edge("D", "E", 4)
-        matrix_graph.add_edge("E", "A", 7)
-        matrix_graph.add_edge("E", "D", 6)
-
-        return matrix_graph
+        weighted_graph.add_edge("A", "B", 5)
+        weighted_graph.add_edge("A", "C", 10)
+        weighted_graph.add_edge("B", "C", 3)
+        weighted_graph.add_edge("B", "D", 9)
+        weighted_graph.add_edge("B", "E", 2)
+        weighted_graph.add_edge("C", "B", 2)
+        weighted_graph.add_edge("C", "D", 1)
+        weighted_graph.add_edge("D", "E", 4)
+        weighted_graph.add_edge("E", "A", 7)
+        weighted_graph.add_edge("E", "D", 6)
+
+        return weighted_graph
 
     @pytest.fixture()
     def dijkstra_under_test(self, weighted_graph_sample):
@@ -137,4 +195,51 @@ class TestDijkstra:
         assert 5 == djk_result["B"].distance, "Fail to process shortest path!"
         assert 8 == djk_result["C"].distance, "Fail to process shortest path!"
         assert 9 == djk_result["D"].distance, "Fail to process shortest path!"
-        assert 7 == djk_result["E"].distance, "Fail to process shortest path!"
\ No newline at end of file
+        assert 7 == djk_result["E"].distance, "Fail to process shortest path!"
+
+    def test_dijkstra_frozen_matrix_ignores_non_positive_entries(self):
+        matrix_graph = AdjMatrixGraph()
+        for vertex in ["A", "B", "C"]:
+            matrix_graph.add_vertice(vertex)
+        matrix_graph.add_edge("A", "B", 4)
+        matrix_graph.add_edge("A", "C", 1)
+        matrix_graph.add_edge("C", "B", -2)
+
+        frozen_graph = matrix_graph.freeze()
+        assert 2 == frozen_graph.get_edges_amount(), "Fail to use the matrix edge predicate on freeze!"
+
+        djk_result = Dijkstra(matrix_graph).run("A")
+        frozen_djk_result = Dijkstra(frozen_graph).run("A")
+        assert ([djk_result[key].distance for key in "ABC"] ==
+                [frozen_djk_result[key].distance for key in "ABC"]), "Fail to match frozen graph distances!"
+
+    def test_dijkstra_frozen_graph(self, weighted_graph_sample):
+        frozen_dijkstra = Dijkstra(weighted_graph_sample.freeze())
+        with pytest.raises(KeyError, match='Source node not in Graph!'):
+            frozen_dijkstra.run("F")
+
+        djk_result = frozen_dijkstra.run("A")
+        assert [0, 5, 8, 9, 7] == [djk_result[key].distance for key in "ABCDE"], "Fail to process shortest path!"
+        assert "C" == djk_result["D"].predecessor.key, "Fail to process shortest path!"
+
+    def test_dijkstra_unweighted_adj_list(self, sample_graph):
+        djk_result = Dijkstra(sample_graph).run("A")
+        bfs_result = BFS(sample_graph).run("A")
+
+        assert ({key: node.distance for key, node in bfs_result.items()} ==
+                {key: node.distance for key, node in djk_result.items()}), "Fail to use unit weights on Adjacency List!"
+
+    def test_dijkstra_invalid_graph_type_exception(self):
+        with pytest.raises(TypeError, match="Dijkstra requires an AdjMatrixGraph, AdjListGraph or CSRGraph!"):
+            Dijkstra({"A": {"B": 1}, "B": {}})
+
+    def test_dijkstra_zero_weight_edge(self):
+        weighted_graph = WeightedAdjListGraph()
+        for vertex in ["A", "B", "C"]:
+            weighted_graph.add_vertice(vertex)
+        weighted_graph.add_edge("A", "B", 0)
+        weighted_graph.add_edge("B", "C", 2)
+        weighted_graph.add_edge("A", "C", 3)
+
+        djk_result = Dijkstra(weighted_graph).run("A")
+        assert [0, 0, 2] == [djk_result[key].distance for key in "ABC"], "Fail to follow zero weight edge!"